@@ -0,0 +1,86 @@
+"""Streaming CSV / NDJSON export of applications."""
+import csv
+import io
+import json
+from typing import Any, AsyncIterator, Dict, Optional
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.applications.models import Application
+
+EXPORT_FORMATS = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson"
+}
+
+# Rows fetched from the server-side cursor and written per chunk
+EXPORT_BATCH_SIZE = 500
+
+EXPORT_FIELDS = [
+    "id",
+    "company",
+    "role",
+    "date_applied",
+    "status",
+    "notes",
+    "resume_id",
+    "resume_name",
+    "follow_up_date",
+    "created_at",
+    "last_updated"
+]
+
+
+def _export_row(application: Application, resume_name: Optional[str]) -> Dict[str, Any]:
+    """Flatten a joined (application, resume_name) row to JSON/CSV-safe values."""
+    def text(value):
+        return value.isoformat() if hasattr(value, "isoformat") else value
+
+    return {
+        "id": str(application.id),
+        "company": application.company,
+        "role": application.role,
+        "date_applied": text(application.date_applied),
+        "status": application.status.value if application.status else None,
+        "notes": application.notes,
+        "resume_id": str(application.resume_id) if application.resume_id else None,
+        "resume_name": resume_name,
+        "follow_up_date": text(application.follow_up_date),
+        "created_at": text(application.created_at),
+        "last_updated": text(application.last_updated)
+    }
+
+
+async def stream_export(session: AsyncSession, statement, export_format: str) -> AsyncIterator[str]:
+    """
+    Stream the rows of a (Application, resume_name) query as CSV or NDJSON.
+    
+    Rows come from a server-side cursor EXPORT_BATCH_SIZE at a time and each
+    batch is written out as one chunk, so memory stays flat however many
+    rows the user has.
+    """
+    result = await session.stream(
+        statement.execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_FIELDS)
+    if export_format == "csv":
+        writer.writeheader()
+
+    async for partition in result.partitions():
+        for application, resume_name in partition:
+            row = _export_row(application, resume_name)
+            if export_format == "csv":
+                writer.writerow(row)
+            else:
+                buffer.write(json.dumps(row))
+                buffer.write("\n")
+
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+    # CSV header for an empty export
+    if buffer.tell():
+        yield buffer.getvalue()
@@ -0,0 +1,193 @@
+"""Parsing and batched insertion for bulk application imports (CSV / NDJSON)."""
+import csv
+import io
+import json
+import re
+from datetime import datetime
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError
+from sqlmodel import insert, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.applications.models import (
+    Application,
+    ApplicationCreate,
+    ApplicationImportError,
+    ApplicationImportResult
+)
+from app.resumes.models import Resume
+
+IMPORT_FORMATS = ("csv", "ndjson")
+
+# Rows per multi-row INSERT statement
+IMPORT_BATCH_SIZE = 1000
+
+# Undecodable bytes, as decoded by the surrogateescape error handler
+_UNDECODABLE = re.compile("[\udc80-\udcff]")
+
+# Row = (row number, parsed fields or None, parse error or None)
+ParsedRow = Tuple[int, Optional[Dict[str, Any]], Optional[str]]
+
+
+def detect_format(filename: Optional[str], content_type: Optional[str]) -> Optional[str]:
+    """Infer the import format from the file extension or content type."""
+    extension = (filename or "").rsplit(".", 1)[-1].lower()
+    if extension == "csv" or content_type == "text/csv":
+        return "csv"
+    if extension in ("ndjson", "jsonl") or content_type in ("application/x-ndjson", "application/jsonl"):
+        return "ndjson"
+    return None
+
+
+def _is_undecodable(text: str) -> bool:
+    """Whether text holds bytes that were not valid UTF-8 (see iter_rows)."""
+    return _UNDECODABLE.search(text) is not None
+
+
+def _iter_csv(text: io.TextIOBase) -> Iterator[ParsedRow]:
+    """
+    Yield rows from a CSV file with a header line (row numbers exclude the header).
+    
+    Malformed records (e.g. a field over csv.field_size_limit) are reported
+    as row errors and parsing resumes with the next record.
+    
+    Raises:
+        HTTPException: If the header line itself is malformed
+    """
+    reader = csv.reader(text)
+    try:
+        header = next(reader, None)
+    except csv.Error as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid CSV header: {e}"
+        )
+    if header is None:
+        return
+    header = [name.strip() for name in header]
+    
+    row_number = 0
+    while True:
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as e:
+            row_number += 1
+            yield row_number, None, f"Invalid CSV: {e}"
+            continue
+        if not row:
+            continue
+        row_number += 1
+        if _is_undecodable("".join(row)):
+            yield row_number, None, "Not valid UTF-8 text"
+            continue
+        # Blank cells are left out so field defaults apply (e.g. status)
+        yield row_number, {k: v.strip() for k, v in zip(header, row) if k and v.strip()}, None
+
+
+def _iter_ndjson(text: io.TextIOBase) -> Iterator[ParsedRow]:
+    """Yield rows from newline-delimited JSON, one object per line."""
+    for row_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        if _is_undecodable(line):
+            yield row_number, None, "Not valid UTF-8 text"
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(data, dict):
+            yield row_number, None, "Expected a JSON object"
+            continue
+        yield row_number, data, None
+
+
+def iter_rows(file: BinaryIO, import_format: str) -> Iterator[ParsedRow]:
+    """
+    Lazily parse an uploaded import file.
+
+    The upload is read from its spooled temp file line by line, so memory
+    stays bounded by the batch size rather than the file size. Bytes that
+    are not valid UTF-8 are decoded as surrogate escapes rather than
+    aborting the file, and their rows are reported as errors.
+    """
+    text = io.TextIOWrapper(file, encoding="utf-8-sig", errors="surrogateescape", newline="")
+    if import_format == "csv":
+        return _iter_csv(text)
+    return _iter_ndjson(text)
+
+
+def _validate_row(data: Dict[str, Any], resume_ids: Set[UUID]) -> Tuple[Optional[ApplicationCreate], Optional[str]]:
+    """Validate one row against ApplicationCreate and the user's resume ids."""
+    if isinstance(data.get("status"), str):
+        data["status"] = data["status"].lower()
+    try:
+        application = ApplicationCreate(**data)
+    except ValidationError as e:
+        error = e.errors()[0]
+        field = ".".join(str(part) for part in error["loc"])
+        return None, f"{field}: {error['msg']}"
+
+    if application.resume_id and application.resume_id not in resume_ids:
+        return None, "Resume not found or doesn't belong to user"
+
+    return application, None
+
+
+async def import_applications(
+    session: AsyncSession,
+    file: BinaryIO,
+    import_format: str,
+    user_id: UUID
+) -> ApplicationImportResult:
+    """
+    Validate and insert every row of an import file in one transaction.
+
+    - Referenced resume ids are checked against a single query of the user's resumes
+    - Valid rows are written with multi-row INSERTs of IMPORT_BATCH_SIZE rows
+    - Invalid rows are skipped and reported with their row number
+
+    The caller commits.
+    """
+    statement = select(Resume.id).where(Resume.user_id == user_id)
+    resume_ids = set((await session.exec(statement)).all())
+
+    rows = iter_rows(file, import_format)
+    inserted = 0
+    errors: List[ApplicationImportError] = []
+
+    while True:
+        # Parsing reads the spooled file, so keep it off the event loop
+        batch = await run_in_threadpool(lambda: list(islice(rows, IMPORT_BATCH_SIZE)))
+        if not batch:
+            break
+
+        now = datetime.utcnow()
+        values = []
+        for row_number, data, parse_error in batch:
+            application, error = (None, parse_error) if parse_error else _validate_row(data, resume_ids)
+            if error:
+                errors.append(ApplicationImportError(row=row_number, error=error))
+                continue
+            values.append({
+                **application.model_dump(),
+                "id": uuid4(),
+                "user_id": user_id,
+                "last_updated": now,
+                "created_at": now
+            })
+
+        if values:
+            # One INSERT ... VALUES (...), (...) statement per batch
+            await session.exec(insert(Application.__table__).values(values))
+            inserted += len(values)
+
+    return ApplicationImportResult(inserted=inserted, errors=errors)
@@ -1,9 +1,12 @@
-from sqlmodel import SQLModel, Field
+from sqlmodel import SQLModel, Field, Column
+import sqlalchemy as sa
 from datetime import datetime, date
-from typing import Optional
+from typing import Optional, List
 from uuid import UUID, uuid4
 from enum import Enum
 
+from app.rounds.models import InterviewRoundResponse
+
 
 class StatusEnum(str, Enum):
     """Application status enum."""
@@ -31,10 +34,41 @@ class Application(ApplicationBase, table=True):
     
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     user_id: UUID = Field(..., foreign_key="auth.users.id", index=True)
+    # The column is TEXT with a CHECK constraint (no PostgreSQL enum type), so
+    # values are bound as plain strings rather than cast to ::statusenum
+    status: StatusEnum = Field(
+        default=StatusEnum.applied,
+        sa_column=Column(sa.Enum(StatusEnum, native_enum=False, create_constraint=False), nullable=False)
+    )
     last_updated: datetime = Field(default_factory=datetime.utcnow)
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class EventTypeEnum(str, Enum):
+    """Kind of change recorded in the application event log."""
+    created = "created"
+    status = "status"
+    resume = "resume"
+    follow_up = "follow_up"
+
+
+class ApplicationEvent(SQLModel, table=True):
+    """
+    Append-only log entry for an application change.
+    
+    Written only by the triggers on applications (database_setup.sql, Step 16).
+    """
+    __tablename__ = "application_events"
+    
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    user_id: UUID = Field(..., foreign_key="auth.users.id", index=True)
+    application_id: UUID = Field(..., index=True)
+    event_type: EventTypeEnum
+    old_value: Optional[str] = Field(default=None, description="Value before the change")
+    new_value: Optional[str] = Field(default=None, description="Value after the change")
+    occurred_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class ApplicationCreate(ApplicationBase):
     """Schema for creating a new application."""
     pass
@@ -65,6 +99,97 @@ class ApplicationResponse(ApplicationBase):
 class ApplicationWithResume(ApplicationResponse):
     """Extended response that includes resume name."""
     resume_name: Optional[str] = None
+    rounds: Optional[List[InterviewRoundResponse]] = Field(
+        default=None, description="Interview rounds (only with include=rounds)"
+    )
     
     class Config:
         from_attributes = True
+
+
+class ApplicationSearchResult(ApplicationWithResume):
+    """Search hit with its relevance score (higher is better)."""
+    score: float
+
+
+class ApplicationListItem(SQLModel):
+    """
+    One application in GET /applications.
+    
+    Only the fields requested with `fields=` are present (all but rounds
+    by default); `id` always is. rounds only comes with include=rounds.
+    """
+    id: UUID
+    user_id: Optional[UUID] = None
+    company: Optional[str] = None
+    role: Optional[str] = None
+    date_applied: Optional[date] = None
+    status: Optional[StatusEnum] = None
+    notes: Optional[str] = None
+    resume_id: Optional[UUID] = None
+    follow_up_date: Optional[date] = None
+    last_updated: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    resume_name: Optional[str] = None
+    rounds: Optional[List[InterviewRoundResponse]] = None
+
+
+class ApplicationPage(SQLModel):
+    """One page of applications with the cursor for the next page."""
+    items: List[ApplicationListItem]
+    next_cursor: Optional[str] = None
+
+
+class ApplicationImportError(SQLModel):
+    """A row rejected by a bulk import."""
+    row: int = Field(..., description="1-based row number in the import file (excluding CSV header)")
+    error: str
+
+
+class ApplicationImportResult(SQLModel):
+    """Outcome of a bulk import."""
+    inserted: int
+    errors: List[ApplicationImportError] = []
+
+
+class ApplicationEventResponse(SQLModel):
+    """Schema for application event API responses."""
+    id: UUID
+    application_id: UUID
+    event_type: EventTypeEnum
+    old_value: Optional[str] = None
+    new_value: Optional[str] = None
+    occurred_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class ApplicationEventPage(SQLModel):
+    """One page of application events (newest first) with the cursor for the next page."""
+    items: List[ApplicationEventResponse]
+    next_cursor: Optional[str] = None
+
+
+class BatchOperationEnum(str, Enum):
+    """Operation applied by a batch request."""
+    set_status = "set_status"
+    reschedule_follow_up = "reschedule_follow_up"
+    relink_resume = "relink_resume"
+    delete = "delete"
+
+
+class ApplicationBatchRequest(SQLModel):
+    """One operation applied to many applications."""
+    ids: List[UUID] = Field(..., description="Application IDs (up to 500)")
+    operation: BatchOperationEnum
+    status: Optional[StatusEnum] = Field(default=None, description="New status (set_status)")
+    follow_up_date: Optional[date] = Field(default=None, description="New follow-up date, or null to clear (reschedule_follow_up)")
+    resume_id: Optional[UUID] = Field(default=None, description="Resume to link, or null to unlink (relink_resume)")
+
+
+class ApplicationBatchResult(SQLModel):
+    """Outcome of a batch request."""
+    operation: BatchOperationEnum
+    affected: List[UUID] = Field(..., description="IDs that were updated or deleted")
+    not_found: List[UUID] = Field(..., description="IDs that don't exist or don't belong to user")
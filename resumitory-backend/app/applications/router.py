@@ -1,29 +1,214 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlmodel import Session, select, or_, and_, col
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import StreamingResponse
+from sqlmodel import select, col, func
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Optional, List
 from uuid import UUID
 from datetime import date, datetime
 
 from app.database import get_session
-from app.auth.dependencies import get_current_user
+from app.cache import response_cache
+from app.events.broker import event_broker
+from app.etag import collection_version, etag_matches, make_etag, not_modified, set_etag
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate, split_page
+from app.auth.dependencies import CurrentUser, get_current_user
+from app.repository import delete_owned, delete_owned_many, get_owned, update_owned, update_owned_many
 from app.applications.models import (
     Application,
     ApplicationCreate,
     ApplicationUpdate,
     ApplicationResponse,
     ApplicationWithResume,
+    ApplicationPage,
+    ApplicationImportResult,
+    ApplicationSearchResult,
+    ApplicationEvent,
+    ApplicationEventPage,
+    ApplicationBatchRequest,
+    ApplicationBatchResult,
+    BatchOperationEnum,
     StatusEnum
 )
+from app.applications.importer import IMPORT_FORMATS, detect_format, import_applications
+from app.applications.exporter import EXPORT_FORMATS, stream_export
+from app.applications.search import search_condition, search_application_ids
 from app.resumes.models import Resume
+from app.rounds.loader import load_rounds
+from app.rounds.models import InterviewRoundResponse
+from app.serialization import JSONBodyResponse, dump_json, object_dicts, parse_fields, row_dicts, table_columns
+from app.sync.models import EntityEnum
+from app.sync.tombstones import record_deletions
 
 router = APIRouter()
 
 
+def _select_with_resume_name():
+    """
+    Build a SELECT of applications with the linked resume name outer-joined.
+    
+    Fetching the name in the same statement avoids one resume lookup per row.
+    """
+    return select(Application, Resume.name).outerjoin(
+        Resume, Application.resume_id == Resume.id
+    )
+
+
+def _with_resume_name(application: Application, resume_name: Optional[str]) -> ApplicationWithResume:
+    """Build an ApplicationWithResume from a joined (application, resume_name) row."""
+    return ApplicationWithResume(**application.model_dump(), resume_name=resume_name)
+
+
+async def _event_page(
+    session: AsyncSession,
+    statement,
+    cursor: Optional[str],
+    limit: int
+) -> ApplicationEventPage:
+    """Run an application_events query as one keyset page, newest first."""
+    statement = paginate(
+        statement,
+        ApplicationEvent.occurred_at,
+        ApplicationEvent.id,
+        cursor,
+        limit,
+        datetime.fromisoformat
+    )
+    rows = (await session.exec(statement)).all()
+    rows, next_cursor = split_page(rows, limit, lambda event: (event.occurred_at, event.id))
+    return ApplicationEventPage(items=rows, next_cursor=next_cursor)
+
+
+# Largest number of ids accepted by POST /applications/batch
+MAX_BATCH_SIZE = 500
+
+
+# Related data that list endpoints can embed with ?include=
+INCLUDE_OPTIONS = ("rounds",)
+
+# Fields GET /applications can return with ?fields= (rounds come with include=rounds)
+LIST_FIELDS = [name for name in ApplicationWithResume.model_fields if name != "rounds"]
+
+
+def _parse_include(include: Optional[str]) -> set:
+    """Parse a comma-separated include parameter, rejecting unknown options."""
+    options = {option.strip() for option in (include or "").split(",") if option.strip()}
+    unknown = options.difference(INCLUDE_OPTIONS)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown include: {', '.join(sorted(unknown))}. Use: {', '.join(INCLUDE_OPTIONS)}"
+        )
+    return options
+
+
+def _apply_filters(
+    session: AsyncSession,
+    statement,
+    status_filter: Optional[str],
+    search: Optional[str],
+    resume_id: Optional[str]
+):
+    """
+    Apply the list endpoint's status, search and resume filters to a query.
+    
+    Raises:
+        HTTPException: If status_filter is not a valid status
+    """
+    # Apply status filter
+    if status_filter:
+        try:
+            status_enum = StatusEnum(status_filter.lower())
+            statement = statement.where(Application.status == status_enum)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid status: {status_filter}. Must be one of: {', '.join([s.value for s in StatusEnum])}"
+            )
+    
+    # Apply search filter (company, role or notes; index-backed on PostgreSQL)
+    if search:
+        statement = statement.where(search_condition(session, search))
+    
+    # Apply resume filter
+    if resume_id:
+        statement = statement.where(Application.resume_id == UUID(resume_id))
+    
+    return statement
+
+
+async def _list_page_body(
+    session: AsyncSession,
+    user_id: UUID,
+    status_filter: Optional[str],
+    search: Optional[str],
+    resume_id: Optional[str],
+    cursor: Optional[str],
+    limit: int,
+    include_rounds: bool,
+    fields: List[str]
+) -> str:
+    """
+    Query one page of the application list and encode it as JSON.
+    
+    Only the requested fields are selected, as plain columns (no ORM
+    objects), and encoded once with orjson; they come from the database, so
+    they are not validated against ApplicationWithResume again. The resume
+    join is skipped when resume_name is not requested.
+    """
+    columns = table_columns(Application, fields)
+    # The keyset cursor needs the sort key even when the client did not ask for it
+    if "date_applied" not in fields:
+        columns.append(Application.date_applied)
+    
+    statement = select(*columns)
+    if "resume_name" in fields:
+        statement = statement.add_columns(Resume.name.label("resume_name")).outerjoin(
+            Resume, Application.resume_id == Resume.id
+        )
+    statement = statement.where(
+        Application.user_id == user_id
+    )
+    
+    statement = _apply_filters(session, statement, status_filter, search, resume_id)
+    
+    # Order by date and resume after the cursor (served by idx_applications_date)
+    statement = paginate(
+        statement,
+        Application.date_applied,
+        Application.id,
+        cursor,
+        limit,
+        date.fromisoformat
+    )
+    
+    # Execute query (resume name joined in, one round trip)
+    rows = (await session.exec(statement)).all()
+    rows, next_cursor = split_page(
+        rows, limit, lambda row: (row.date_applied, row.id)
+    )
+    items = row_dicts(rows)
+    if "date_applied" not in fields:
+        for item in items:
+            del item["date_applied"]
+    
+    # Rounds for the whole page in one WHERE application_id IN (...) query
+    if include_rounds:
+        rounds = await load_rounds(session, [item["id"] for item in items])
+        for item in items:
+            item["rounds"] = object_dicts(rounds[item["id"]], InterviewRoundResponse)
+    elif len(fields) == len(LIST_FIELDS):
+        # Full representation: rounds is present (null) as in ApplicationWithResume
+        for item in items:
+            item["rounds"] = None
+    
+    return dump_json({"items": items, "next_cursor": next_cursor})
+
+
 @router.post("/", response_model=ApplicationResponse, status_code=status.HTTP_201_CREATED)
 async def create_application(
     application: ApplicationCreate,
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
     Create a new job application.
@@ -38,8 +223,8 @@ async def create_application(
     """
     # Validate resume_id if provided
     if application.resume_id:
-        resume = session.get(Resume, application.resume_id)
-        if not resume or str(resume.user_id) != user_id:
+        resume = await get_owned(session, Resume, application.resume_id, user.id)
+        if not resume:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Resume not found or doesn't belong to user"
@@ -47,13 +232,14 @@ async def create_application(
     
     # Create application
     db_application = Application(
-        **application.dict(),
-        user_id=UUID(user_id)
+        **application.model_dump(),
+        user_id=user.id
     )
     
     session.add(db_application)
-    session.commit()
-    session.refresh(db_application)
+    await session.commit()
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "application", "created", [db_application.id])
     
     return db_application
 
@@ -63,8 +249,8 @@ async def quick_add_application(
     company: str,
     role: str,
     resume_id: Optional[str] = None,
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
     Quick add application with minimal fields (for bulk apply sessions).
@@ -80,17 +266,17 @@ async def quick_add_application(
     # Validate resume_id if provided
     resume_uuid = None
     if resume_id:
-        resume = session.get(Resume, UUID(resume_id))
-        if not resume or str(resume.user_id) != user_id:
+        resume_uuid = UUID(resume_id)
+        resume = await get_owned(session, Resume, resume_uuid, user.id)
+        if not resume:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Resume not found"
             )
-        resume_uuid = UUID(resume_id)
     
     # Create application with defaults
     application = Application(
-        user_id=UUID(user_id),
+        user_id=user.id,
         company=company,
         role=role,
         date_applied=date.today(),
@@ -99,127 +285,367 @@ async def quick_add_application(
     )
     
     session.add(application)
-    session.commit()
-    session.refresh(application)
+    await session.commit()
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "application", "created", [application.id])
     
     return application
 
 
-@router.get("/", response_model=List[ApplicationWithResume])
+@router.post("/bulk", response_model=ApplicationImportResult, status_code=status.HTTP_201_CREATED)
+async def bulk_import_applications(
+    file: UploadFile = File(..., description="CSV (with header) or NDJSON file"),
+    format: Optional[str] = Query(None, description="csv or ndjson (default: from file extension)"),
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Import many applications at once (e.g. migrating from a spreadsheet).
+    
+    Each row takes the same fields as POST /applications:
+    company, role, date_applied, status, notes, resume_id, follow_up_date.
+    
+    Valid rows are inserted in a single transaction; invalid rows are
+    skipped and reported with their row number.
+    """
+    import_format = (format or detect_format(file.filename, file.content_type) or "").lower()
+    if import_format not in IMPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown import format. Must be one of: {', '.join(IMPORT_FORMATS)}"
+        )
+    
+    result = await import_applications(session, file.file, import_format, user.id)
+    await session.commit()
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "application", "created")
+    
+    return result
+
+
+@router.post("/batch", response_model=ApplicationBatchResult)
+async def batch_update_applications(
+    batch: ApplicationBatchRequest,
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Apply one operation to many applications in a single statement.
+    
+    - **ids**: Applications to change (up to 500)
+    - **operation**: One of
+      - `set_status` (with **status**)
+      - `reschedule_follow_up` (with **follow_up_date**, null clears it)
+      - `relink_resume` (with **resume_id**, null unlinks)
+      - `delete`
+    
+    Runs as one ownership-scoped UPDATE/DELETE ... RETURNING in one
+    transaction. IDs that don't exist or don't belong to user are skipped
+    and listed in `not_found`.
+    """
+    ids = list(dict.fromkeys(batch.ids))
+    if not ids or len(ids) > MAX_BATCH_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Provide between 1 and {MAX_BATCH_SIZE} ids"
+        )
+    
+    provided = batch.model_dump(exclude_unset=True)
+    operation = batch.operation
+    
+    if operation == BatchOperationEnum.delete:
+        affected = await delete_owned_many(session, Application, ids, user.id)
+        record_deletions(session, user.id, EntityEnum.application, affected)
+    else:
+        if operation == BatchOperationEnum.set_status:
+            if batch.status is None:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="status is required for set_status"
+                )
+            values = {"status": batch.status}
+        elif operation == BatchOperationEnum.reschedule_follow_up:
+            if "follow_up_date" not in provided:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="follow_up_date is required for reschedule_follow_up"
+                )
+            values = {"follow_up_date": batch.follow_up_date}
+        else:
+            if "resume_id" not in provided:
+                raise HTTPException(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    detail="resume_id is required for relink_resume"
+                )
+            if batch.resume_id and not await get_owned(session, Resume, batch.resume_id, user.id):
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="Resume not found"
+                )
+            values = {"resume_id": batch.resume_id}
+        
+        values["last_updated"] = datetime.utcnow()
+        updated = await update_owned_many(session, Application, ids, user.id, values)
+        affected = [application.id for application in updated]
+    
+    await session.commit()
+    if affected:
+        await response_cache.invalidate(user.id)
+        action = "deleted" if operation == BatchOperationEnum.delete else "updated"
+        await event_broker.publish(user.id, "application", action, affected)
+    
+    found = set(affected)
+    return ApplicationBatchResult(
+        operation=operation,
+        affected=affected,
+        not_found=[app_id for app_id in ids if app_id not in found]
+    )
+
+
+# The page is encoded by dump_json and returned as is (no response_model
+# validation); ApplicationPage documents its sparse shape
+@router.get("/", response_model=None, response_class=JSONBodyResponse, responses={200: {"model": ApplicationPage}})
 async def list_applications(
+    request: Request,
     status_filter: Optional[str] = Query(None, description="Filter by status"),
-    search: Optional[str] = Query(None, description="Search company or role"),
+    search: Optional[str] = Query(None, description="Search company, role or notes"),
     resume_id: Optional[str] = Query(None, description="Filter by resume ID"),
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    include: Optional[str] = Query(None, description="Related data to embed: rounds"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (id is always included)"),
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
     List all applications for the authenticated user.
     
     Supports:
     - **status**: Filter by status (applied, interview, offer, rejected, archived)
-    - **search**: Search in company name or role
+    - **search**: Search in company name, role or notes (typo tolerant)
     - **resume_id**: Filter by resume used
+    - **cursor** / **limit**: Keyset pagination; pass `next_cursor` back to get the next page
+    - **include=rounds**: Embed each application's interview rounds (one extra query per page)
+    - **fields**: Sparse fieldset, e.g. `id,company,role,status,date_applied,resume_name`;
+      only these columns are read from the database
     
     Returns applications ordered by date_applied (newest first).
     Includes resume name if application is linked to a resume.
+    Supports If-None-Match: answers 304 when nothing has changed.
     """
-    # Base query
-    statement = select(Application).where(
-        Application.user_id == UUID(user_id)
-    )
+    include_rounds = "rounds" in _parse_include(include)
+    selected = parse_fields(fields, LIST_FIELDS)
+    fields_key = ",".join(selected)
+    
+    # Round writes bump the application's last_updated, so the version covers them
+    version = await collection_version(session, user.id, include_applications=True)
+    etag = make_etag(version, status_filter, search, resume_id, cursor, limit, include_rounds, fields_key)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    # The encoded page is cached, so a hit is returned without decoding
+    cache_key = f"applications:page:{status_filter}|{search}|{resume_id}|{cursor}|{limit}|{include_rounds}|{fields_key}"
+    body, generation = await response_cache.get(user.id, cache_key)
+    if body is None:
+        body = await _list_page_body(
+            session, user.id, status_filter, search, resume_id, cursor, limit, include_rounds, selected
+        )
+        await response_cache.set(user.id, cache_key, body, generation)
     
-    # Apply status filter
-    if status_filter:
-        try:
-            status_enum = StatusEnum(status_filter.lower())
-            statement = statement.where(Application.status == status_enum)
-        except ValueError:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid status: {status_filter}. Must be one of: {', '.join([s.value for s in StatusEnum])}"
-            )
+    response = JSONBodyResponse(body)
+    set_etag(response, etag)
+    return response
+
+
+@router.get("/stats/summary")
+async def get_application_stats(
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Get application statistics for the user.
     
-    # Apply search filter
-    if search:
-        search_pattern = f"%{search}%"
-        statement = statement.where(
-            or_(
-                col(Application.company).ilike(search_pattern),
-                col(Application.role).ilike(search_pattern)
-            )
+    Returns:
+    - Total applications
+    - Count by status
+    - Upcoming follow-ups
+    
+    Counts are aggregated in SQL and only the next 5 follow-ups are fetched,
+    so cost does not grow with the number of applications loaded into memory.
+    """
+    # Upcoming follow-ups depend on today's date
+    cache_key = f"applications:stats:{date.today().isoformat()}"
+    cached, generation = await response_cache.get(user.id, cache_key)
+    if cached is not None:
+        return cached
+    
+    # Count by status (served by idx_applications_status)
+    statement = select(Application.status, func.count()).where(
+        Application.user_id == user.id
+    ).group_by(Application.status)
+    
+    by_status = {s.value: 0 for s in StatusEnum}
+    for status_value, count in (await session.exec(statement)).all():
+        by_status[StatusEnum(status_value).value] = count
+    
+    # Next 5 upcoming follow-ups (matches the idx_applications_follow_up predicate)
+    statement = select(
+        Application.id,
+        Application.company,
+        Application.role,
+        Application.follow_up_date
+    ).where(
+        Application.user_id == user.id,
+        col(Application.follow_up_date).isnot(None),
+        col(Application.status).notin_([StatusEnum.rejected, StatusEnum.archived]),
+        Application.follow_up_date >= date.today()
+    ).order_by(Application.follow_up_date).limit(5)
+    
+    upcoming_followups = [
+        {
+            "id": str(app_id),
+            "company": company,
+            "role": role,
+            "follow_up_date": follow_up_date.isoformat()
+        }
+        for app_id, company, role, follow_up_date in (await session.exec(statement)).all()
+    ]
+    
+    stats = {
+        "total_applications": sum(by_status.values()),
+        "by_status": by_status,
+        "upcoming_followups": upcoming_followups
+    }
+    await response_cache.set(user.id, cache_key, stats, generation)
+    
+    return stats
+
+
+@router.get("/export")
+async def export_applications(
+    format: str = Query("csv", description="csv or ndjson"),
+    status_filter: Optional[str] = Query(None, description="Filter by status"),
+    search: Optional[str] = Query(None, description="Search company, role or notes"),
+    resume_id: Optional[str] = Query(None, description="Filter by resume ID"),
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Download all matching applications as CSV or NDJSON.
+    
+    Takes the same filters as GET /applications. Rows (with resume name)
+    are streamed in batches rather than built up in memory.
+    """
+    export_format = format.lower()
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown export format. Must be one of: {', '.join(EXPORT_FORMATS)}"
         )
     
-    # Apply resume filter
-    if resume_id:
-        statement = statement.where(Application.resume_id == UUID(resume_id))
+    statement = _select_with_resume_name().where(
+        Application.user_id == user.id
+    )
+    statement = _apply_filters(session, statement, status_filter, search, resume_id)
+    statement = statement.order_by(Application.date_applied.desc(), Application.id.desc())
     
-    # Order by date
-    statement = statement.order_by(Application.date_applied.desc())
+    return StreamingResponse(
+        stream_export(session, statement, export_format),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="applications.{export_format}"'}
+    )
+
+
+@router.get("/search", response_model=List[ApplicationSearchResult])
+async def search_applications(
+    q: str = Query(..., min_length=1, description="Search text"),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE, description="Maximum results"),
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Search applications by company, role and notes, best matches first.
     
-    # Execute query
-    applications = session.exec(statement).all()
+    Matches whole words (with stemming) and tolerates typos; each result
+    carries a relevance score.
+    """
+    matches = await search_application_ids(session, user.id, q, limit)
+    if not matches:
+        return []
     
-    # Enrich with resume names
-    result = []
-    for app in applications:
-        app_dict = app.dict()
-        
-        # Get resume name if linked
-        if app.resume_id:
-            resume = session.get(Resume, app.resume_id)
-            app_dict['resume_name'] = resume.name if resume else None
-        else:
-            app_dict['resume_name'] = None
-        
-        result.append(ApplicationWithResume(**app_dict))
+    statement = _select_with_resume_name().where(
+        col(Application.id).in_([app_id for app_id, _ in matches])
+    )
+    rows = {app.id: (app, resume_name) for app, resume_name in (await session.exec(statement)).all()}
     
-    return result
+    return [
+        ApplicationSearchResult(**rows[app_id][0].model_dump(), resume_name=rows[app_id][1], score=score)
+        for app_id, score in matches
+        if app_id in rows
+    ]
+
+
+@router.get("/activity", response_model=ApplicationEventPage)
+async def get_activity_feed(
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Activity feed: changes across all of the user's applications, newest first.
+    
+    Events record creation and every status, resume or follow-up date change
+    (old and new value). Paginated with `cursor` / `limit`.
+    """
+    # Served by idx_application_events_user
+    statement = select(ApplicationEvent).where(ApplicationEvent.user_id == user.id)
+    return await _event_page(session, statement, cursor, limit)
 
 
 @router.get("/{application_id}", response_model=ApplicationWithResume)
 async def get_application(
     application_id: str,
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
     Get a specific application by ID.
     
     Returns 404 if application doesn't exist or doesn't belong to user.
     Includes resume name if application is linked.
+    Supports If-None-Match: answers 304 when the application hasn't changed.
     """
-    application = session.get(Application, UUID(application_id))
+    statement = _select_with_resume_name().where(
+        Application.id == UUID(application_id),
+        Application.user_id == user.id
+    )
+    row = (await session.exec(statement)).first()
     
-    if not application:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Application not found"
         )
     
-    if str(application.user_id) != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this application"
-        )
+    application, resume_name = row
     
-    # Enrich with resume name
-    app_dict = application.dict()
-    if application.resume_id:
-        resume = session.get(Resume, application.resume_id)
-        app_dict['resume_name'] = resume.name if resume else None
-    else:
-        app_dict['resume_name'] = None
+    etag = make_etag(str(application.id), application.last_updated.isoformat(), resume_name)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
     
-    return ApplicationWithResume(**app_dict)
+    return _with_resume_name(application, resume_name)
 
 
 @router.patch("/{application_id}", response_model=ApplicationResponse)
 async def update_application(
     application_id: str,
     application_update: ApplicationUpdate,
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
     Update an application's fields.
@@ -227,40 +653,29 @@ async def update_application(
     All fields are optional - only provided fields will be updated.
     Automatically updates last_updated timestamp.
     """
-    application = session.get(Application, UUID(application_id))
-    
-    if not application:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Application not found"
-        )
-    
-    if str(application.user_id) != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this application"
-        )
-    
     # Validate resume_id if being updated
-    update_data = application_update.dict(exclude_unset=True)
+    update_data = application_update.model_dump(exclude_unset=True)
     if 'resume_id' in update_data and update_data['resume_id']:
-        resume = session.get(Resume, update_data['resume_id'])
-        if not resume or str(resume.user_id) != user_id:
+        resume = await get_owned(session, Resume, update_data['resume_id'], user.id)
+        if not resume:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Resume not found"
             )
     
-    # Update fields
-    for key, value in update_data.items():
-        setattr(application, key, value)
+    # Update provided fields (and the timestamp) in one UPDATE ... RETURNING
+    update_data['last_updated'] = datetime.utcnow()
+    application = await update_owned(session, Application, UUID(application_id), user.id, update_data)
     
-    # Update timestamp
-    application.last_updated = datetime.utcnow()
+    if not application:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
     
-    session.add(application)
-    session.commit()
-    session.refresh(application)
+    await session.commit()
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "application", "updated", [application.id])
     
     return application
 
@@ -268,8 +683,8 @@ async def update_application(
 @router.delete("/{application_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_application(
     application_id: str,
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
     Delete an application.
@@ -277,7 +692,7 @@ async def delete_application(
     This action cannot be undone.
     Note: This does NOT delete the linked resume, only the application record.
     """
-    application = session.get(Application, UUID(application_id))
+    application = await delete_owned(session, Application, UUID(application_id), user.id)
     
     if not application:
         raise HTTPException(
@@ -285,57 +700,31 @@ async def delete_application(
             detail="Application not found"
         )
     
-    if str(application.user_id) != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this application"
-        )
-    
-    session.delete(application)
-    session.commit()
+    record_deletions(session, user.id, EntityEnum.application, [application.id])
+    await session.commit()
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "application", "deleted", [application.id])
     
     return None
 
 
-@router.get("/stats/summary")
-async def get_application_stats(
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+@router.get("/{application_id}/timeline", response_model=ApplicationEventPage)
+async def get_application_timeline(
+    application_id: str,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
-    Get application statistics for the user.
+    Get an application's change history, newest first.
     
-    Returns:
-    - Total applications
-    - Count by status
-    - Upcoming follow-ups
+    History is kept after the application is deleted. Returns an empty page
+    for applications that don't belong to user.
     """
-    # Get all applications
-    statement = select(Application).where(Application.user_id == UUID(user_id))
-    applications = session.exec(statement).all()
-    
-    # Calculate stats
-    total = len(applications)
-    by_status = {}
-    for status in StatusEnum:
-        by_status[status.value] = len([a for a in applications if a.status == status])
-    
-    # Upcoming follow-ups
-    today = date.today()
-    upcoming_followups = [
-        {
-            "id": str(a.id),
-            "company": a.company,
-            "role": a.role,
-            "follow_up_date": a.follow_up_date.isoformat()
-        }
-        for a in applications
-        if a.follow_up_date and a.follow_up_date >= today and a.status not in [StatusEnum.rejected, StatusEnum.archived]
-    ]
-    upcoming_followups.sort(key=lambda x: x['follow_up_date'])
-    
-    return {
-        "total_applications": total,
-        "by_status": by_status,
-        "upcoming_followups": upcoming_followups[:5]  # Next 5
-    }
+    # Served by idx_application_events_application
+    statement = select(ApplicationEvent).where(
+        ApplicationEvent.application_id == UUID(application_id),
+        ApplicationEvent.user_id == user.id
+    )
+    return await _event_page(session, statement, cursor, limit)
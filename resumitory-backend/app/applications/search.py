@@ -0,0 +1,115 @@
+"""
+Ranked, typo-tolerant search over applications (company, role and notes).
+
+On PostgreSQL this uses the generated search_vector (full text) and
+search_document (pg_trgm) columns from database_setup.sql, both backed by
+GIN indexes. Other databases (SQLite in local development) fall back to
+substring filtering and in-process trigram scoring.
+"""
+import re
+from typing import List, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import Float, cast, func, literal, literal_column
+from sqlmodel import col, or_, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.applications.models import Application
+from app.database import is_postgres
+
+# Text search configuration used by the search_vector column
+TEXT_SEARCH_CONFIG = "english"
+
+# Minimum trigram word similarity for a fuzzy match (pg_trgm's default)
+WORD_SIMILARITY_THRESHOLD = 0.6
+
+SEARCH_VECTOR = literal_column("applications.search_vector")
+SEARCH_DOCUMENT = literal_column("applications.search_document")
+
+
+def search_condition(session: AsyncSession, query: str):
+    """
+    WHERE clause matching applications whose company, role or notes match the query.
+
+    PostgreSQL: full-text match OR trigram word similarity (typo tolerant),
+    each served by its own GIN index. Elsewhere: case-insensitive substring.
+    """
+    if is_postgres(session):
+        ts_query = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query)
+        return or_(
+            SEARCH_VECTOR.op("@@")(ts_query),
+            literal(query).op("<%")(SEARCH_DOCUMENT)
+        )
+
+    pattern = f"%{query}%"
+    return or_(
+        col(Application.company).ilike(pattern),
+        col(Application.role).ilike(pattern),
+        col(Application.notes).ilike(pattern)
+    )
+
+
+def _trigrams(text: str) -> Set[str]:
+    """Trigrams of each word, padded like pg_trgm (two spaces before, one after)."""
+    grams = set()
+    for word in re.findall(r"\w+", text.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def word_similarity(query: str, document: str) -> float:
+    """
+    Approximate pg_trgm word_similarity: share of the query's trigrams found in the document.
+
+    An exact substring match scores 1.0.
+    """
+    if query.lower() in document.lower():
+        return 1.0
+    query_grams = _trigrams(query)
+    if not query_grams:
+        return 0.0
+    return len(query_grams & _trigrams(document)) / len(query_grams)
+
+
+async def search_application_ids(
+    session: AsyncSession,
+    user_id: UUID,
+    query: str,
+    limit: int
+) -> List[Tuple[UUID, float]]:
+    """
+    Find the user's best-matching applications.
+
+    Returns:
+        Up to `limit` (application id, relevance score) pairs, best first
+    """
+    if is_postgres(session):
+        ts_query = func.websearch_to_tsquery(TEXT_SEARCH_CONFIG, query)
+        score = (
+            func.ts_rank(SEARCH_VECTOR, ts_query)
+            + cast(func.word_similarity(query, SEARCH_DOCUMENT), Float)
+        ).label("score")
+        statement = select(Application.id, score).where(
+            Application.user_id == user_id,
+            search_condition(session, query)
+        ).order_by(score.desc(), Application.id).limit(limit)
+        return [(app_id, float(rank)) for app_id, rank in (await session.exec(statement)).all()]
+
+    # In-process fallback: score only the searchable columns in Python
+    statement = select(
+        Application.id,
+        Application.company,
+        Application.role,
+        Application.notes
+    ).where(Application.user_id == user_id)
+
+    scored = []
+    for app_id, company, role, notes in (await session.exec(statement)).all():
+        document = f"{company} {role} {notes or ''}"
+        score = word_similarity(query, document)
+        if score >= WORD_SIMILARITY_THRESHOLD:
+            scored.append((app_id, score))
+
+    scored.sort(key=lambda item: (-item[1], str(item[0])))
+    return scored[:limit]
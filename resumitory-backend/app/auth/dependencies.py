@@ -1,27 +1,124 @@
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+from uuid import UUID
+import hashlib
+import logging
+import re
+import time
 import jwt
 from app.config import settings
 
 security = HTTPBearer()
+optional_security = HTTPBearer(auto_error=False)
+
+
+@dataclass(frozen=True)
+class CurrentUser:
+    """Authenticated principal resolved from a verified Supabase JWT."""
+    id: UUID
+    expires_at: Optional[int] = None
+
+
+# access_token=<JWT> in a logged request path
+_ACCESS_TOKEN_PARAM = re.compile(r"(access_token=)[^&\s]+")
+
+
+class AccessTokenLogFilter(logging.Filter):
+    """
+    Redact ?access_token= values from uvicorn access log lines.
+
+    uvicorn logs the full path with its query string, which would write
+    the bearer tokens of EventSource clients to the logs.
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if isinstance(record.args, tuple):
+            record.args = tuple(
+                _ACCESS_TOKEN_PARAM.sub(r"\1[redacted]", arg) if isinstance(arg, str) else arg
+                for arg in record.args
+            )
+        return True
+
+
+# Verified tokens keyed by SHA-256 of the token, least recently used first
+_verified_tokens: "OrderedDict[bytes, CurrentUser]" = OrderedDict()
+
+
+def _cached_user(token_key: bytes) -> Optional[CurrentUser]:
+    """Return the cached principal for a token, dropping it once the token expires."""
+    user = _verified_tokens.get(token_key)
+    if user is None:
+        return None
+    
+    if user.expires_at <= time.time():
+        del _verified_tokens[token_key]
+        return None
+    
+    _verified_tokens.move_to_end(token_key)
+    return user
+
+
+def _cache_user(token_key: bytes, user: CurrentUser) -> None:
+    """Remember a verified token, evicting the least recently used beyond the limit."""
+    _verified_tokens[token_key] = user
+    while len(_verified_tokens) > settings.AUTH_TOKEN_CACHE_SIZE:
+        _verified_tokens.popitem(last=False)
 
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security)
-) -> str:
+) -> CurrentUser:
     """
-    Verify JWT token from Supabase and extract user_id.
+    Verify JWT token from Supabase and resolve the current user.
+    
+    Verified tokens are cached (by hash, until their exp), so repeat
+    requests with the same token skip signature verification and claim
+    parsing.
     
     Args:
         credentials: HTTP Bearer token from Authorization header
         
     Returns:
-        user_id: UUID string from JWT payload
+        CurrentUser carrying the parsed user UUID
         
     Raises:
         HTTPException: If token is invalid or expired
     """
-    token = credentials.credentials
+    return _verify_token(credentials.credentials)
+
+
+async def get_stream_user(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_security),
+    access_token: Optional[str] = Query(None, description="JWT, for clients that cannot send headers (EventSource)")
+) -> CurrentUser:
+    """
+    Resolve the current user for streaming endpoints.
+    
+    Like get_current_user, but also accepts the token as an access_token
+    query parameter, since the browser EventSource API cannot set headers.
+    
+    Raises:
+        HTTPException: If no token is given, or it is invalid or expired
+    """
+    token = credentials.credentials if credentials else access_token
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated"
+        )
+    return _verify_token(token)
+
+
+def _verify_token(token: str) -> CurrentUser:
+    """Verify a Supabase JWT (or reuse a cached verification) and build the principal."""
+    token_key = hashlib.sha256(token.encode()).digest()
+    
+    user = _cached_user(token_key)
+    if user is not None:
+        return user
     
     try:
         # Decode JWT using Supabase JWT secret
@@ -40,15 +137,21 @@ async def get_current_user(
                 detail="Invalid token: missing user_id"
             )
         
-        return user_id
+        user = CurrentUser(id=UUID(user_id), expires_at=payload.get("exp"))
         
     except jwt.ExpiredSignatureError:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Token expired"
         )
-    except jwt.InvalidTokenError:
+    except (jwt.InvalidTokenError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid token"
         )
+    
+    # Only tokens with an expiry can be cached safely
+    if user.expires_at is not None:
+        _cache_user(token_key, user)
+    
+    return user
@@ -0,0 +1,213 @@
+"""Per-user response cache for list and stats endpoints."""
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from uuid import UUID
+
+from app.config import settings
+
+
+class ResponseCache:
+    """
+    Cache of JSON-serializable payloads scoped to a user.
+
+    Every entry belongs to one user, and any write by that user drops all
+    of their entries (invalidate), so cached reads are never stale.
+
+    Each user has a generation that invalidate() bumps. get() returns the
+    generation it saw along with the value, and set() drops the value if
+    the generation has moved since: a payload read from the database before
+    a concurrent write committed is never stored after that write.
+    """
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, user_id: UUID, key: str) -> Tuple[Optional[Any], int]:
+        """
+        Look up a payload.
+
+        Returns:
+            (value or None on a miss, the user's generation to pass to set())
+        """
+        value, generation = await self._get(user_id, key)
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value, generation
+
+    async def set(self, user_id: UUID, key: str, value: Any, generation: int) -> None:
+        """Store a payload, unless the user's data changed since get() returned generation."""
+        await self._set(user_id, key, value, generation)
+
+    async def invalidate(self, user_id: UUID) -> None:
+        """Drop every cached payload for a user (call after their writes commit)."""
+        await self._invalidate(user_id)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this worker."""
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0
+        }
+
+    async def _get(self, user_id: UUID, key: str) -> Tuple[Optional[Any], int]:
+        raise NotImplementedError
+
+    async def _set(self, user_id: UUID, key: str, value: Any, generation: int) -> None:
+        raise NotImplementedError
+
+    async def _invalidate(self, user_id: UUID) -> None:
+        raise NotImplementedError
+
+
+class NullCache(ResponseCache):
+    """Caching disabled: every lookup misses."""
+
+    async def _get(self, user_id, key):
+        return None, 0
+
+    async def _set(self, user_id, key, value, generation):
+        pass
+
+    async def _invalidate(self, user_id):
+        pass
+
+
+class MemoryCache(ResponseCache):
+    """
+    In-process LRU cache with a TTL.
+
+    Invalidation bumps a per-user generation that is part of every key, so it
+    is O(1); stale generations are never read again and age out of the LRU.
+    Values are stored under the generation get() saw, and only if it is
+    still current.
+    Entries are per worker, so writes on one worker are not seen by others
+    until the TTL expires; use RedisCache with several workers.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        super().__init__()
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[UUID, int, str], Tuple[float, Any]]" = OrderedDict()
+        self._generations: Dict[UUID, int] = {}
+
+    async def _get(self, user_id, key):
+        generation = self._generations.get(user_id, 0)
+        cache_key = (user_id, generation, key)
+        entry = self._entries.get(cache_key)
+        if entry is None:
+            return None, generation
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[cache_key]
+            return None, generation
+
+        self._entries.move_to_end(cache_key)
+        return value, generation
+
+    async def _set(self, user_id, key, value, generation):
+        # Invalidated since the value was read: it may predate the write
+        if self._generations.get(user_id, 0) != generation:
+            return
+        cache_key = (user_id, generation, key)
+        self._entries[cache_key] = (time.monotonic() + self.ttl_seconds, value)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _invalidate(self, user_id):
+        self._generations[user_id] = self._generations.get(user_id, 0) + 1
+
+    def stats(self):
+        return {**super().stats(), "entries": len(self._entries)}
+
+
+class RedisCache(ResponseCache):
+    """
+    Redis-backed cache shared by all workers.
+
+    Each user's payloads live in one hash, so invalidation is a single DEL
+    (plus an INCR of the user's generation key, in the same transaction).
+    Writes check the generation and store the payload in one Lua script, so
+    the check is atomic across workers. Requires the optional `redis` package.
+    """
+
+    # Generation keys outlive the payloads, so a generation is not reset to
+    # 0 while a slow request still holds an older one
+    GENERATION_TTL_SECONDS = 86400
+
+    # KEYS: hash, generation key; ARGV: generation, field, payload, ttl
+    _SET_IF_CURRENT = """
+    if tonumber(redis.call('GET', KEYS[2]) or '0') ~= tonumber(ARGV[1]) then
+        return 0
+    end
+    redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+    return 1
+    """
+
+    def __init__(self, url: str, ttl_seconds: int):
+        super().__init__()
+        from redis import asyncio as redis_asyncio
+
+        self.ttl_seconds = ttl_seconds
+        self._redis = redis_asyncio.from_url(url)
+        self._set_if_current = self._redis.register_script(self._SET_IF_CURRENT)
+
+    @staticmethod
+    def _hash(user_id: UUID) -> str:
+        return f"resumitory:cache:{user_id}"
+
+    @staticmethod
+    def _generation(user_id: UUID) -> str:
+        return f"resumitory:cache-generation:{user_id}"
+
+    async def _get(self, user_id, key):
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hget(self._hash(user_id), key)
+            pipe.get(self._generation(user_id))
+            raw, generation = await pipe.execute()
+        value = json.loads(raw) if raw is not None else None
+        return value, int(generation or 0)
+
+    async def _set(self, user_id, key, value, generation):
+        await self._set_if_current(
+            keys=[self._hash(user_id), self._generation(user_id)],
+            args=[generation, key, json.dumps(value), self.ttl_seconds]
+        )
+
+    async def _invalidate(self, user_id):
+        name = self._generation(user_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._hash(user_id))
+            pipe.incr(name)
+            pipe.expire(name, self.GENERATION_TTL_SECONDS)
+            await pipe.execute()
+
+
+def _create_cache() -> ResponseCache:
+    if settings.CACHE_BACKEND == "memory":
+        # A write only invalidates its own worker's cache: other workers would
+        # keep serving stale pages, and 304s from stale ETag versions
+        if settings.WEB_CONCURRENCY > 1:
+            raise ValueError(
+                "CACHE_BACKEND=memory is per worker; use redis (or none) with WEB_CONCURRENCY > 1"
+            )
+        return MemoryCache(settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS)
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCache(settings.REDIS_URL, settings.CACHE_TTL_SECONDS)
+    if settings.CACHE_BACKEND == "none":
+        return NullCache()
+    raise ValueError(f"Unknown CACHE_BACKEND: {settings.CACHE_BACKEND}")
+
+
+response_cache: ResponseCache = _create_cache()
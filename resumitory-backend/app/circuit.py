@@ -0,0 +1,104 @@
+"""Circuit breaker for calls to external services."""
+import math
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Optional
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a service while its circuit is open."""
+
+    def __init__(self, name: str, retry_after: int):
+        super().__init__(f"{name} is unavailable (circuit open, retry in {retry_after}s)")
+        self.name = name
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast once a service keeps failing.
+
+    After `failure_threshold` consecutive failures the circuit opens and
+    calls raise CircuitOpenError without touching the network. Once
+    `reset_seconds` have passed a single trial call is let through
+    (half-open); its outcome closes the circuit or opens it again.
+
+    `is_failure` decides which exceptions count against the service
+    (timeouts, 5xx); anything else (404, validation) passes through as is.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int,
+        reset_seconds: float,
+        is_failure: Callable[[Exception], bool]
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self.is_failure = is_failure
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._trial_in_flight or time.monotonic() - self._opened_at < self.reset_seconds:
+            return "open"
+        return "half_open"
+
+    def _retry_after(self) -> int:
+        remaining = self.reset_seconds - (time.monotonic() - self._opened_at)
+        return max(1, math.ceil(remaining))
+
+    def _before_call(self) -> bool:
+        """Raise if the circuit is open; returns True for the half-open trial call."""
+        state = self.state
+        if state == "open":
+            raise CircuitOpenError(self.name, self._retry_after())
+        if state == "half_open":
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def _record_failure(self, trial: bool) -> None:
+        self._failures += 1
+        if trial or self._failures >= self.failure_threshold:
+            self._opened_at = time.monotonic()
+
+    def _record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+
+    @asynccontextmanager
+    async def guard(self) -> AsyncIterator[None]:
+        """
+        Run one call to the service under the breaker.
+
+        Raises:
+            CircuitOpenError: If the circuit is open (the block is not run)
+        """
+        trial = self._before_call()
+        try:
+            yield
+        except Exception as e:
+            # Other errors are not the service's fault: a half-open circuit
+            # stays half-open and the next call is the trial
+            if self.is_failure(e):
+                self._record_failure(trial)
+            raise
+        else:
+            self._record_success()
+        finally:
+            if trial:
+                self._trial_in_flight = False
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state for health checks."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures
+        }
@@ -13,8 +13,51 @@ class Settings(BaseSettings):
     SUPABASE_JWT_SECRET: str
     DATABASE_PASSWORD: str
     
+    # Verified JWTs remembered per worker (until each token's exp)
+    AUTH_TOKEN_CACHE_SIZE: int = 10000
+    
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
+    # Worker processes (uvicorn --workers and gunicorn also read WEB_CONCURRENCY)
+    WEB_CONCURRENCY: int = 1
+    PUBLIC_API_URL: str = "http://localhost:8000"
+    
+    # File storage: "supabase" (Supabase Storage) or "local" (disk, served at /files)
+    STORAGE_BACKEND: str = "supabase"
+    LOCAL_STORAGE_DIR: str = str(BASE_DIR / "storage")
+    # Internal nginx location for LOCAL_STORAGE_DIR: when set, /files responses
+    # carry X-Accel-Redirect and nginx sends the file (sendfile) instead of the app
+    LOCAL_STORAGE_ACCEL_REDIRECT: str = ""
+    
+    # Supabase Storage HTTP client: pooled connections per worker, timeouts
+    # in seconds (uploads and deletes also get an overall deadline) and a
+    # circuit breaker that fails fast after consecutive storage failures
+    STORAGE_MAX_CONNECTIONS: int = 20
+    STORAGE_CONNECT_TIMEOUT: float = 5.0
+    STORAGE_READ_TIMEOUT: float = 10.0
+    STORAGE_UPLOAD_TIMEOUT: float = 30.0
+    STORAGE_DELETE_TIMEOUT: float = 10.0
+    STORAGE_CIRCUIT_FAILURES: int = 5
+    STORAGE_CIRCUIT_RESET_SECONDS: float = 30.0
+    
+    # Per-user response cache for list/stats endpoints: "memory", "redis" or "none"
+    CACHE_BACKEND: str = "memory"
+    CACHE_TTL_SECONDS: int = 60
+    CACHE_MAX_ENTRIES: int = 10000
+    REDIS_URL: str = "redis://localhost:6379/0"
+    
+    # Live change notices for GET /events: "postgres" (LISTEN/NOTIFY, all
+    # workers) or "memory" (in-process, single worker and tests)
+    EVENTS_BACKEND: str = "postgres"
+    
+    # Database connection pool (per uvicorn worker; keep
+    # workers * (POOL_SIZE + MAX_OVERFLOW) under the Supabase connection limit)
+    DATABASE_ECHO: bool = False
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: int = 30
+    DATABASE_POOL_RECYCLE: int = 1800
+    DATABASE_POOL_PRE_PING: bool = True
     
     class Config:
         env_file = str(BASE_DIR / ".env")
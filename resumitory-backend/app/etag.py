@@ -0,0 +1,85 @@
+"""Weak ETags and If-None-Match handling for GET endpoints."""
+import hashlib
+from typing import Any, List
+
+from fastapi import Request, Response, status
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from uuid import UUID
+
+from app.applications.models import Application
+from app.cache import response_cache
+from app.resumes.models import Resume
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from the values a representation depends on."""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of the request's If-None-Match header against an ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    def opaque(tag: str) -> str:
+        tag = tag.strip()
+        return tag[2:] if tag.startswith("W/") else tag
+
+    return opaque(etag) in {opaque(tag) for tag in header.split(",")}
+
+
+# Clients may keep per-user responses but must revalidate them every time
+CACHE_CONTROL = "private, no-cache"
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach the ETag (and revalidation policy) to a 200 response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """304 response carrying the current ETag."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    )
+
+
+async def collection_version(
+    session: AsyncSession,
+    user_id: UUID,
+    include_applications: bool
+) -> List[Any]:
+    """
+    Version of a user's resume (and optionally application) collection.
+
+    (max updated timestamp, row count) per table, read in one aggregate
+    statement without loading any rows; counts catch deletes. The result is
+    kept in the response cache, so it costs nothing until the user writes.
+    """
+    cache_key = f"version:{'applications' if include_applications else 'resumes'}"
+    cached, generation = await response_cache.get(user_id, cache_key)
+    if cached is not None:
+        return cached
+
+    columns = [
+        select(func.max(Resume.updated_at)).where(Resume.user_id == user_id).scalar_subquery(),
+        select(func.count()).select_from(Resume).where(Resume.user_id == user_id).scalar_subquery()
+    ]
+    # Application rows embed resume_name, so resume changes count too
+    if include_applications:
+        columns += [
+            select(func.max(Application.last_updated)).where(Application.user_id == user_id).scalar_subquery(),
+            select(func.count()).select_from(Application).where(Application.user_id == user_id).scalar_subquery()
+        ]
+
+    row = (await session.exec(select(*columns))).one()
+    version = [value.isoformat() if hasattr(value, "isoformat") else value for value in row]
+    await response_cache.set(user_id, cache_key, version, generation)
+    return version
@@ -0,0 +1 @@
+"""Live change notifications module."""
@@ -0,0 +1,238 @@
+"""
+Per-user change notices for the live event stream (GET /events).
+
+Routers publish a compact notice after each commit. The transport carries it
+to every worker: PostgreSQL LISTEN/NOTIFY in production, or an in-process
+queue (tests, single worker). Each worker runs one fan-out task that puts
+incoming notices on the queues of that user's open streams, so an idle
+connection costs a queue and a sleeping coroutine.
+"""
+import asyncio
+import json
+import logging
+from typing import Any, Dict, Iterable, Optional, Set
+from uuid import UUID
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY channel shared by all workers
+CHANNEL = "resumitory_changes"
+
+# Notices buffered per stream before it is told to resync instead
+SUBSCRIBER_QUEUE_SIZE = 100
+
+# Larger changes (bulk imports) omit ids: clients refetch instead
+MAX_NOTICE_IDS = 100
+
+# How often the fan-out task checks the transport while idle
+TRANSPORT_CHECK_SECONDS = 30
+
+# Bounds on transport calls; connecting happens only in the fan-out task,
+# never on a request path
+TRANSPORT_CONNECT_TIMEOUT_SECONDS = 5
+NOTIFY_TIMEOUT_SECONDS = 2
+
+
+class EventBroker:
+    """Fan-out of change notices to this worker's streams."""
+
+    def __init__(self):
+        self._subscribers: Dict[UUID, Set[asyncio.Queue]] = {}
+        self._incoming: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._transport_checked: Optional[asyncio.Event] = None
+
+    async def start(self) -> None:
+        """
+        Start the fan-out task and wait for its first transport connect (idempotent).
+
+        Called at startup, so notices published right after it are sent
+        rather than dropped while the transport is still connecting.
+        """
+        self._start_fan_out()
+        await self._transport_checked.wait()
+
+    async def stop(self) -> None:
+        """Stop the fan-out task (subclasses also close their transport)."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def _start_fan_out(self) -> None:
+        """Start the fan-out task if it isn't running (connecting is left to it)."""
+        if self._task is None:
+            self._incoming = asyncio.Queue()
+            self._transport_checked = asyncio.Event()
+            self._task = asyncio.create_task(self._fan_out())
+
+    async def subscribe(self, user_id: UUID) -> asyncio.Queue:
+        """Register a stream; notices for user_id arrive on the returned queue as JSON strings."""
+        self._start_fan_out()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: UUID, queue: asyncio.Queue) -> None:
+        queues = self._subscribers.get(user_id)
+        if queues is not None:
+            queues.discard(queue)
+            if not queues:
+                del self._subscribers[user_id]
+
+    async def publish(
+        self,
+        user_id: UUID,
+        entity: str,
+        action: str,
+        ids: Optional[Iterable[UUID]] = None
+    ) -> None:
+        """
+        Notify every stream of user_id that records changed (call after commit).
+        
+        Args:
+            user_id: Owner of the changed records
+            entity: "resume" or "application"
+            action: "created", "updated" or "deleted"
+            ids: Changed record ids; None (or more than MAX_NOTICE_IDS) tells clients to refetch
+        """
+        self._start_fan_out()
+        if ids is not None:
+            ids = [str(record_id) for record_id in ids]
+            if len(ids) > MAX_NOTICE_IDS:
+                ids = None
+        notice = {"user_id": str(user_id), "entity": entity, "action": action, "ids": ids}
+        try:
+            await self._send(json.dumps(notice))
+        except Exception as e:
+            # The write already committed; a missed notice only delays clients
+            logger.warning("Failed to publish change notice: %s", e)
+
+    def stats(self) -> Dict[str, Any]:
+        """Open streams on this worker."""
+        return {
+            "backend": type(self).__name__,
+            "users": len(self._subscribers),
+            "streams": sum(len(queues) for queues in self._subscribers.values())
+        }
+
+    async def _send(self, payload: str) -> None:
+        raise NotImplementedError
+
+    async def _check_transport(self) -> None:
+        """Reconnect the transport if needed (called periodically by the fan-out task)."""
+
+    def _receive(self, payload: str) -> None:
+        """Queue a notice from the transport for the fan-out task."""
+        self._incoming.put_nowait(payload)
+
+    async def _keep_transport(self) -> None:
+        try:
+            await self._check_transport()
+        except Exception as e:
+            logger.warning("Event transport unavailable: %s", e)
+
+    async def _fan_out(self) -> None:
+        await self._keep_transport()
+        self._transport_checked.set()
+        while True:
+            try:
+                payload = await asyncio.wait_for(self._incoming.get(), TRANSPORT_CHECK_SECONDS)
+            except asyncio.TimeoutError:
+                await self._keep_transport()
+                continue
+
+            try:
+                notice = json.loads(payload)
+                queues = self._subscribers.get(UUID(notice.pop("user_id")))
+            except (ValueError, KeyError, TypeError, AttributeError):
+                logger.warning("Ignoring malformed change notice: %s", payload[:200])
+                continue
+            if not queues:
+                continue
+
+            # Serialized once, shared by all of the user's streams
+            data = json.dumps(notice)
+            for queue in queues:
+                try:
+                    queue.put_nowait(data)
+                except asyncio.QueueFull:
+                    # Slow client: replace its backlog with a single resync notice
+                    while not queue.empty():
+                        queue.get_nowait()
+                    queue.put_nowait(json.dumps({"action": "resync"}))
+
+
+class MemoryBroker(EventBroker):
+    """
+    In-process transport.
+    
+    Notices only reach streams on the same worker; use PostgresBroker with
+    several workers.
+    """
+
+    async def _send(self, payload):
+        self._receive(payload)
+
+
+class PostgresBroker(EventBroker):
+    """
+    PostgreSQL LISTEN/NOTIFY transport shared by all workers.
+    
+    Each worker holds one dedicated connection (outside the pool) that
+    listens on CHANNEL and also sends this worker's NOTIFYs. The fan-out
+    task opens it and reconnects it; while it is down, publish() drops
+    notices instead of waiting, so writes never block on the transport.
+    """
+
+    def __init__(self, dsn: str):
+        super().__init__()
+        self._dsn = dsn
+        self._connection = None
+        self._connect_lock = asyncio.Lock()
+        self._send_lock = asyncio.Lock()
+
+    async def stop(self):
+        await super().stop()
+        if self._connection is not None:
+            await self._connection.close()
+            self._connection = None
+
+    async def _connect(self):
+        import asyncpg
+
+        async with self._connect_lock:
+            if self._connection is None or self._connection.is_closed():
+                connection = await asyncpg.connect(self._dsn, timeout=TRANSPORT_CONNECT_TIMEOUT_SECONDS)
+                await connection.add_listener(
+                    CHANNEL, lambda _connection, _pid, _channel, payload: self._receive(payload)
+                )
+                self._connection = connection
+            return self._connection
+
+    async def _send(self, payload):
+        connection = self._connection
+        if connection is None or connection.is_closed():
+            # Reconnecting is left to the fan-out task
+            raise ConnectionError("not connected, notice dropped")
+        # One connection runs one statement at a time
+        async with self._send_lock:
+            await connection.execute(
+                "SELECT pg_notify($1, $2)", CHANNEL, payload, timeout=NOTIFY_TIMEOUT_SECONDS
+            )
+
+    async def _check_transport(self):
+        await self._connect()
+
+
+def _create_broker() -> EventBroker:
+    if settings.EVENTS_BACKEND == "postgres":
+        from app.database import DATABASE_URL
+        return PostgresBroker(DATABASE_URL.replace("postgresql+asyncpg://", "postgresql://"))
+    if settings.EVENTS_BACKEND == "memory":
+        return MemoryBroker()
+    raise ValueError(f"Unknown EVENTS_BACKEND: {settings.EVENTS_BACKEND}")
+
+
+event_broker: EventBroker = _create_broker()
@@ -0,0 +1,55 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.responses import StreamingResponse
+
+from app.auth.dependencies import CurrentUser, get_stream_user
+from app.events.broker import event_broker
+
+router = APIRouter()
+
+# Comment line sent on idle streams so proxies keep them open
+KEEPALIVE_SECONDS = 15
+
+# Client reconnect delay after a dropped stream
+RETRY_MILLISECONDS = 3000
+
+
+async def _event_stream(request: Request, user: CurrentUser):
+    """Yield Server-Sent Events for a user's change notices until the client goes away."""
+    queue = await event_broker.subscribe(user.id)
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n"
+        while True:
+            try:
+                data = await asyncio.wait_for(queue.get(), KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                if await request.is_disconnected():
+                    break
+                yield ": keepalive\n\n"
+                continue
+            yield f"event: change\ndata: {data}\n\n"
+    finally:
+        event_broker.unsubscribe(user.id, queue)
+
+
+@router.get("")
+async def stream_events(
+    request: Request,
+    user: CurrentUser = Depends(get_stream_user)
+):
+    """
+    Stream live change notices for the authenticated user (Server-Sent Events).
+    
+    Each `change` event carries JSON like
+    `{"entity": "application", "action": "updated", "ids": ["..."]}`;
+    refetch the affected records (or use GET /sync). `ids` is null for large
+    changes, and `{"action": "resync"}` means notices were dropped: refetch all.
+    
+    Browsers using EventSource can pass the JWT as `?access_token=`.
+    """
+    return StreamingResponse(
+        _event_stream(request, user),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -1,13 +1,53 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from app.auth.dependencies import AccessTokenLogFilter
 from app.auth.router import router as auth_router
 from app.resumes.router import router as resumes_router
 from app.applications.router import router as applications_router
+from app.resumes.files import router as files_router
+from app.rounds.router import router as rounds_router
+from app.sync.router import router as sync_router
+from app.events.router import router as events_router
+from app.events.broker import event_broker
+from app.resumes.backends import get_storage_backend, start_storage_backend, stop_storage_backend
+from app.resumes.cleanup import storage_cleanup
+from app.database import get_pool_status
+from app.cache import response_cache
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Open shared clients and background workers at startup, close them at shutdown.
+    
+    The storage HTTP client is built here rather than on import, so importing
+    the app (tests, scripts) opens no connections.
+    """
+    await start_storage_backend()
+    # Start draining queued storage deletions in the background
+    storage_cleanup.start()
+    # Connect the event transport before serving, so early notices aren't dropped
+    await event_broker.start()
+    try:
+        yield
+    finally:
+        # Pending deletions stay queued for the next start
+        await storage_cleanup.stop()
+        await event_broker.stop()
+        await stop_storage_backend()
+
+
+# EventSource clients send the JWT in the query string; keep it out of access logs
+logging.getLogger("uvicorn.access").addFilter(AccessTokenLogFilter())
 
 app = FastAPI(
     title="Resumitory API",
     description="Resume version control and job application tracker",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS Configuration
@@ -26,7 +66,10 @@ app.add_middleware(
 app.include_router(auth_router, prefix="/auth", tags=["Authentication"])
 app.include_router(resumes_router, prefix="/resumes", tags=["Resumes"])
 app.include_router(applications_router, prefix="/applications", tags=["Applications"])
-# TODO: Add rounds router (V1.1)
+app.include_router(files_router, prefix="/files", tags=["Files"])
+app.include_router(rounds_router, tags=["Interview Rounds"])
+app.include_router(sync_router, prefix="/sync", tags=["Sync"])
+app.include_router(events_router, prefix="/events", tags=["Events"])
 
 
 @app.get("/")
@@ -44,3 +87,27 @@ def root():
 def health_check():
     """Health check endpoint for monitoring."""
     return {"status": "healthy"}
+
+
+@app.get("/health/db")
+def database_health_check():
+    """Connection pool usage for this worker (for sizing the pool per worker)."""
+    return {"status": "healthy", "pool": get_pool_status()}
+
+
+@app.get("/health/cache")
+def cache_health_check():
+    """Response cache hit/miss counters for this worker."""
+    return {"status": "healthy", "cache": response_cache.stats()}
+
+
+@app.get("/health/events")
+def events_health_check():
+    """Open live event streams on this worker."""
+    return {"status": "healthy", "events": event_broker.stats()}
+
+
+@app.get("/health/storage")
+def storage_health_check():
+    """File storage backend and circuit breaker state for this worker."""
+    return {"status": "healthy", "storage": get_storage_backend().stats()}
@@ -0,0 +1,98 @@
+"""Keyset (cursor) pagination helpers for list endpoints."""
+import base64
+import json
+from typing import Any, Callable, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, status
+from sqlalchemy import tuple_
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 100
+
+
+def encode_cursor(sort_value: Any, row_id: UUID) -> str:
+    """
+    Encode the (sort value, id) of the last row on a page as an opaque cursor.
+
+    Args:
+        sort_value: Date/datetime the listing is ordered by
+        row_id: Primary key of the row, used as a tie-breaker
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([sort_value.isoformat(), str(row_id)])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, parse_sort_value: Callable[[str], Any]) -> Tuple[Any, UUID]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Opaque cursor from a previous page
+        parse_sort_value: Parser for the sort value (e.g. date.fromisoformat)
+
+    Returns:
+        (sort_value, row_id) tuple
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return parse_sort_value(sort_value), UUID(row_id)
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+def paginate(
+    statement,
+    sort_column,
+    id_column,
+    cursor: Optional[str],
+    limit: int,
+    parse_sort_value: Callable[[str], Any]
+):
+    """
+    Apply keyset ordering, the cursor predicate and the page limit to a query.
+
+    Rows are ordered by (sort_column DESC, id DESC) and resumed with a row
+    comparison, so each page is an index range scan instead of an OFFSET.
+    One extra row is fetched so split_page can tell whether more remain.
+    """
+    if cursor:
+        sort_value, row_id = decode_cursor(cursor, parse_sort_value)
+        statement = statement.where(
+            tuple_(sort_column, id_column) < tuple_(sort_value, row_id)
+        )
+
+    return statement.order_by(sort_column.desc(), id_column.desc()).limit(limit + 1)
+
+
+def split_page(
+    rows: List[Any],
+    limit: int,
+    cursor_key: Callable[[Any], Tuple[Any, UUID]]
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Trim the look-ahead row from a paginated result and build the next cursor.
+
+    Args:
+        rows: Rows returned by a statement built with paginate()
+        limit: Requested page size
+        cursor_key: Returns (sort_value, id) for a row
+
+    Returns:
+        (rows on this page, next_cursor or None when this is the last page)
+    """
+    if len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    return rows, encode_cursor(*cursor_key(rows[-1]))
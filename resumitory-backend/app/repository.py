@@ -0,0 +1,91 @@
+"""
+Ownership-scoped data access for by-id endpoints.
+
+Every statement filters on both the primary key and the caller's user_id,
+so a row that is missing and a row owned by someone else look the same
+(None -> 404) and need no second round trip to tell apart. Mutations use
+UPDATE/DELETE ... RETURNING, so no fetch-before-write or refresh-after-commit
+is needed.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Type, TypeVar
+from uuid import UUID
+
+from sqlmodel import SQLModel, col, delete, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+ModelT = TypeVar("ModelT", bound=SQLModel)
+
+
+async def get_owned(
+    session: AsyncSession,
+    model: Type[ModelT],
+    row_id: UUID,
+    user_id: UUID
+) -> Optional[ModelT]:
+    """SELECT a row by id, only if it belongs to user_id."""
+    statement = select(model).where(model.id == row_id, model.user_id == user_id)
+    return (await session.exec(statement)).first()
+
+
+async def update_owned(
+    session: AsyncSession,
+    model: Type[ModelT],
+    row_id: UUID,
+    user_id: UUID,
+    values: Dict[str, Any]
+) -> Optional[ModelT]:
+    """UPDATE a user's row by id and return the updated row (None if not found)."""
+    statement = (
+        update(model)
+        .where(model.id == row_id, model.user_id == user_id)
+        .values(**values)
+        .returning(model)
+    )
+    return (await session.exec(statement)).scalar_one_or_none()
+
+
+async def delete_owned(
+    session: AsyncSession,
+    model: Type[ModelT],
+    row_id: UUID,
+    user_id: UUID
+) -> Optional[ModelT]:
+    """DELETE a user's row by id and return the deleted row (None if not found)."""
+    statement = (
+        delete(model)
+        .where(model.id == row_id, model.user_id == user_id)
+        .returning(model)
+    )
+    return (await session.exec(statement)).scalar_one_or_none()
+
+
+async def update_owned_many(
+    session: AsyncSession,
+    model: Type[ModelT],
+    row_ids: Sequence[UUID],
+    user_id: UUID,
+    values: Dict[str, Any]
+) -> List[ModelT]:
+    """UPDATE the user's rows among row_ids in one statement and return the updated rows."""
+    statement = (
+        update(model)
+        .where(col(model.id).in_(row_ids), model.user_id == user_id)
+        .values(**values)
+        .returning(model)
+    )
+    return list((await session.exec(statement)).scalars().all())
+
+
+async def delete_owned_many(
+    session: AsyncSession,
+    model: Type[ModelT],
+    row_ids: Sequence[UUID],
+    user_id: UUID
+) -> List[UUID]:
+    """DELETE the user's rows among row_ids in one statement and return the deleted ids."""
+    statement = (
+        delete(model)
+        .where(col(model.id).in_(row_ids), model.user_id == user_id)
+        .returning(model.id)
+    )
+    return list((await session.exec(statement)).scalars().all())
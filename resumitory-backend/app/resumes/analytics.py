@@ -0,0 +1,92 @@
+"""
+Per-resume conversion analytics (which resume versions get interviews and offers).
+
+On PostgreSQL counts come from the resume_stats summary table, kept current by
+statement triggers on applications (database_setup.sql, Step 15), so a request
+reads one row per resume and never scans applications. Other databases (SQLite
+in local development) fall back to a GROUP BY over applications without
+time-to-interview.
+"""
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from sqlmodel import func, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.applications.models import Application, StatusEnum
+from app.database import is_postgres
+from app.resumes.models import Resume, ResumeAnalytics, ResumeStats
+
+STATUSES = [s.value for s in StatusEnum]
+
+
+def _rate(count: int, total: int) -> float:
+    return round(count / total, 4) if total else 0.0
+
+
+def build_analytics(
+    resume_id: UUID,
+    name: str,
+    by_status: Dict[str, int],
+    interviewed: int,
+    days_to_interview: Optional[int]
+) -> ResumeAnalytics:
+    """Derive totals and rates from per-status counts."""
+    total = sum(by_status.values())
+    responded = by_status["interview"] + by_status["offer"] + by_status["rejected"]
+    return ResumeAnalytics(
+        resume_id=resume_id,
+        name=name,
+        total=total,
+        by_status=by_status,
+        response_rate=_rate(responded, total),
+        interview_rate=_rate(interviewed, total),
+        offer_rate=_rate(by_status["offer"], total),
+        avg_days_to_interview=(
+            round(days_to_interview / interviewed, 1)
+            if interviewed and days_to_interview is not None else None
+        )
+    )
+
+
+async def resume_analytics(session: AsyncSession, user_id: UUID) -> List[ResumeAnalytics]:
+    """
+    Conversion analytics for each of the user's resumes, newest resume first.
+    
+    Resumes without applications are included with zero counts.
+    """
+    if is_postgres(session):
+        statement = select(Resume.id, Resume.name, ResumeStats).outerjoin(
+            ResumeStats, ResumeStats.resume_id == Resume.id
+        ).where(Resume.user_id == user_id).order_by(Resume.created_at.desc())
+        
+        analytics = []
+        for resume_id, name, stats in (await session.exec(statement)).all():
+            stats = stats or ResumeStats(resume_id=resume_id, user_id=user_id)
+            by_status = {s: getattr(stats, s) for s in STATUSES}
+            analytics.append(
+                build_analytics(resume_id, name, by_status, stats.interviewed, stats.days_to_interview)
+            )
+        return analytics
+    
+    # Fallback: aggregate applications per (resume, status)
+    resumes = (await session.exec(
+        select(Resume.id, Resume.name).where(Resume.user_id == user_id).order_by(Resume.created_at.desc())
+    )).all()
+    counts: Dict[UUID, Dict[str, int]] = {resume_id: dict.fromkeys(STATUSES, 0) for resume_id, _ in resumes}
+    
+    statement = select(Application.resume_id, Application.status, func.count()).where(
+        Application.user_id == user_id,
+        Application.resume_id.is_not(None)
+    ).group_by(Application.resume_id, Application.status)
+    for resume_id, status_value, count in (await session.exec(statement)).all():
+        if resume_id in counts:
+            counts[resume_id][StatusEnum(status_value).value] = count
+    
+    return [
+        build_analytics(
+            resume_id, name, counts[resume_id],
+            counts[resume_id]["interview"] + counts[resume_id]["offer"], None
+        )
+        for resume_id, name in resumes
+    ]
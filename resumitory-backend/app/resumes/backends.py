@@ -0,0 +1,305 @@
+"""Storage backends for resume files (Supabase Storage or local disk)."""
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+from urllib.parse import quote
+import mimetypes
+import os
+import uuid
+
+import anyio
+import httpx
+from fastapi.responses import FileResponse, RedirectResponse, Response
+
+from app.circuit import CircuitBreaker
+from app.config import settings
+
+# Storage bucket name
+RESUME_BUCKET = "resumes"
+
+# Bytes per chunk when streaming files out of storage
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class StorageBackend(ABC):
+    """Interface every resume file store implements."""
+
+    @abstractmethod
+    async def upload(
+        self,
+        storage_path: str,
+        chunks: AsyncIterator[bytes],
+        content_type: str,
+        size: Optional[int] = None
+    ) -> None:
+        """Write a file to storage from an async stream of chunks."""
+
+    @abstractmethod
+    async def delete(self, storage_paths: List[str]) -> None:
+        """Remove files from storage (missing files are ignored)."""
+
+    @abstractmethod
+    def url(self, storage_path: str) -> str:
+        """Public URL clients use to fetch the file."""
+
+    @abstractmethod
+    def open(self, storage_path: str) -> AsyncIterator[bytes]:
+        """Stream a file's content out of storage in chunks."""
+
+    @abstractmethod
+    def response(self, storage_path: str) -> Response:
+        """HTTP response that serves the file to a client."""
+
+    async def start(self) -> None:
+        """Open connections to the store (called once at app startup)."""
+
+    async def close(self) -> None:
+        """Release connections to the store (called at app shutdown)."""
+
+    def stats(self) -> Dict[str, Any]:
+        """Backend state for health checks."""
+        return {"backend": type(self).__name__}
+
+
+class SupabaseStorageBackend(StorageBackend):
+    """
+    Supabase Storage, accessed through its REST API with an async HTTP client.
+
+    One pooled client (keep-alive connections) is opened at app startup and
+    shared by all requests. Uploads and deletes run under an overall
+    deadline, so a slow storage API cannot hold a request indefinitely, and
+    a circuit breaker fails them fast while storage keeps failing.
+    """
+
+    def __init__(
+        self,
+        supabase_url: str,
+        api_key: str,
+        limits: httpx.Limits,
+        connect_timeout: float,
+        read_timeout: float,
+        upload_timeout: float,
+        delete_timeout: float,
+        breaker: CircuitBreaker,
+        bucket: str = RESUME_BUCKET
+    ):
+        self.api_url = f"{supabase_url.rstrip('/')}/storage/v1"
+        self.api_key = api_key
+        self.bucket = bucket
+        self.limits = limits
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.upload_timeout = upload_timeout
+        self.delete_timeout = delete_timeout
+        self.breaker = breaker
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def start(self):
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "apikey": self.api_key
+                },
+                timeout=self._timeout(self.read_timeout),
+                limits=self.limits
+            )
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared pooled HTTP client (opened by start())."""
+        if self._client is None:
+            raise RuntimeError("Storage client is not started (see start_storage_backend)")
+        return self._client
+
+    def _timeout(self, seconds: float) -> httpx.Timeout:
+        # Waiting for a pooled connection is bounded like connecting
+        return httpx.Timeout(seconds, connect=self.connect_timeout, pool=self.connect_timeout)
+
+    async def upload(self, storage_path, chunks, content_type, size=None):
+        # Paths are content-addressed, so overwriting an existing object is harmless
+        headers = {"Content-Type": content_type, "x-upsert": "true"}
+        if size is not None:
+            headers["Content-Length"] = str(size)
+
+        async with self.breaker.guard():
+            with anyio.fail_after(self.upload_timeout):
+                response = await self.client.post(
+                    f"{self.api_url}/object/{self.bucket}/{quote(storage_path)}",
+                    content=chunks,
+                    headers=headers,
+                    timeout=self._timeout(self.upload_timeout)
+                )
+                response.raise_for_status()
+
+    async def delete(self, storage_paths):
+        if not storage_paths:
+            return
+        async with self.breaker.guard():
+            with anyio.fail_after(self.delete_timeout):
+                response = await self.client.request(
+                    "DELETE",
+                    f"{self.api_url}/object/{self.bucket}",
+                    json={"prefixes": storage_paths},
+                    timeout=self._timeout(self.delete_timeout)
+                )
+                response.raise_for_status()
+
+    def url(self, storage_path):
+        return f"{self.api_url}/object/public/{self.bucket}/{storage_path}"
+
+    async def open(self, storage_path):
+        # No overall deadline (large files take a while); each read is bounded
+        async with self.breaker.guard():
+            async with self.client.stream("GET", self.url(storage_path)) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes(READ_CHUNK_SIZE):
+                    yield chunk
+
+    def response(self, storage_path):
+        return RedirectResponse(self.url(storage_path))
+
+    def stats(self):
+        return {**super().stats(), "circuit": self.breaker.stats()}
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    Files on local disk, served by this API under /files/{bucket}/.
+
+    For offline development, load tests and single-node deployments.
+    """
+
+    def __init__(self, root: str, public_url: str, bucket: str = RESUME_BUCKET, accel_redirect: str = ""):
+        self.root = Path(root).resolve()
+        self.public_url = public_url.rstrip("/")
+        self.bucket = bucket
+        self.accel_redirect = accel_redirect.rstrip("/")
+
+    def path_for(self, storage_path: str) -> Path:
+        """
+        Resolve a storage path to a file under the storage root.
+
+        Raises:
+            FileNotFoundError: If the path escapes the storage root
+        """
+        path = (self.root / self.bucket / storage_path).resolve()
+        if self.root / self.bucket not in path.parents:
+            raise FileNotFoundError(storage_path)
+        return path
+
+    async def upload(self, storage_path, chunks, content_type, size=None):
+        path = self.path_for(storage_path)
+        await anyio.Path(path.parent).mkdir(parents=True, exist_ok=True)
+
+        # Write to a temp file and rename, so readers never see partial files
+        tmp_path = path.with_name(f".{uuid.uuid4()}.part")
+        try:
+            async with await anyio.open_file(tmp_path, "wb") as f:
+                async for chunk in chunks:
+                    await f.write(chunk)
+            await anyio.to_thread.run_sync(os.replace, tmp_path, path)
+        finally:
+            await anyio.Path(tmp_path).unlink(missing_ok=True)
+
+    async def delete(self, storage_paths):
+        for storage_path in storage_paths:
+            await anyio.Path(self.path_for(storage_path)).unlink(missing_ok=True)
+
+    def url(self, storage_path):
+        return f"{self.public_url}/files/{self.bucket}/{storage_path}"
+
+    async def open(self, storage_path):
+        async with await anyio.open_file(self.path_for(storage_path), "rb") as f:
+            while chunk := await f.read(READ_CHUNK_SIZE):
+                yield chunk
+
+    def response(self, storage_path):
+        path = self.path_for(storage_path)
+        if not path.is_file():
+            raise FileNotFoundError(storage_path)
+        if self.accel_redirect:
+            # nginx sends the file itself (sendfile, no copy through the app)
+            relative = path.relative_to(self.root).as_posix()
+            return Response(
+                headers={"X-Accel-Redirect": f"{self.accel_redirect}/{relative}"},
+                media_type=mimetypes.guess_type(path.name)[0]
+            )
+        # Streamed by the app in chunks: uvicorn has no zero-copy file sending
+        return FileResponse(path)
+
+
+def is_storage_failure(error: Exception) -> bool:
+    """Errors that mean storage itself is unhealthy (timeouts, 5xx, throttling)."""
+    if isinstance(error, (httpx.TransportError, TimeoutError)):
+        return True
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500 or error.response.status_code == 429
+    return False
+
+
+def _create_backend() -> StorageBackend:
+    if settings.STORAGE_BACKEND == "local":
+        return LocalStorageBackend(
+            settings.LOCAL_STORAGE_DIR,
+            settings.PUBLIC_API_URL,
+            accel_redirect=settings.LOCAL_STORAGE_ACCEL_REDIRECT
+        )
+    if settings.STORAGE_BACKEND == "supabase":
+        return SupabaseStorageBackend(
+            settings.SUPABASE_URL,
+            settings.SUPABASE_KEY,
+            limits=httpx.Limits(
+                max_connections=settings.STORAGE_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.STORAGE_MAX_CONNECTIONS
+            ),
+            connect_timeout=settings.STORAGE_CONNECT_TIMEOUT,
+            read_timeout=settings.STORAGE_READ_TIMEOUT,
+            upload_timeout=settings.STORAGE_UPLOAD_TIMEOUT,
+            delete_timeout=settings.STORAGE_DELETE_TIMEOUT,
+            breaker=CircuitBreaker(
+                "File storage",
+                settings.STORAGE_CIRCUIT_FAILURES,
+                settings.STORAGE_CIRCUIT_RESET_SECONDS,
+                is_storage_failure
+            )
+        )
+    raise ValueError(f"Unknown STORAGE_BACKEND: {settings.STORAGE_BACKEND}")
+
+
+_backend: Optional[StorageBackend] = None
+
+
+async def start_storage_backend() -> StorageBackend:
+    """Build the backend selected by settings.STORAGE_BACKEND and open its client (app startup)."""
+    global _backend
+    if _backend is None:
+        backend = _create_backend()
+        await backend.start()
+        _backend = backend
+    return _backend
+
+
+async def stop_storage_backend() -> None:
+    """Close the backend's connections (app shutdown)."""
+    global _backend
+    if _backend is not None:
+        await _backend.close()
+        _backend = None
+
+
+def get_storage_backend() -> StorageBackend:
+    """
+    Return the storage backend opened at startup.
+
+    Raises:
+        RuntimeError: If called outside the app lifespan
+    """
+    if _backend is None:
+        raise RuntimeError("Storage backend is not started (see start_storage_backend)")
+    return _backend
@@ -0,0 +1,214 @@
+"""
+Background removal of orphaned resume files from storage.
+
+Deleting a resume queues the files whose last reference was dropped in the
+storage_deletions outbox, in the same transaction as the row delete, so the
+request returns as soon as the database commits. One worker task per process
+drains the outbox: it leases a batch of due rows, removes their files with a
+single storage call, and deletes the rows. Failed batches are retried with
+exponential backoff; nothing is dropped.
+
+The leased rows stay locked (FOR UPDATE) on the worker's own connection
+until the files are gone. An upload of the same content first cancels its
+path's queued removal in a short transaction (cancel_deletion): rows it
+takes are skipped by the worker, and while the worker holds the row the
+upload waits outside any transaction and retries. Either way a live file
+is never removed, and uploads never hold a connection while storage works.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlmodel import col, delete, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.database import engine
+from app.resumes.backends import get_storage_backend
+from app.resumes.models import StorageDeletion, StorageObject
+
+logger = logging.getLogger(__name__)
+
+# Files removed per storage call
+CLEANUP_BATCH_SIZE = 100
+
+# Idle polling interval (deletes also wake the worker immediately)
+CLEANUP_POLL_SECONDS = 30
+
+# Claimed rows stay invisible to other workers this long, then are retried
+# (covers a worker dying mid-batch)
+CLEANUP_LEASE_SECONDS = 300
+
+# Retry delay after the Nth failed attempt: base * 2^(N-1), capped
+CLEANUP_BACKOFF_BASE_SECONDS = 10
+CLEANUP_BACKOFF_MAX_SECONDS = 3600
+
+
+def backoff_seconds(attempts: int) -> int:
+    """Delay before retrying a deletion that has failed `attempts` times."""
+    return min(CLEANUP_BACKOFF_BASE_SECONDS * 2 ** max(attempts - 1, 0), CLEANUP_BACKOFF_MAX_SECONDS)
+
+
+async def claim_batch(session: AsyncSession, limit: int) -> List[StorageDeletion]:
+    """
+    Lease up to `limit` due deletions (caller commits).
+    
+    Rows are pushed CLEANUP_LEASE_SECONDS into the future and their attempt
+    count bumped in one UPDATE ... RETURNING; SKIP LOCKED lets several
+    workers drain the outbox without taking the same rows.
+    """
+    now = datetime.utcnow()
+    
+    # Content uploaded again after it was orphaned must be kept
+    await session.exec(
+        delete(StorageDeletion).where(
+            col(StorageDeletion.path).in_(select(StorageObject.path))
+        )
+    )
+    
+    due = select(StorageDeletion.id).where(
+        StorageDeletion.next_attempt_at <= now
+    ).order_by(StorageDeletion.next_attempt_at).limit(limit).with_for_update(skip_locked=True)
+    
+    statement = (
+        update(StorageDeletion)
+        .where(col(StorageDeletion.id).in_(due))
+        .values(
+            attempts=StorageDeletion.attempts + 1,
+            next_attempt_at=now + timedelta(seconds=CLEANUP_LEASE_SECONDS)
+        )
+        .returning(StorageDeletion)
+    )
+    return list((await session.exec(statement)).scalars().all())
+
+
+async def lock_batch(session: AsyncSession, batch: List[StorageDeletion]) -> List[StorageDeletion]:
+    """
+    Lock leased rows for the storage call and keep only files still orphaned.
+    
+    Rows already locked by an upload of the same content (SKIP LOCKED) are
+    left alone; rows whose path is referenced again are deleted. The caller
+    keeps the transaction open until the files are removed.
+    """
+    statement = select(StorageDeletion).where(
+        col(StorageDeletion.id).in_([row.id for row in batch])
+    ).with_for_update(skip_locked=True)
+    locked = list((await session.exec(statement)).all())
+    if not locked:
+        return locked
+    
+    in_use = set((await session.exec(
+        select(StorageObject.path).where(col(StorageObject.path).in_([row.path for row in locked]))
+    )).all())
+    if in_use:
+        await session.exec(
+            delete(StorageDeletion).where(
+                col(StorageDeletion.id).in_([row.id for row in locked if row.path in in_use])
+            )
+        )
+    return [row for row in locked if row.path not in in_use]
+
+
+async def cancel_deletion(session: AsyncSession, storage_path: str) -> bool:
+    """
+    Drop queued removals of a file that is being stored again (caller commits).
+    
+    Never waits on the worker's row locks.
+    
+    Returns:
+        False while a cleanup batch holds the row (it is removing the file
+        right now): commit, wait and retry instead of uploading into it
+    """
+    unlocked = select(StorageDeletion.id).where(
+        StorageDeletion.path == storage_path
+    ).with_for_update(skip_locked=True)
+    await session.exec(delete(StorageDeletion).where(col(StorageDeletion.id).in_(unlocked)))
+    
+    in_flight = await session.exec(select(StorageDeletion.id).where(StorageDeletion.path == storage_path))
+    return in_flight.first() is None
+
+
+class StorageCleanupWorker:
+    """Drains the storage_deletions outbox in a background task."""
+
+    def __init__(self):
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def start(self) -> None:
+        """Start the worker task (call at app startup)."""
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def wake(self) -> None:
+        """Drain now instead of at the next poll (call after committing deletions)."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def drain(self) -> int:
+        """
+        Remove due files until the outbox has none left or a batch fails.
+        
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        while True:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                batch = await claim_batch(session, CLEANUP_BATCH_SIZE)
+                await session.commit()
+                if not batch:
+                    return removed
+                
+                # Held until commit, so a re-upload of these files waits for us
+                batch = await lock_batch(session, batch)
+                if not batch:
+                    await session.commit()
+                    continue
+                
+                paths = sorted({row.path for row in batch})
+                try:
+                    await get_storage_backend().delete(paths)
+                except Exception as e:
+                    now = datetime.utcnow()
+                    last_error = str(e)[:500]
+                    for row in batch:
+                        row.next_attempt_at = now + timedelta(seconds=backoff_seconds(row.attempts))
+                        row.last_error = last_error
+                    session.add_all(batch)
+                    await session.commit()
+                    attempts = max(row.attempts for row in batch)
+                    logger.warning(
+                        "Storage cleanup of %d files failed (attempt %d), retrying in %ds: %s",
+                        len(paths), attempts, backoff_seconds(attempts), last_error
+                    )
+                    return removed
+                
+                await session.exec(
+                    delete(StorageDeletion).where(col(StorageDeletion.id).in_([row.id for row in batch]))
+                )
+                await session.commit()
+                removed += len(paths)
+
+    async def _run(self) -> None:
+        while True:
+            # Cleared before draining, so a wake() during the drain triggers another
+            self._wakeup.clear()
+            try:
+                await self.drain()
+            except Exception:
+                logger.exception("Storage cleanup error")
+            
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), CLEANUP_POLL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+
+storage_cleanup = StorageCleanupWorker()
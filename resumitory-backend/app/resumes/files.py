@@ -0,0 +1,22 @@
+from fastapi import APIRouter, HTTPException, status
+
+from app.resumes.backends import RESUME_BUCKET, get_storage_backend
+
+router = APIRouter()
+
+
+@router.get(f"/{RESUME_BUCKET}/{{storage_path:path}}")
+async def get_file(storage_path: str):
+    """
+    Serve a stored resume file.
+    
+    With the local backend the file is sent straight from disk; with
+    Supabase Storage this redirects to the public object URL.
+    """
+    try:
+        return get_storage_backend().response(storage_path)
+    except FileNotFoundError:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="File not found"
+        )
@@ -1,7 +1,7 @@
 from sqlmodel import SQLModel, Field, Column
 from sqlalchemy import JSON
 from datetime import datetime
-from typing import Optional, List
+from typing import Dict, Optional, List
 from uuid import UUID, uuid4
 
 
@@ -24,6 +24,50 @@ class Resume(ResumeBase, table=True):
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
 
+class StorageObject(SQLModel, table=True):
+    """Content-addressed file in storage, shared by every resume that references it."""
+    __tablename__ = "storage_objects"
+    
+    path: str = Field(primary_key=True, description="Storage path ({user_id}/{sha256}.{ext})")
+    user_id: UUID = Field(..., foreign_key="auth.users.id", index=True)
+    sha256: Optional[str] = Field(default=None, description="SHA-256 of the file content")
+    size_bytes: Optional[int] = Field(default=None)
+    ref_count: int = Field(default=1, description="Number of resume rows pointing at this file")
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class StorageDeletion(SQLModel, table=True):
+    """Pending removal of an orphaned file from storage (outbox drained by the cleanup worker)."""
+    __tablename__ = "storage_deletions"
+    
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    path: str = Field(..., index=True, description="Storage path of the file to remove")
+    attempts: int = Field(default=0, description="Removal attempts so far")
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    last_error: Optional[str] = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class ResumeStats(SQLModel, table=True):
+    """
+    Per-resume application counts, maintained by database triggers.
+    
+    Written only by the triggers on applications (database_setup.sql, Step 15).
+    """
+    __tablename__ = "resume_stats"
+    
+    resume_id: UUID = Field(primary_key=True, foreign_key="resumes.id")
+    user_id: UUID = Field(..., foreign_key="auth.users.id", index=True)
+    applied: int = Field(default=0)
+    interview: int = Field(default=0)
+    offer: int = Field(default=0)
+    rejected: int = Field(default=0)
+    archived: int = Field(default=0)
+    interviewed: int = Field(default=0, description="Applications that ever reached interview or offer")
+    days_to_interview: int = Field(default=0, description="Sum of days from applying to first interview")
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class ResumeCreate(ResumeBase):
     """Schema for creating a new resume (multipart form data handled separately)."""
     tags: Optional[List[str]] = None
@@ -46,3 +90,36 @@ class ResumeResponse(ResumeBase):
     
     class Config:
         from_attributes = True
+
+
+class ResumeListItem(SQLModel):
+    """One resume in GET /resumes: only the fields requested with `fields=` (all by default), always `id`."""
+    id: UUID
+    user_id: Optional[UUID] = None
+    name: Optional[str] = None
+    notes: Optional[str] = None
+    pdf_url: Optional[str] = None
+    tex_url: Optional[str] = None
+    tags: Optional[List[str]] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class ResumePage(SQLModel):
+    """One page of resumes with the cursor for the next page."""
+    items: List[ResumeListItem]
+    next_cursor: Optional[str] = None
+
+
+class ResumeAnalytics(SQLModel):
+    """Conversion analytics for one resume."""
+    resume_id: UUID
+    name: str
+    total: int = Field(..., description="Applications linked to this resume")
+    by_status: Dict[str, int] = Field(..., description="Application count per status")
+    response_rate: float = Field(..., description="Share of applications that got an interview, offer or rejection")
+    interview_rate: float = Field(..., description="Share of applications that reached interview or offer")
+    offer_rate: float = Field(..., description="Share of applications with an offer")
+    avg_days_to_interview: Optional[float] = Field(
+        default=None, description="Average days from applying to first interview"
+    )
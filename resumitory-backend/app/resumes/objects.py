@@ -0,0 +1,177 @@
+"""Reference counting for content-addressed resume files."""
+import asyncio
+import time
+from sqlalchemy.dialects.postgresql import insert as postgres_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import update, delete
+from sqlmodel.ext.asyncio.session import AsyncSession
+from fastapi import HTTPException, UploadFile
+from typing import List, Optional
+from uuid import UUID
+
+from app.config import settings
+from app.database import is_postgres
+from app.resumes.cleanup import cancel_deletion
+from app.resumes.models import StorageDeletion, StorageObject
+
+# Wait between checks while a cleanup batch is removing the same content
+REMOVAL_POLL_SECONDS = 0.2
+from app.resumes.storage import (
+    content_storage_path,
+    storage_path_from_url,
+    hash_file,
+    upload_file,
+    get_file_url
+)
+
+
+async def _add_reference(session: AsyncSession, storage_path: str) -> bool:
+    """Increment the refcount of a tracked object; False if it isn't tracked."""
+    result = await session.exec(
+        update(StorageObject)
+        .where(StorageObject.path == storage_path)
+        .values(ref_count=StorageObject.ref_count + 1)
+    )
+    return result.rowcount > 0
+
+
+async def _insert_object(session: AsyncSession, storage_path: str, user_id: UUID, digest: str, size: int) -> None:
+    """
+    Track a newly uploaded object with one reference.
+    
+    Two identical uploads can both miss _add_reference and upload; the
+    second INSERT then takes a reference instead of failing on the primary key.
+    """
+    insert = postgres_insert if is_postgres(session) else sqlite_insert
+    statement = insert(StorageObject).values(
+        path=storage_path,
+        user_id=user_id,
+        sha256=digest,
+        size_bytes=size,
+        ref_count=1
+    ).on_conflict_do_update(
+        index_elements=[StorageObject.path],
+        set_={"ref_count": StorageObject.ref_count + 1}
+    )
+    await session.exec(statement)
+
+
+async def _cancel_removal(session: AsyncSession, storage_path: str) -> None:
+    """
+    Make sure no queued removal of storage_path runs after it is uploaded.
+    
+    Raises:
+        HTTPException: 503 if a removal is still in progress after the storage delete deadline
+    """
+    deadline = time.monotonic() + settings.STORAGE_DELETE_TIMEOUT + 1
+    while True:
+        cancelled = await cancel_deletion(session, storage_path)
+        await session.commit()
+        if cancelled:
+            return
+        if time.monotonic() > deadline:
+            raise HTTPException(
+                status_code=503,
+                detail="This file is being removed from storage, please retry"
+            )
+        await asyncio.sleep(REMOVAL_POLL_SECONDS)
+
+
+async def store_resume_file(
+    session: AsyncSession,
+    file: UploadFile,
+    user_id: UUID,
+    file_type: str,
+    max_size_mb: int
+) -> str:
+    """
+    Store an uploaded file by content hash and take a reference to it.
+    
+    If the user already has a file with the same SHA-256, the storage write
+    is skipped entirely and only the refcount is bumped. Otherwise the
+    spooled file is read a second time to upload it (the storage path
+    depends on the hash).
+    
+    No transaction is open during the upload: the reference is taken in its
+    own short transaction, committed here, so a slow storage call does not
+    hold a pooled connection. Call it before adding anything to the session,
+    and release the reference if the request fails afterwards.
+    
+    Args:
+        session: Database session (committed here)
+        file: The uploaded file (PDF or .tex)
+        user_id: User's UUID for scoped storage path
+        file_type: 'pdf' or 'tex'
+        max_size_mb: Maximum allowed size in MB
+        
+    Returns:
+        Public URL of the stored file
+    """
+    digest, size = await hash_file(file, max_size_mb)
+    storage_path = content_storage_path(str(user_id), digest, file_type)
+    
+    added = await _add_reference(session, storage_path)
+    await session.commit()
+    if added:
+        return await get_file_url(storage_path)
+    
+    # The same content may have been orphaned and queued for removal: cancel
+    # that first, and if a cleanup batch is removing it right now, let the
+    # removal finish before uploading (polling, with no transaction open)
+    await _cancel_removal(session, storage_path)
+    
+    url = await upload_file(file, storage_path, file_type, max_size_mb)
+    await _insert_object(session, storage_path, user_id, digest, size)
+    await session.commit()
+    return url
+
+
+async def retain_resume_files(session: AsyncSession, file_urls: List[Optional[str]]) -> None:
+    """Take one more reference on each file (used when a resume is cloned)."""
+    for file_url in file_urls:
+        storage_path = storage_path_from_url(file_url) if file_url else None
+        if storage_path:
+            await _add_reference(session, storage_path)
+
+
+async def release_resume_files(session: AsyncSession, file_urls: List[Optional[str]]) -> List[str]:
+    """
+    Drop one reference on each file.
+    
+    Files whose last reference is dropped are queued in the storage_deletions
+    outbox, in the same transaction, for the cleanup worker to remove.
+    
+    Args:
+        session: Database session (caller commits)
+        file_urls: Public URLs held by the resume being deleted
+        
+    Returns:
+        Storage paths queued for removal
+    """
+    orphaned = []
+    for file_url in file_urls:
+        storage_path = storage_path_from_url(file_url) if file_url else None
+        if not storage_path:
+            continue
+        
+        # Last reference: drop the row and queue the file for removal
+        result = await session.exec(
+            delete(StorageObject).where(
+                StorageObject.path == storage_path,
+                StorageObject.ref_count <= 1
+            )
+        )
+        if result.rowcount > 0:
+            session.add(StorageDeletion(path=storage_path))
+            orphaned.append(storage_path)
+            continue
+        
+        # Otherwise just drop ours. Untracked files (uploaded before refcounts
+        # were backfilled) may still be shared by a clone, so they are kept.
+        await session.exec(
+            update(StorageObject)
+            .where(StorageObject.path == storage_path)
+            .values(ref_count=StorageObject.ref_count - 1)
+        )
+    
+    return orphaned
@@ -1,20 +1,39 @@
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, status
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Optional, List
 from uuid import UUID
+from datetime import datetime
 
 from app.database import get_session
-from app.auth.dependencies import get_current_user
-from app.resumes.models import Resume, ResumeCreate, ResumeUpdate, ResumeResponse
+from app.cache import response_cache
+from app.events.broker import event_broker
+from app.etag import collection_version, etag_matches, make_etag, not_modified, set_etag
+from app.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate, split_page
+from app.auth.dependencies import CurrentUser, get_current_user
+from app.repository import delete_owned, get_owned, update_owned
+from app.resumes.models import Resume, ResumeCreate, ResumeUpdate, ResumeResponse, ResumePage, ResumeAnalytics
+from app.resumes.analytics import resume_analytics
+from app.serialization import JSONBodyResponse, dump_json, parse_fields, row_dicts, table_columns
+from app.sync.models import EntityEnum
+from app.sync.tombstones import record_deletions
 from app.resumes.storage import (
-    upload_file,
-    delete_file,
     validate_file_size,
     validate_file_type
 )
+from app.resumes.cleanup import storage_cleanup
+from app.resumes.objects import (
+    store_resume_file,
+    retain_resume_files,
+    release_resume_files
+)
 
 router = APIRouter()
 
+# Fields GET /resumes can return with ?fields=
+LIST_FIELDS = list(ResumeResponse.model_fields)
+
 
 @router.post("/", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
 async def create_resume(
@@ -23,8 +42,8 @@ async def create_resume(
     tags: Optional[str] = Form(None, description="Comma-separated tags"),
     pdf_file: UploadFile = File(..., description="PDF file (required)"),
     tex_file: Optional[UploadFile] = File(None, description="LaTeX .tex file (optional)"),
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
     Upload a new resume with PDF (required) and optional .tex file.
@@ -35,70 +54,153 @@ async def create_resume(
     - **pdf_file**: PDF file (max 5MB)
     - **tex_file**: Optional LaTeX source file (max 1MB)
     """
-    # Validate PDF file
+    # Validate both files before storing either
     await validate_file_type(pdf_file, ['pdf'])
     await validate_file_size(pdf_file, max_size_mb=5)
-    
-    # Upload PDF
-    pdf_url = await upload_file(pdf_file, user_id, 'pdf')
-    
-    # Upload .tex if provided
-    tex_url = None
     if tex_file:
         await validate_file_type(tex_file, ['tex'])
         await validate_file_size(tex_file, max_size_mb=1)
-        tex_url = await upload_file(tex_file, user_id, 'tex')
-    
-    # Parse tags
-    tag_list = [tag.strip() for tag in tags.split(',')] if tags else None
-    
-    # Create resume record
-    resume = Resume(
-        user_id=UUID(user_id),
-        name=name,
-        notes=notes,
-        pdf_url=pdf_url,
-        tex_url=tex_url,
-        tags=tag_list
-    )
     
-    session.add(resume)
-    session.commit()
-    session.refresh(resume)
+    # Upload PDF (skipped if the user already stored identical content).
+    # References are committed as each file is stored, so they are released
+    # again if the resume is not created
+    pdf_url = await store_resume_file(session, pdf_file, user.id, 'pdf', max_size_mb=5)
+    tex_url = None
+    try:
+        # Upload .tex if provided
+        if tex_file:
+            tex_url = await store_resume_file(session, tex_file, user.id, 'tex', max_size_mb=1)
+        
+        # Parse tags
+        tag_list = [tag.strip() for tag in tags.split(',')] if tags else None
+        
+        # Create resume record
+        resume = Resume(
+            user_id=user.id,
+            name=name,
+            notes=notes,
+            pdf_url=pdf_url,
+            tex_url=tex_url,
+            tags=tag_list
+        )
+        
+        session.add(resume)
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        if await release_resume_files(session, [pdf_url, tex_url]):
+            storage_cleanup.wake()
+        await session.commit()
+        raise
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "resume", "created", [resume.id])
     
     return resume
 
 
-@router.get("/", response_model=List[ResumeResponse])
+# Encoded by dump_json and returned as is; ResumePage documents the sparse shape
+@router.get("/", response_model=None, response_class=JSONBodyResponse, responses={200: {"model": ResumePage}})
 async def list_resumes(
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    request: Request,
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return (id is always included)"),
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
-    Get all resumes for the authenticated user.
+    Get a page of resumes for the authenticated user.
     
     Returns resumes ordered by creation date (newest first).
+    Pass `next_cursor` back as `cursor` to fetch the next page.
+    Pass `fields` (e.g. `id,name,tags`) to read and return only those columns.
+    Supports If-None-Match: answers 304 when nothing has changed.
     """
-    statement = select(Resume).where(
-        Resume.user_id == UUID(user_id)
-    ).order_by(Resume.created_at.desc())
+    selected = parse_fields(fields, LIST_FIELDS)
+    fields_key = ",".join(selected)
+    
+    version = await collection_version(session, user.id, include_applications=False)
+    etag = make_etag(version, cursor, limit, fields_key)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    # The encoded page is cached, so a hit is returned without decoding
+    cache_key = f"resumes:page:{cursor}|{limit}|{fields_key}"
+    body, generation = await response_cache.get(user.id, cache_key)
+    if body is None:
+        columns = table_columns(Resume, selected)
+        # The keyset cursor needs the sort key even when the client did not ask for it
+        if "created_at" not in selected:
+            columns.append(Resume.created_at)
+        
+        statement = paginate(
+            select(*columns).where(Resume.user_id == user.id),
+            Resume.created_at,
+            Resume.id,
+            cursor,
+            limit,
+            datetime.fromisoformat
+        )
+        
+        rows = (await session.exec(statement)).all()
+        rows, next_cursor = split_page(
+            rows, limit, lambda row: (row.created_at, row.id)
+        )
+        items = row_dicts(rows)
+        if "created_at" not in selected:
+            for item in items:
+                del item["created_at"]
+        
+        body = dump_json({"items": items, "next_cursor": next_cursor})
+        await response_cache.set(user.id, cache_key, body, generation)
+    
+    response = JSONBodyResponse(body)
+    set_etag(response, etag)
+    return response
+
+
+@router.get("/analytics", response_model=List[ResumeAnalytics])
+async def get_resume_analytics(
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Get conversion analytics per resume: which versions get interviews and offers.
     
-    resumes = session.exec(statement).all()
-    return resumes
+    For each resume:
+    - Application counts by status
+    - Response, interview and offer rates
+    - Average days from applying to first interview
+    
+    Served from the resume_stats summary table (maintained as applications
+    change), so cost does not grow with the number of applications.
+    """
+    cache_key = "resumes:analytics"
+    cached, generation = await response_cache.get(user.id, cache_key)
+    if cached is not None:
+        return cached
+    
+    analytics = await resume_analytics(session, user.id)
+    await response_cache.set(user.id, cache_key, jsonable_encoder(analytics), generation)
+    
+    return analytics
 
 
 @router.get("/{resume_id}", response_model=ResumeResponse)
 async def get_resume(
     resume_id: str,
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    request: Request,
+    response: Response,
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
     Get a specific resume by ID.
     
     Returns 404 if resume doesn't exist or doesn't belong to user.
+    Supports If-None-Match: answers 304 when the resume hasn't changed.
     """
-    resume = session.get(Resume, UUID(resume_id))
+    resume = await get_owned(session, Resume, UUID(resume_id), user.id)
     
     if not resume:
         raise HTTPException(
@@ -106,11 +208,10 @@ async def get_resume(
             detail="Resume not found"
         )
     
-    if str(resume.user_id) != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to access this resume"
-        )
+    etag = make_etag(str(resume.id), resume.updated_at.isoformat())
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
     
     return resume
 
@@ -119,8 +220,8 @@ async def get_resume(
 async def update_resume(
     resume_id: str,
     resume_update: ResumeUpdate,
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
     Update resume metadata (name, notes, tags).
@@ -128,7 +229,10 @@ async def update_resume(
     Note: This does NOT update the PDF or .tex files.
     To change files, delete and re-upload the resume.
     """
-    resume = session.get(Resume, UUID(resume_id))
+    # Update only provided fields (and the timestamp) in one UPDATE ... RETURNING
+    update_data = resume_update.model_dump(exclude_unset=True)
+    update_data["updated_at"] = datetime.utcnow()
+    resume = await update_owned(session, Resume, UUID(resume_id), user.id, update_data)
     
     if not resume:
         raise HTTPException(
@@ -136,24 +240,9 @@ async def update_resume(
             detail="Resume not found"
         )
     
-    if str(resume.user_id) != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to update this resume"
-        )
-    
-    # Update only provided fields
-    update_data = resume_update.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(resume, key, value)
-    
-    # Update timestamp
-    from datetime import datetime
-    resume.updated_at = datetime.utcnow()
-    
-    session.add(resume)
-    session.commit()
-    session.refresh(resume)
+    await session.commit()
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "resume", "updated", [resume.id])
     
     return resume
 
@@ -161,15 +250,19 @@ async def update_resume(
 @router.delete("/{resume_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_resume(
     resume_id: str,
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
     Delete a resume and its associated files from storage.
     
+    Files shared with other resumes (clones, duplicate uploads) are kept
+    until the last resume referencing them is deleted. Files are removed
+    from storage by a background worker after the response.
     This action cannot be undone.
     """
-    resume = session.get(Resume, UUID(resume_id))
+    # Delete the record, then drop its file references
+    resume = await delete_owned(session, Resume, UUID(resume_id), user.id)
     
     if not resume:
         raise HTTPException(
@@ -177,20 +270,16 @@ async def delete_resume(
             detail="Resume not found"
         )
     
-    if str(resume.user_id) != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to delete this resume"
-        )
-    
-    # Delete files from storage
-    await delete_file(resume.pdf_url)
-    if resume.tex_url:
-        await delete_file(resume.tex_url)
+    # Files no other resume references are queued for removal in this transaction
+    orphaned_paths = await release_resume_files(session, [resume.pdf_url, resume.tex_url])
+    record_deletions(session, user.id, EntityEnum.resume, [resume.id])
+    await session.commit()
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "resume", "deleted", [resume.id])
     
-    # Delete database record
-    session.delete(resume)
-    session.commit()
+    # Removed from storage in the background, off the request path
+    if orphaned_paths:
+        storage_cleanup.wake()
     
     return None
 
@@ -198,16 +287,17 @@ async def delete_resume(
 @router.post("/{resume_id}/clone", response_model=ResumeResponse, status_code=status.HTTP_201_CREATED)
 async def clone_resume(
     resume_id: str,
-    session: Session = Depends(get_session),
-    user_id: str = Depends(get_current_user)
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
 ):
     """
     Clone an existing resume (creates a copy with " (Copy)" appended to name).
     
-    The cloned resume references the same files (no re-upload needed).
+    The cloned resume references the same files (no re-upload needed);
+    their reference counts are bumped so deleting either copy keeps them.
     This is useful for creating variations from existing versions.
     """
-    original = session.get(Resume, UUID(resume_id))
+    original = await get_owned(session, Resume, UUID(resume_id), user.id)
     
     if not original:
         raise HTTPException(
@@ -215,15 +305,9 @@ async def clone_resume(
             detail="Resume not found"
         )
     
-    if str(original.user_id) != user_id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Not authorized to clone this resume"
-        )
-    
     # Create clone
     clone = Resume(
-        user_id=UUID(user_id),
+        user_id=user.id,
         name=f"{original.name} (Copy)",
         notes=original.notes,
         pdf_url=original.pdf_url,
@@ -232,7 +316,9 @@ async def clone_resume(
     )
     
     session.add(clone)
-    session.commit()
-    session.refresh(clone)
+    await retain_resume_files(session, [clone.pdf_url, clone.tex_url])
+    await session.commit()
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "resume", "created", [clone.id])
     
     return clone
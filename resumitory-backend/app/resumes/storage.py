@@ -1,88 +1,150 @@
-from supabase import create_client, Client
-from app.config import settings
-import uuid
-from typing import Optional
+from app.circuit import CircuitOpenError
+from app.resumes.backends import RESUME_BUCKET, get_storage_backend
+import hashlib
+import httpx
+from typing import AsyncIterator, Optional, Tuple
 from fastapi import UploadFile, HTTPException
 
 
-# Initialize Supabase client
-supabase: Client = create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+# Bytes read from the spooled upload per chunk
+UPLOAD_CHUNK_SIZE = 64 * 1024
 
-# Storage bucket name
-RESUME_BUCKET = "resumes"
+
+def _file_too_large(max_size_mb: int, size_bytes: int) -> HTTPException:
+    """Build the 400 error for an upload over the size limit."""
+    size_mb = size_bytes / (1024 * 1024)
+    return HTTPException(
+        status_code=400,
+        detail=f"File too large. Maximum size is {max_size_mb}MB, got {size_mb:.2f}MB"
+    )
+
+
+async def _iter_file_chunks(file: UploadFile, max_size_mb: int) -> AsyncIterator[bytes]:
+    """
+    Yield the upload in fixed-size chunks, enforcing the size limit as it goes.
+    
+    Raises:
+        HTTPException: As soon as more than max_size_mb has been read
+    """
+    max_bytes = max_size_mb * 1024 * 1024
+    total = 0
+    
+    await file.seek(0)
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > max_bytes:
+            raise _file_too_large(max_size_mb, total)
+        yield chunk
+
+
+def content_storage_path(user_id: str, digest: str, file_type: str) -> str:
+    """
+    Build the content-addressed storage path for a file.
+    
+    Paths stay scoped under the user's folder so storage policies still apply;
+    identical content uploaded by the same user maps to the same path.
+    """
+    return f"{user_id}/{digest}.{file_type}"
+
+
+def storage_path_from_url(file_url: str) -> Optional[str]:
+    """
+    Extract the storage path from a public file URL.
+    
+    Formats:
+    - https://xxx.supabase.co/storage/v1/object/public/resumes/{path}
+    - {PUBLIC_API_URL}/files/resumes/{path} (local backend)
+    
+    Returns:
+        Path inside the bucket, or None if the URL is not a resume storage URL
+    """
+    marker = f"/{RESUME_BUCKET}/"
+    if marker not in file_url:
+        return None
+    return file_url.split(marker)[-1]
+
+
+async def hash_file(file: UploadFile, max_size_mb: int = 5) -> Tuple[str, int]:
+    """
+    Compute the SHA-256 of an upload in one chunked pass.
+    
+    Reads from the spooled temp file, so the content is never held in memory
+    whole. The size limit is enforced during the same pass.
+    
+    Args:
+        file: The uploaded file
+        max_size_mb: Maximum allowed size in MB
+        
+    Returns:
+        (hex digest, size in bytes)
+        
+    Raises:
+        HTTPException: If file is too large
+    """
+    digest = hashlib.sha256()
+    size = 0
+    async for chunk in _iter_file_chunks(file, max_size_mb):
+        digest.update(chunk)
+        size += len(chunk)
+    return digest.hexdigest(), size
 
 
 async def upload_file(
     file: UploadFile,
-    user_id: str,
-    file_type: str
+    storage_path: str,
+    file_type: str,
+    max_size_mb: int = 5
 ) -> str:
     """
-    Upload file to Supabase Storage and return public URL.
+    Stream file to the configured storage backend and return public URL.
+    
+    The spooled upload is sent in chunks, so the file is never held in
+    memory whole and the event loop is not blocked during the transfer.
+    The size limit is enforced while streaming.
     
     Args:
         file: The uploaded file (PDF or .tex)
-        user_id: User's UUID for scoped storage path
+        storage_path: Destination path in the bucket (see content_storage_path)
         file_type: 'pdf' or 'tex'
+        max_size_mb: Maximum allowed size in MB
         
     Returns:
         Public URL of the uploaded file
         
     Raises:
-        HTTPException: If upload fails
+        HTTPException: If the file is too large or upload fails (503 while
+            storage is failing, 504 if the upload exceeds its deadline)
     """
+    backend = get_storage_backend()
+    
     try:
-        # Generate unique filename
-        file_extension = file.filename.split('.')[-1] if '.' in file.filename else file_type
-        unique_filename = f"{uuid.uuid4()}_{file.filename}"
-        storage_path = f"{user_id}/{unique_filename}"
-        
-        # Read file content
-        file_content = await file.read()
-        
-        # Upload to Supabase Storage
-        response = supabase.storage.from_(RESUME_BUCKET).upload(
-            path=storage_path,
-            file=file_content,
-            file_options={"content-type": file.content_type or f"application/{file_type}"}
+        await backend.upload(
+            storage_path,
+            _iter_file_chunks(file, max_size_mb),
+            content_type=file.content_type or f"application/{file_type}",
+            size=file.size
         )
         
-        # Get public URL
-        public_url = supabase.storage.from_(RESUME_BUCKET).get_public_url(storage_path)
-        
-        return public_url
-        
+    except HTTPException:
+        raise
+    except CircuitOpenError as e:
+        raise HTTPException(
+            status_code=503,
+            detail="File storage is temporarily unavailable",
+            headers={"Retry-After": str(e.retry_after)}
+        )
+    except (httpx.TimeoutException, TimeoutError):
+        raise HTTPException(
+            status_code=504,
+            detail="File upload timed out"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"File upload failed: {str(e)}"
         )
-
-
-async def delete_file(file_url: str) -> None:
-    """
-    Delete file from Supabase Storage.
     
-    Args:
-        file_url: Public URL of the file to delete
-        
-    Raises:
-        HTTPException: If deletion fails
-    """
-    try:
-        # Extract storage path from URL
-        # Format: https://xxx.supabase.co/storage/v1/object/public/resumes/{path}
-        if "/resumes/" not in file_url:
-            return  # Not a valid resume storage URL
-        
-        storage_path = file_url.split("/resumes/")[-1]
-        
-        # Delete from Supabase Storage
-        supabase.storage.from_(RESUME_BUCKET).remove([storage_path])
-        
-    except Exception as e:
-        # Log error but don't fail the request if file doesn't exist
-        print(f"File deletion warning: {str(e)}")
+    return backend.url(storage_path)
 
 
 async def get_file_url(storage_path: str) -> str:
@@ -95,12 +157,15 @@ async def get_file_url(storage_path: str) -> str:
     Returns:
         Public URL of the file
     """
-    return supabase.storage.from_(RESUME_BUCKET).get_public_url(storage_path)
+    return get_storage_backend().url(storage_path)
 
 
 async def validate_file_size(file: UploadFile, max_size_mb: int = 5) -> None:
     """
-    Validate file size before upload.
+    Reject files whose declared size is over the limit, without reading them.
+    
+    upload_file enforces the limit again while streaming, for uploads whose
+    size is not known up front.
     
     Args:
         file: The uploaded file
@@ -109,18 +174,8 @@ async def validate_file_size(file: UploadFile, max_size_mb: int = 5) -> None:
     Raises:
         HTTPException: If file is too large
     """
-    # Read file to get size
-    content = await file.read()
-    size_mb = len(content) / (1024 * 1024)
-    
-    # Reset file position for subsequent reads
-    await file.seek(0)
-    
-    if size_mb > max_size_mb:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Maximum size is {max_size_mb}MB, got {size_mb:.2f}MB"
-        )
+    if file.size is not None and file.size > max_size_mb * 1024 * 1024:
+        raise _file_too_large(max_size_mb, file.size)
 
 
 async def validate_file_type(file: UploadFile, allowed_types: list) -> None:
@@ -0,0 +1 @@
+"""Interview rounds module."""
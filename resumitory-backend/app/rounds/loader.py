@@ -0,0 +1,36 @@
+"""Batched loading of interview rounds for a set of applications."""
+from typing import Dict, Iterable, List
+from uuid import UUID
+
+from sqlmodel import col, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.rounds.models import InterviewRound
+
+
+async def load_rounds(
+    session: AsyncSession,
+    application_ids: Iterable[UUID]
+) -> Dict[UUID, List[InterviewRound]]:
+    """
+    Fetch the rounds of many applications in one query.
+    
+    A single WHERE application_id IN (...) (served by idx_rounds_application)
+    replaces one lookup per application. Callers pass ids they already
+    scoped to the user.
+    
+    Returns:
+        Rounds per application id, ordered by round_number; applications
+        without rounds map to an empty list
+    """
+    rounds: Dict[UUID, List[InterviewRound]] = {app_id: [] for app_id in application_ids}
+    if not rounds:
+        return rounds
+    
+    statement = select(InterviewRound).where(
+        col(InterviewRound.application_id).in_(list(rounds))
+    ).order_by(InterviewRound.application_id, InterviewRound.round_number)
+    
+    for interview_round in (await session.exec(statement)).all():
+        rounds[interview_round.application_id].append(interview_round)
+    return rounds
@@ -0,0 +1,62 @@
+from sqlmodel import SQLModel, Field, Column
+import sqlalchemy as sa
+from datetime import datetime, date
+from typing import Optional
+from uuid import UUID, uuid4
+from enum import Enum
+
+
+class RoundStatusEnum(str, Enum):
+    """Interview round status enum."""
+    scheduled = "scheduled"
+    completed = "completed"
+    cancelled = "cancelled"
+
+
+class InterviewRoundBase(SQLModel):
+    """Base model for InterviewRound with common fields."""
+    round_number: int = Field(..., ge=1, description="Position of the round in the process (1, 2, ...)")
+    round_type: str = Field(..., description="Kind of round (e.g., 'phone screen', 'onsite')")
+    scheduled_date: Optional[date] = Field(default=None, description="Date the round is scheduled for")
+    completed_date: Optional[date] = Field(default=None, description="Date the round took place")
+    notes: Optional[str] = Field(default=None, description="Optional notes about the round")
+    status: RoundStatusEnum = Field(default=RoundStatusEnum.scheduled, description="Current round status")
+
+
+class InterviewRound(InterviewRoundBase, table=True):
+    """Interview round database model with full schema."""
+    __tablename__ = "interview_rounds"
+    
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    application_id: UUID = Field(..., foreign_key="applications.id", index=True)
+    # TEXT with a CHECK constraint: bind plain strings, not ::roundstatusenum
+    status: RoundStatusEnum = Field(
+        default=RoundStatusEnum.scheduled,
+        sa_column=Column(sa.Enum(RoundStatusEnum, native_enum=False, create_constraint=False))
+    )
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class InterviewRoundCreate(InterviewRoundBase):
+    """Schema for adding a round to an application."""
+    pass
+
+
+class InterviewRoundUpdate(SQLModel):
+    """Schema for updating a round (all fields optional)."""
+    round_number: Optional[int] = Field(default=None, ge=1)
+    round_type: Optional[str] = None
+    scheduled_date: Optional[date] = None
+    completed_date: Optional[date] = None
+    notes: Optional[str] = None
+    status: Optional[RoundStatusEnum] = None
+
+
+class InterviewRoundResponse(InterviewRoundBase):
+    """Schema for interview round API responses."""
+    id: UUID
+    application_id: UUID
+    created_at: datetime
+    
+    class Config:
+        from_attributes = True
@@ -0,0 +1,206 @@
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlmodel import col, delete, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import List
+from uuid import UUID
+from datetime import datetime
+
+from app.database import get_session
+from app.cache import response_cache
+from app.events.broker import event_broker
+from app.auth.dependencies import CurrentUser, get_current_user
+from app.repository import update_owned
+from app.applications.models import Application
+from app.rounds.models import (
+    InterviewRound,
+    InterviewRoundCreate,
+    InterviewRoundUpdate,
+    InterviewRoundResponse
+)
+
+router = APIRouter()
+
+
+def _owned_by(user_id: UUID):
+    """WHERE clause limiting rounds to applications owned by the user."""
+    owned_applications = select(Application.id).where(Application.user_id == user_id)
+    return col(InterviewRound.application_id).in_(owned_applications)
+
+
+async def _touch_application(session: AsyncSession, application_id: UUID) -> None:
+    """Bump the parent application's last_updated so its ETags change with its rounds."""
+    await session.exec(
+        update(Application)
+        .where(Application.id == application_id)
+        .values(last_updated=datetime.utcnow())
+    )
+
+
+@router.get("/applications/{application_id}/rounds", response_model=List[InterviewRoundResponse])
+async def list_rounds(
+    application_id: str,
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    List an application's interview rounds, ordered by round number.
+    
+    Returns 404 if the application doesn't exist or doesn't belong to user.
+    """
+    # Owned application outer-joined to its rounds: ownership and rounds in one query
+    statement = select(Application.id, InterviewRound).outerjoin(
+        InterviewRound, InterviewRound.application_id == Application.id
+    ).where(
+        Application.id == UUID(application_id),
+        Application.user_id == user.id
+    ).order_by(InterviewRound.round_number)
+    rows = (await session.exec(statement)).all()
+    
+    if not rows:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
+    
+    return [interview_round for _, interview_round in rows if interview_round is not None]
+
+
+@router.post(
+    "/applications/{application_id}/rounds",
+    response_model=InterviewRoundResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def create_round(
+    application_id: str,
+    interview_round: InterviewRoundCreate,
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Add an interview round to an application.
+    
+    - **round_number**: Position in the process (1, 2, ...)
+    - **round_type**: Kind of round (e.g., "phone screen", "onsite")
+    - **scheduled_date** / **completed_date**: Optional dates
+    - **notes**: Optional notes
+    - **status**: scheduled (default), completed or cancelled
+    
+    Also updates the application's last_updated timestamp.
+    """
+    # Checks ownership and bumps last_updated in one statement
+    application = await update_owned(
+        session, Application, UUID(application_id), user.id, {"last_updated": datetime.utcnow()}
+    )
+    
+    if not application:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Application not found"
+        )
+    
+    db_round = InterviewRound(
+        **interview_round.model_dump(),
+        application_id=application.id
+    )
+    
+    session.add(db_round)
+    await session.commit()
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "application", "updated", [application.id])
+    
+    return db_round
+
+
+@router.get("/rounds/{round_id}", response_model=InterviewRoundResponse)
+async def get_round(
+    round_id: str,
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Get a specific interview round by ID.
+    
+    Returns 404 if the round doesn't exist or its application doesn't belong to user.
+    """
+    statement = select(InterviewRound).where(
+        InterviewRound.id == UUID(round_id),
+        _owned_by(user.id)
+    )
+    interview_round = (await session.exec(statement)).first()
+    
+    if not interview_round:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Round not found"
+        )
+    
+    return interview_round
+
+
+@router.patch("/rounds/{round_id}", response_model=InterviewRoundResponse)
+async def update_round(
+    round_id: str,
+    round_update: InterviewRoundUpdate,
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Update an interview round's fields.
+    
+    All fields are optional - only provided fields will be updated.
+    Also updates the application's last_updated timestamp.
+    """
+    update_data = round_update.model_dump(exclude_unset=True)
+    conditions = (InterviewRound.id == UUID(round_id), _owned_by(user.id))
+    
+    if update_data:
+        # Update provided fields in one UPDATE ... RETURNING
+        statement = update(InterviewRound).where(*conditions).values(**update_data).returning(InterviewRound)
+        interview_round = (await session.exec(statement)).scalar_one_or_none()
+    else:
+        interview_round = (await session.exec(select(InterviewRound).where(*conditions))).first()
+    
+    if not interview_round:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Round not found"
+        )
+    
+    await _touch_application(session, interview_round.application_id)
+    await session.commit()
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "application", "updated", [interview_round.application_id])
+    
+    return interview_round
+
+
+@router.delete("/rounds/{round_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_round(
+    round_id: str,
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Delete an interview round.
+    
+    This action cannot be undone.
+    Also updates the application's last_updated timestamp.
+    """
+    statement = delete(InterviewRound).where(
+        InterviewRound.id == UUID(round_id),
+        _owned_by(user.id)
+    ).returning(InterviewRound.application_id)
+    application_id = (await session.exec(statement)).scalar_one_or_none()
+    
+    if not application_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Round not found"
+        )
+    
+    await _touch_application(session, application_id)
+    await session.commit()
+    await response_cache.invalidate(user.id)
+    await event_broker.publish(user.id, "application", "updated", [application_id])
+    
+    return None
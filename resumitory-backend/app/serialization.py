@@ -0,0 +1,78 @@
+"""
+Fast JSON path for large list responses.
+
+List endpoints select plain columns instead of ORM entities, turn each row
+tuple into a dict and encode the page once with orjson. Rows come straight
+from the database, so the response model is used for the schema and the
+column list only: rows are not validated again on the way out.
+"""
+from typing import Any, Dict, List, Optional, Sequence, Type
+
+import orjson
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from sqlmodel import SQLModel
+
+
+def table_columns(table: Type[SQLModel], names: Sequence[str]) -> List[Any]:
+    """Columns of a table model for the given field names (others are skipped)."""
+    return [getattr(table, name) for name in names if name in table.model_fields]
+
+
+def parse_fields(fields: Optional[str], allowed: Sequence[str], always: Sequence[str] = ("id",)) -> List[str]:
+    """
+    Parse a comma-separated fields= parameter (sparse fieldset).
+
+    Returns the requested names plus `always`, in `allowed` order, so
+    equivalent requests share cache keys and ETags; all of `allowed` when
+    fields is empty.
+
+    Raises:
+        HTTPException: If a requested field is unknown
+    """
+    requested = {field.strip() for field in (fields or "").split(",") if field.strip()}
+    if not requested:
+        return list(allowed)
+
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. Use: {', '.join(allowed)}"
+        )
+    requested.update(always)
+    return [field for field in allowed if field in requested]
+
+
+def row_dicts(rows: Sequence[Any]) -> List[Dict[str, Any]]:
+    """Turn rows of a column SELECT into dicts keyed by column label."""
+    return [row._asdict() for row in rows]
+
+
+def object_dicts(objects: Sequence[Any], response_model: Type[SQLModel]) -> List[Dict[str, Any]]:
+    """Pick a response model's fields off loaded rows (no validation)."""
+    names = list(response_model.model_fields)
+    return [{name: getattr(obj, name) for name in names} for obj in objects]
+
+
+def dump_json(payload: Any) -> str:
+    """
+    Encode a payload of dicts, lists and DB values (UUID, date, datetime, Enum).
+
+    Returned as str so the response cache (including Redis) can store it.
+    """
+    return orjson.dumps(payload).decode()
+
+
+class JSONBodyResponse(JSONResponse):
+    """
+    JSON response whose body was already encoded by dump_json.
+
+    Returning it from a route skips FastAPI's response_model validation and
+    encoding; headers must be set on it, not on the injected Response.
+    Routes declare it as response_class (a JSONResponse, so OpenAPI shows
+    the documented model) with the page model under `responses`.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return content.encode() if isinstance(content, str) else content
@@ -0,0 +1,48 @@
+from sqlmodel import SQLModel, Field, Column
+import sqlalchemy as sa
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID, uuid4
+from enum import Enum
+
+from app.applications.models import ApplicationResponse
+from app.resumes.models import ResumeResponse
+
+
+class EntityEnum(str, Enum):
+    """Kinds of records the sync endpoint reports deletions for."""
+    resume = "resume"
+    application = "application"
+
+
+class Tombstone(SQLModel, table=True):
+    """Marker left by a delete so syncing clients can drop their copy."""
+    __tablename__ = "tombstones"
+    
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    user_id: UUID = Field(..., foreign_key="auth.users.id", index=True)
+    # TEXT with a CHECK constraint: bind plain strings, not ::entityenum
+    entity: EntityEnum = Field(
+        sa_column=Column(sa.Enum(EntityEnum, native_enum=False, create_constraint=False), nullable=False)
+    )
+    entity_id: UUID
+    deleted_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+class TombstoneResponse(SQLModel):
+    """A deleted record."""
+    entity: EntityEnum
+    entity_id: UUID
+    deleted_at: datetime
+    
+    class Config:
+        from_attributes = True
+
+
+class SyncResponse(SQLModel):
+    """Changes since a watermark."""
+    resumes: List[ResumeResponse] = Field(..., description="Resumes created or updated since the watermark")
+    applications: List[ApplicationResponse] = Field(..., description="Applications created or updated since the watermark")
+    deleted: List[TombstoneResponse] = Field(..., description="Records deleted since the watermark")
+    watermark: datetime = Field(..., description="Pass as `since` on the next sync (after the last page)")
+    next_cursor: Optional[str] = Field(default=None, description="Pass as `cursor` for the next page; null on the last page")
@@ -0,0 +1,161 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import text, tuple_
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+from typing import Any, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+import base64
+import json
+
+from app.database import get_session, is_postgres
+from app.auth.dependencies import CurrentUser, get_current_user
+from app.applications.models import Application
+from app.resumes.models import Resume
+from app.sync.models import SyncResponse, Tombstone
+
+router = APIRouter()
+
+# Returned watermarks trail the bound below by this much. Clients apply
+# changes as upserts, so the overlap is harmless.
+SYNC_OVERLAP = timedelta(seconds=5)
+
+DEFAULT_SYNC_PAGE_SIZE = 500
+MAX_SYNC_PAGE_SIZE = 1000
+
+# Start of the oldest transaction still writing, bounded by this one's start.
+# Sync stamps are the writing transaction's NOW() (database_setup.sql,
+# Step 19), so rows it commits later still sort after the watermark.
+# Transactions of other roles are only visible with pg_read_all_stats.
+_OLDEST_WRITER_START = text("""
+    SELECT LEAST(NOW(), MIN(xact_start)) AT TIME ZONE 'UTC'
+    FROM pg_stat_activity
+    WHERE backend_xid IS NOT NULL AND datname = current_database()
+""")
+
+# (response field, table, sync stamp column) in the order pages walk them
+_SECTIONS = [
+    ("resumes", Resume, Resume.updated_at),
+    ("applications", Application, Application.last_updated),
+    ("deleted", Tombstone, Tombstone.deleted_at)
+]
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normalize a client timestamp to the naive UTC stored in the database."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+async def _watermark(session: AsyncSession) -> datetime:
+    """Newest time before which every change is committed, read from the database clock."""
+    if is_postgres(session):
+        bound = (await session.exec(_OLDEST_WRITER_START)).one()[0]
+    else:
+        # SQLite: one writer, stamped by this process's clock
+        bound = datetime.utcnow()
+    return bound - SYNC_OVERLAP
+
+
+def _encode_sync_cursor(
+    since: Optional[datetime],
+    watermark: datetime,
+    section: int,
+    after: Optional[Tuple[datetime, UUID]]
+) -> str:
+    """Encode where the next page resumes, plus the sync's since and watermark."""
+    payload = json.dumps([
+        since.isoformat() if since else None,
+        watermark.isoformat(),
+        section,
+        [after[0].isoformat(), str(after[1])] if after else None
+    ])
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_sync_cursor(cursor: str) -> Tuple[Optional[datetime], datetime, int, Optional[Tuple[datetime, UUID]]]:
+    """
+    Decode (since, watermark, section, last key) from a sync cursor.
+
+    Raises:
+        HTTPException: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        since, watermark, section, after = json.loads(base64.urlsafe_b64decode(padded))
+        if not 0 <= section < len(_SECTIONS):
+            raise ValueError(section)
+        return (
+            datetime.fromisoformat(since) if since else None,
+            datetime.fromisoformat(watermark),
+            section,
+            (datetime.fromisoformat(after[0]), UUID(after[1])) if after else None
+        )
+    except (ValueError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
+
+@router.get("", response_model=SyncResponse)
+async def sync_changes(
+    since: Optional[datetime] = Query(None, description="Watermark from the previous sync (omit for a full sync)"),
+    cursor: Optional[str] = Query(None, description="Cursor from the previous page's next_cursor"),
+    limit: int = Query(DEFAULT_SYNC_PAGE_SIZE, ge=1, le=MAX_SYNC_PAGE_SIZE, description="Maximum records per page"),
+    session: AsyncSession = Depends(get_session),
+    user: CurrentUser = Depends(get_current_user)
+):
+    """
+    Get resumes and applications changed since a watermark, plus deletions.
+
+    - **since**: `watermark` returned by the previous sync; omit it to get everything
+    - **cursor**: `next_cursor` from the previous page (carries `since`)
+    - **limit**: Maximum resumes, applications and deletions on one page
+
+    Apply `resumes` and `applications` as upserts by id and drop the records
+    listed in `deleted`. While `next_cursor` is set, request it as `cursor`;
+    after the last page store `watermark` for the next sync. Pages walk
+    resumes, then applications, then deletions in stamp order.
+    """
+    if cursor:
+        since, watermark, section, after = _decode_sync_cursor(cursor)
+    else:
+        since = _as_utc(since) if since is not None else None
+        # Taken before any rows are read, so nothing committed later is missed
+        watermark = await _watermark(session)
+        section, after = 0, None
+
+    page: dict = {name: [] for name, _, _ in _SECTIONS}
+    remaining = limit
+    next_cursor = None
+
+    # A full sync has nothing to delete
+    last_section = len(_SECTIONS) if since is not None else len(_SECTIONS) - 1
+    while section < last_section:
+        name, table, stamp = _SECTIONS[section]
+        statement = select(table).where(table.user_id == user.id)
+        if since is not None:
+            # Served by idx_resumes_updated / idx_applications_last_updated / idx_tombstones_user_deleted
+            statement = statement.where(stamp > since)
+        if after is not None:
+            statement = statement.where(tuple_(stamp, table.id) > tuple_(*after))
+        statement = statement.order_by(stamp, table.id).limit(remaining + 1)
+        rows: List[Any] = (await session.exec(statement)).all()
+
+        if len(rows) > remaining:
+            rows = rows[:remaining]
+            last = rows[-1]
+            next_cursor = _encode_sync_cursor(since, watermark, section, (getattr(last, stamp.key), last.id))
+            page[name] = rows
+            break
+
+        page[name] = rows
+        remaining -= len(rows)
+        section, after = section + 1, None
+        if remaining == 0 and section < last_section:
+            next_cursor = _encode_sync_cursor(since, watermark, section, None)
+            break
+
+    return SyncResponse(**page, watermark=watermark, next_cursor=next_cursor)
@@ -0,0 +1,25 @@
+"""Tombstones recorded by delete handlers for delta sync."""
+from typing import Iterable
+from uuid import UUID
+
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.sync.models import EntityEnum, Tombstone
+
+
+def record_deletions(
+    session: AsyncSession,
+    user_id: UUID,
+    entity: EntityEnum,
+    entity_ids: Iterable[UUID]
+) -> None:
+    """
+    Add tombstones for deleted records to the session.
+    
+    They are written by the caller's commit, in the same transaction as the
+    delete, so a sync never sees a delete without its tombstone.
+    """
+    session.add_all(
+        Tombstone(user_id=user_id, entity=entity, entity_id=entity_id)
+        for entity_id in entity_ids
+    )
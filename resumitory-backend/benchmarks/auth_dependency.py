@@ -0,0 +1,69 @@
+"""
+Micro-benchmark: per-request cost of authenticating a bearer token.
+
+Compares verifying the JWT on every request (HS256 signature check and
+claim parsing by jwt.decode) with the verified-token cache that
+_verify_token now consults first (a SHA-256 of the token and an LRU
+lookup). Run from resumitory-backend/:
+
+    python -m benchmarks.auth_dependency [--calls 100000] [--repeat 5]
+"""
+import argparse
+import os
+import time
+import uuid
+
+for name, value in {
+    "SUPABASE_URL": "https://benchmark.supabase.co",
+    "SUPABASE_KEY": "benchmark",
+    "SUPABASE_JWT_SECRET": "benchmark-secret",
+    "DATABASE_PASSWORD": "benchmark"
+}.items():
+    os.environ.setdefault(name, value)
+
+import jwt
+
+from app.auth import dependencies
+from app.config import settings
+
+
+def _uncached(token: str, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        dependencies._verified_tokens.clear()
+        dependencies._verify_token(token)
+    return time.perf_counter() - started
+
+
+def _cached(token: str, calls: int) -> float:
+    dependencies._verify_token(token)
+    started = time.perf_counter()
+    for _ in range(calls):
+        dependencies._verify_token(token)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=100000, help="Verifications per run")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per path (best is reported)")
+    args = parser.parse_args()
+
+    token = jwt.encode(
+        {"sub": str(uuid.uuid4()), "exp": int(time.time()) + 3600, "role": "authenticated"},
+        settings.SUPABASE_JWT_SECRET,
+        algorithm="HS256"
+    )
+
+    results = {}
+    for label, run in (("jwt.decode every call", _uncached), ("verified-token cache", _cached)):
+        best = min(run(token, args.calls) for _ in range(args.repeat))
+        results[label] = best / args.calls
+        print(f"{label:<24} {results[label] * 1e6:8.2f} µs/call")
+
+    speedup = results["jwt.decode every call"] / results["verified-token cache"]
+    print(f"{'speedup':<24} {speedup:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Micro-benchmark: per-row cost of building a GET /applications page.
+
+Compares the previous path (ORM rows -> ApplicationWithResume(**row.dict())
+-> response_model validation -> stdlib json) with the current one (column
+tuples -> dicts -> orjson) on an in-memory SQLite table. Run from
+resumitory-backend/:
+
+    python -m benchmarks.list_serialization [--rows 10000] [--repeat 5]
+"""
+import argparse
+import json
+import time
+from datetime import date, timedelta
+from uuid import uuid4
+
+import sqlalchemy as sa
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.applications.models import Application, ApplicationPage, ApplicationResponse, ApplicationWithResume
+from app.resumes.models import Resume
+from app.serialization import dump_json, row_dicts, table_columns
+
+
+def _create_engine(rows: int):
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+
+    @event.listens_for(engine, "connect")
+    def _attach_auth(dbapi_connection, _):
+        dbapi_connection.execute("ATTACH DATABASE ':memory:' AS auth")
+
+    # Foreign keys point at Supabase's auth.users
+    users = sa.Table("users", SQLModel.metadata, sa.Column("id", sa.Uuid, primary_key=True), schema="auth")
+    SQLModel.metadata.create_all(engine, tables=[users, Resume.__table__, Application.__table__])
+
+    user_id = uuid4()
+    with Session(engine) as session:
+        resume = Resume(user_id=user_id, name="SWE Resume v3", pdf_url="https://example.com/cv.pdf")
+        session.add(resume)
+        session.add_all(
+            Application(
+                user_id=user_id,
+                company=f"Company {i}",
+                role="Software Engineer",
+                date_applied=date(2024, 1, 1) + timedelta(days=i % 365),
+                notes="Referred by a friend" if i % 3 else None,
+                resume_id=resume.id if i % 2 else None
+            )
+            for i in range(rows)
+        )
+        session.commit()
+    return engine
+
+
+def _previous_path(session: Session) -> str:
+    statement = select(Application, Resume.name).outerjoin(Resume, Application.resume_id == Resume.id)
+    rows = session.exec(statement).all()
+    page = ApplicationPage(
+        items=[ApplicationWithResume(**app.model_dump(), resume_name=name) for app, name in rows]
+    )
+    # Cached payload, then FastAPI's response_model validation and JSONResponse
+    jsonable_encoder(page)
+    adapter = TypeAdapter(ApplicationPage)
+    content = adapter.dump_python(adapter.validate_python(page, from_attributes=True), mode="json")
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":"))
+
+
+def _current_path(session: Session) -> str:
+    columns = table_columns(Application, ApplicationResponse.model_fields)
+    statement = select(*columns, Resume.name.label("resume_name")).outerjoin(
+        Resume, Application.resume_id == Resume.id
+    )
+    items = row_dicts(session.exec(statement).all())
+    for item in items:
+        item["rounds"] = None
+    return dump_json({"items": items, "next_cursor": None})
+
+
+def _best_seconds(engine, build, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        with Session(engine) as session:
+            started = time.perf_counter()
+            build(session)
+            best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = _create_engine(args.rows)
+    with Session(engine) as session:
+        assert json.loads(_previous_path(session)) == json.loads(_current_path(session))
+
+    results = {
+        "previous (ORM + 3 passes)": _best_seconds(engine, _previous_path, args.repeat),
+        "current (tuples + orjson)": _best_seconds(engine, _current_path, args.repeat)
+    }
+    for name, seconds in results.items():
+        print(f"{name:28} {seconds * 1000:8.1f} ms  {seconds / args.rows * 1e6:6.2f} us/row")
+
+
+if __name__ == "__main__":
+    main()
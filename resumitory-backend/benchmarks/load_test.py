@@ -0,0 +1,165 @@
+"""
+Load test: throughput of a read endpoint as concurrent clients increase.
+
+Each level runs `clients` concurrent loops that request the endpoint back
+to back for --duration seconds, and reports requests/s and latency. With
+the async database layer, throughput should grow with the number of
+clients (requests overlap while they wait on the database) instead of
+staying flat as it does when queries block the event loop.
+
+Against a running API (meaningful numbers; Postgres latency is real I/O):
+
+    python -m benchmarks.load_test --url http://localhost:8000 --token <JWT>
+
+Without --url the app is run in-process on a temporary SQLite database,
+which exercises the same code but mostly measures CPU:
+
+    python -m benchmarks.load_test --rows 200
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+import httpx
+
+DEFAULT_LEVELS = "1,4,16,64"
+
+
+async def _client_loop(client: httpx.AsyncClient, path: str, deadline: float, latencies: list) -> None:
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        response = await client.get(path)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+
+
+async def run_level(client: httpx.AsyncClient, path: str, clients: int, duration: float) -> dict:
+    latencies: list = []
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*(_client_loop(client, path, deadline, latencies) for _ in range(clients)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "clients": clients,
+        "requests": len(latencies),
+        "rps": len(latencies) / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1] * 1000 if len(latencies) >= 100 else latencies[-1] * 1000
+    }
+
+
+def _in_process_client(rows: int) -> httpx.AsyncClient:
+    """The app on a temporary SQLite database, with one user owning `rows` applications."""
+    for name, value in {
+        "SUPABASE_URL": "https://load-test.supabase.co",
+        "SUPABASE_KEY": "load-test",
+        "SUPABASE_JWT_SECRET": "load-test-secret",
+        "DATABASE_PASSWORD": "load-test",
+        "EVENTS_BACKEND": "memory",
+        "CACHE_BACKEND": "none"
+    }.items():
+        os.environ.setdefault(name, value)
+
+    import jwt
+    import sqlalchemy as sa
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlmodel import Session, SQLModel, create_engine
+    from sqlmodel.ext.asyncio.session import AsyncSession
+
+    from app.applications.models import Application
+    from app.config import settings
+    from app.database import get_session
+    from app.main import app
+    from app.resumes.models import Resume
+
+    path = os.path.join(tempfile.mkdtemp(), "load_test.db")
+
+    def attach_auth(dbapi_connection, _):
+        dbapi_connection.execute(f"ATTACH DATABASE '{path}.auth' AS auth")
+
+    sync_engine = create_engine(f"sqlite:///{path}")
+    event.listen(sync_engine, "connect", attach_auth)
+    sa.Table("users", SQLModel.metadata, sa.Column("id", sa.Uuid, primary_key=True), schema="auth")
+    SQLModel.metadata.create_all(sync_engine)
+
+    user_id = uuid.uuid4()
+    with Session(sync_engine) as session:
+        resume = Resume(user_id=user_id, name="SWE Resume", pdf_url="https://example.com/cv.pdf")
+        session.add(resume)
+        session.add_all(
+            Application(
+                user_id=user_id,
+                company=f"Company {i}",
+                role="Software Engineer",
+                date_applied=date(2024, 1, 1) + timedelta(days=i % 365),
+                resume_id=resume.id if i % 2 else None
+            )
+            for i in range(rows)
+        )
+        session.commit()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    event.listen(async_engine.sync_engine, "connect", attach_auth)
+
+    async def get_load_test_session():
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_load_test_session
+
+    token = jwt.encode(
+        {"sub": str(user_id), "exp": int(time.time()) + 3600},
+        settings.SUPABASE_JWT_SECRET,
+        algorithm="HS256"
+    )
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://load-test",
+        headers={"Authorization": f"Bearer {token}"}
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", help="Base URL of a running API (default: in-process on SQLite)")
+    parser.add_argument("--token", help="JWT for --url")
+    parser.add_argument("--path", default="/applications/?limit=50", help="Endpoint to load")
+    parser.add_argument("--clients", default=DEFAULT_LEVELS, help="Comma-separated concurrency levels")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per level")
+    parser.add_argument("--rows", type=int, default=200, help="Applications to seed (in-process only)")
+    args = parser.parse_args()
+
+    if args.url:
+        if not args.token:
+            parser.error("--token is required with --url")
+        client = httpx.AsyncClient(
+            base_url=args.url,
+            headers={"Authorization": f"Bearer {args.token}"},
+            limits=httpx.Limits(max_connections=None),
+            timeout=30.0
+        )
+    else:
+        client = _in_process_client(args.rows)
+
+    async with client:
+        await client.get(args.path)  # warm up
+        baseline = None
+        print(f"{'clients':>7} {'requests':>9} {'req/s':>9} {'scaling':>8} {'p50 ms':>8} {'p99 ms':>8}")
+        for clients in (int(level) for level in args.clients.split(",")):
+            result = await run_level(client, args.path, clients, args.duration)
+            baseline = baseline or result["rps"]
+            print(
+                f"{result['clients']:>7} {result['requests']:>9} {result['rps']:>9.1f} "
+                f"{result['rps'] / baseline:>7.2f}x {result['p50_ms']:>8.1f} {result['p99_ms']:>8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
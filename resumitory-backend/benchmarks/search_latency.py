@@ -0,0 +1,159 @@
+"""
+Benchmark: application search latency as the number of applications grows.
+
+Grows one user's applications through each size in --sizes and times the
+ranked search (search_application_ids) for a few typical queries (exact
+word, typo, no match). On PostgreSQL the full-text and trigram GIN indexes
+from database_setup.sql serve the search, so latency should grow much more
+slowly than the row count. The SQLite fallback scores every row in Python
+and grows linearly; it only exercises the code path offline.
+
+Offline (SQLite):
+
+    python -m benchmarks.search_latency --sizes 1000,10000,50000
+
+PostgreSQL (schema from database_setup.sql; rows are added for an existing
+auth user and removed afterwards):
+
+    python -m benchmarks.search_latency \\
+        --database-url postgresql+asyncpg://postgres:<password>@<host>:5432/postgres \\
+        --user-id <auth.users id> --sizes 1000,10000,100000
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+for name, value in {
+    "SUPABASE_URL": "https://benchmark.supabase.co",
+    "SUPABASE_KEY": "benchmark",
+    "SUPABASE_JWT_SECRET": "benchmark-secret",
+    "DATABASE_PASSWORD": "benchmark"
+}.items():
+    os.environ.setdefault(name, value)
+
+import sqlalchemy as sa
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, col, delete, insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.applications.models import Application, StatusEnum
+from app.applications.search import search_application_ids
+from app.resumes.models import Resume
+
+QUERIES = ["engineer", "Gogle", "platfrom", "quantum basketweaving"]
+
+COMPANIES = ["Google", "Stripe", "Datadog", "Shopify", "Netflix", "Atlassian", "Cloudflare", "Snowflake"]
+ROLES = ["Software Engineer", "Backend Engineer", "Platform Engineer", "Data Engineer", "SRE"]
+NOTE_WORDS = ["referral", "recruiter", "onsite", "python", "kubernetes", "remote", "platform", "team", "salary"]
+
+INSERT_BATCH_SIZE = 1000
+
+
+def _rows(user_id: uuid.UUID, count: int, rng: random.Random):
+    for _ in range(count):
+        yield {
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "company": f"{rng.choice(COMPANIES)} {rng.randint(1, 10**6)}",
+            "role": rng.choice(ROLES),
+            "date_applied": date(2024, 1, 1) + timedelta(days=rng.randint(0, 365)),
+            "status": StatusEnum.applied,
+            "notes": " ".join(rng.choices(NOTE_WORDS, k=rng.randint(0, 12))) or None,
+            "last_updated": date(2024, 1, 1),
+            "created_at": date(2024, 1, 1)
+        }
+
+
+async def _add_rows(engine, user_id: uuid.UUID, count: int, rng: random.Random) -> list:
+    ids = []
+    rows = list(_rows(user_id, count, rng))
+    async with AsyncSession(engine) as session:
+        for start in range(0, len(rows), INSERT_BATCH_SIZE):
+            batch = rows[start:start + INSERT_BATCH_SIZE]
+            await session.exec(insert(Application).values(batch))
+            ids.extend(row["id"] for row in batch)
+        await session.commit()
+        if engine.dialect.name == "postgresql":
+            await session.exec(text("ANALYZE applications"))
+    return ids
+
+
+async def _time_query(engine, user_id: uuid.UUID, query: str, repeat: int) -> float:
+    timings = []
+    async with AsyncSession(engine) as session:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            await search_application_ids(session, user_id, query, 20)
+            timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+async def _sqlite_engine():
+    path = os.path.join(tempfile.mkdtemp(), "search_benchmark.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _attach_auth(dbapi_connection, _):
+        dbapi_connection.execute(f"ATTACH DATABASE '{path}.auth' AS auth")
+
+    # Foreign keys point at Supabase's auth.users
+    users = sa.Table("users", SQLModel.metadata, sa.Column("id", sa.Uuid, primary_key=True), schema="auth")
+    async with engine.begin() as connection:
+        await connection.run_sync(
+            SQLModel.metadata.create_all, tables=[users, Resume.__table__, Application.__table__]
+        )
+    return engine
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", help="postgresql+asyncpg:// URL (default: temporary SQLite)")
+    parser.add_argument("--user-id", help="Existing auth.users id to own the rows (PostgreSQL only)")
+    parser.add_argument("--sizes", default="1000,10000,50000", help="Comma-separated application counts")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query (median is reported)")
+    args = parser.parse_args()
+
+    if args.database_url:
+        if not args.user_id:
+            parser.error("--user-id is required with --database-url")
+        engine = create_async_engine(args.database_url)
+        user_id = uuid.UUID(args.user_id)
+    else:
+        engine = await _sqlite_engine()
+        user_id = uuid.uuid4()
+
+    rng = random.Random(42)
+    inserted: list = []
+    previous = None
+    print(f"{args.database_url and 'postgresql' or 'sqlite'}: median ms per search ({', '.join(QUERIES)})")
+    print(f"{'rows':>8} {'median ms':>10} {'rows x':>7} {'latency x':>10}")
+    try:
+        for size in (int(value) for value in args.sizes.split(",")):
+            inserted += await _add_rows(engine, user_id, size - len(inserted), rng)
+            await _time_query(engine, user_id, QUERIES[0], 1)  # warm up
+            latency = statistics.median([
+                await _time_query(engine, user_id, query, args.repeat) for query in QUERIES
+            ])
+            growth = f"{size / previous[0]:>6.1f}x {latency / previous[1]:>9.2f}x" if previous else f"{'':>7} {'':>10}"
+            print(f"{size:>8} {latency * 1000:>10.2f} {growth}")
+            previous = (size, latency)
+    finally:
+        if args.database_url and inserted:
+            async with AsyncSession(engine) as session:
+                for start in range(0, len(inserted), INSERT_BATCH_SIZE):
+                    await session.exec(
+                        delete(Application).where(col(Application.id).in_(inserted[start:start + INSERT_BATCH_SIZE]))
+                    )
+                await session.commit()
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
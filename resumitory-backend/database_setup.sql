@@ -186,6 +186,15 @@ BEGIN
 END;
 $$ language 'plpgsql';
 
+-- Applications track their modification time in last_updated
+CREATE OR REPLACE FUNCTION update_last_updated_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.last_updated = NOW();
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
 -- Step 12: Add Triggers for Auto-Updating updated_at
 DROP TRIGGER IF EXISTS update_resumes_updated_at ON resumes;
 CREATE TRIGGER update_resumes_updated_at
@@ -197,8 +206,343 @@ DROP TRIGGER IF EXISTS update_applications_last_updated ON applications;
 CREATE TRIGGER update_applications_last_updated
 BEFORE UPDATE ON applications
 FOR EACH ROW
+EXECUTE FUNCTION update_last_updated_column();
+
+-- Step 13: Content-Addressed Storage Reference Counts
+-- One row per stored file ({user_id}/{sha256}.{ext}); ref_count is the number
+-- of resumes pointing at it. Files are removed from storage at ref_count 0.
+CREATE TABLE IF NOT EXISTS storage_objects (
+  path TEXT PRIMARY KEY,
+  user_id UUID REFERENCES auth.users(id) ON DELETE CASCADE NOT NULL,
+  sha256 TEXT,
+  size_bytes BIGINT,
+  ref_count INTEGER NOT NULL DEFAULT 1 CHECK (ref_count >= 0),
+  created_at TIMESTAMP DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_storage_objects_user_id ON storage_objects(user_id);
+
+ALTER TABLE storage_objects ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Users can view own storage objects" ON storage_objects;
+CREATE POLICY "Users can view own storage objects" ON storage_objects
+  FOR SELECT USING (auth.uid() = user_id);
+
+-- Backfill references for files uploaded before content addressing
+-- (clones share URLs, so count every resume pointing at each file)
+INSERT INTO storage_objects (path, user_id, ref_count)
+SELECT substring(files.url from '/resumes/(.*)$'), files.user_id, COUNT(*)
+FROM (
+  SELECT user_id, pdf_url AS url FROM resumes
+  UNION ALL
+  SELECT user_id, tex_url AS url FROM resumes WHERE tex_url IS NOT NULL
+) files
+WHERE files.url LIKE '%/resumes/%'
+GROUP BY 1, 2
+ON CONFLICT (path) DO NOTHING;
+
+-- Step 14: Application Search (full text + trigram)
+-- Both columns are generated, so Postgres keeps them current on every write.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+ALTER TABLE applications ADD COLUMN IF NOT EXISTS search_vector tsvector
+  GENERATED ALWAYS AS (
+    setweight(to_tsvector('english', coalesce(company, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce(role, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce(notes, '')), 'C')
+  ) STORED;
+
+ALTER TABLE applications ADD COLUMN IF NOT EXISTS search_document TEXT
+  GENERATED ALWAYS AS (company || ' ' || role || ' ' || coalesce(notes, '')) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_applications_search_vector ON applications USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_applications_search_trgm ON applications USING GIN (search_document gin_trgm_ops);
+
+-- Step 15: Per-Resume Conversion Analytics
+-- resume_stats holds per-resume application counts, maintained by statement
+-- triggers on applications, so GET /resumes/analytics never scans applications.
+-- interviewed_on records when an application first reached interview (or offer).
+ALTER TABLE applications ADD COLUMN IF NOT EXISTS interviewed_on DATE;
+
+CREATE TABLE IF NOT EXISTS resume_stats (
+  resume_id UUID PRIMARY KEY REFERENCES resumes(id) ON DELETE CASCADE,
+  user_id UUID REFERENCES auth.users(id) ON DELETE CASCADE NOT NULL,
+  applied INTEGER NOT NULL DEFAULT 0,
+  interview INTEGER NOT NULL DEFAULT 0,
+  offer INTEGER NOT NULL DEFAULT 0,
+  rejected INTEGER NOT NULL DEFAULT 0,
+  archived INTEGER NOT NULL DEFAULT 0,
+  interviewed INTEGER NOT NULL DEFAULT 0,
+  days_to_interview INTEGER NOT NULL DEFAULT 0,
+  updated_at TIMESTAMP DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_resume_stats_user_id ON resume_stats(user_id);
+
+ALTER TABLE resume_stats ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Users can view own resume stats" ON resume_stats;
+CREATE POLICY "Users can view own resume stats" ON resume_stats
+  FOR SELECT USING (auth.uid() = user_id);
+
+-- Stamp interviewed_on the first time an application reaches interview/offer
+CREATE OR REPLACE FUNCTION set_interviewed_on()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.status IN ('interview', 'offer') AND NEW.interviewed_on IS NULL THEN
+        NEW.interviewed_on = GREATEST(CURRENT_DATE, NEW.date_applied);
+    END IF;
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+-- Add (direction = 1) or remove (direction = -1) a set of application rows from resume_stats.
+-- Rows whose resume no longer exists (cascading resume deletes) are skipped.
+CREATE OR REPLACE FUNCTION apply_resume_stats_delta(changed JSONB, direction INTEGER)
+RETURNS VOID AS $$
+  INSERT INTO resume_stats (resume_id, user_id, applied, interview, offer, rejected, archived, interviewed, days_to_interview)
+  SELECT
+    r.resume_id,
+    r.user_id,
+    direction * COUNT(*) FILTER (WHERE r.status = 'applied'),
+    direction * COUNT(*) FILTER (WHERE r.status = 'interview'),
+    direction * COUNT(*) FILTER (WHERE r.status = 'offer'),
+    direction * COUNT(*) FILTER (WHERE r.status = 'rejected'),
+    direction * COUNT(*) FILTER (WHERE r.status = 'archived'),
+    direction * COUNT(r.interviewed_on),
+    direction * COALESCE(SUM(r.interviewed_on - r.date_applied), 0)
+  FROM jsonb_to_recordset(changed) AS r(resume_id UUID, user_id UUID, status TEXT, date_applied DATE, interviewed_on DATE)
+  WHERE r.resume_id IS NOT NULL
+    AND EXISTS (SELECT 1 FROM resumes WHERE resumes.id = r.resume_id)
+  GROUP BY r.resume_id, r.user_id
+  ON CONFLICT (resume_id) DO UPDATE SET
+    applied = resume_stats.applied + EXCLUDED.applied,
+    interview = resume_stats.interview + EXCLUDED.interview,
+    offer = resume_stats.offer + EXCLUDED.offer,
+    rejected = resume_stats.rejected + EXCLUDED.rejected,
+    archived = resume_stats.archived + EXCLUDED.archived,
+    interviewed = resume_stats.interviewed + EXCLUDED.interviewed,
+    days_to_interview = resume_stats.days_to_interview + EXCLUDED.days_to_interview,
+    updated_at = NOW();
+$$ LANGUAGE sql;
+
+-- One call per statement (not per row), so bulk imports update each resume once
+CREATE OR REPLACE FUNCTION refresh_resume_stats()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM apply_resume_stats_delta((SELECT jsonb_agg(o) FROM old_rows o), -1);
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM apply_resume_stats_delta((SELECT jsonb_agg(n) FROM new_rows n), 1);
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+-- Backfill interviewed_on and rebuild the counts (safe to re-run)
+ALTER TABLE applications DISABLE TRIGGER USER;
+UPDATE applications SET interviewed_on = GREATEST(last_updated::date, date_applied)
+WHERE status IN ('interview', 'offer') AND interviewed_on IS NULL;
+ALTER TABLE applications ENABLE TRIGGER USER;
+
+INSERT INTO resume_stats (resume_id, user_id, applied, interview, offer, rejected, archived, interviewed, days_to_interview)
+SELECT
+  resume_id,
+  user_id,
+  COUNT(*) FILTER (WHERE status = 'applied'),
+  COUNT(*) FILTER (WHERE status = 'interview'),
+  COUNT(*) FILTER (WHERE status = 'offer'),
+  COUNT(*) FILTER (WHERE status = 'rejected'),
+  COUNT(*) FILTER (WHERE status = 'archived'),
+  COUNT(interviewed_on),
+  COALESCE(SUM(interviewed_on - date_applied), 0)
+FROM applications
+WHERE resume_id IS NOT NULL
+GROUP BY resume_id, user_id
+ON CONFLICT (resume_id) DO UPDATE SET
+  applied = EXCLUDED.applied,
+  interview = EXCLUDED.interview,
+  offer = EXCLUDED.offer,
+  rejected = EXCLUDED.rejected,
+  archived = EXCLUDED.archived,
+  interviewed = EXCLUDED.interviewed,
+  days_to_interview = EXCLUDED.days_to_interview,
+  updated_at = NOW();
+
+DROP TRIGGER IF EXISTS set_applications_interviewed_on ON applications;
+CREATE TRIGGER set_applications_interviewed_on
+BEFORE INSERT OR UPDATE ON applications
+FOR EACH ROW
+EXECUTE FUNCTION set_interviewed_on();
+
+-- Transition tables need one trigger per event
+DROP TRIGGER IF EXISTS refresh_resume_stats_insert ON applications;
+CREATE TRIGGER refresh_resume_stats_insert
+AFTER INSERT ON applications
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION refresh_resume_stats();
+
+DROP TRIGGER IF EXISTS refresh_resume_stats_update ON applications;
+CREATE TRIGGER refresh_resume_stats_update
+AFTER UPDATE ON applications
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION refresh_resume_stats();
+
+DROP TRIGGER IF EXISTS refresh_resume_stats_delete ON applications;
+CREATE TRIGGER refresh_resume_stats_delete
+AFTER DELETE ON applications
+REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION refresh_resume_stats();
+
+-- Step 16: Application Event Log
+-- Append-only history of application changes (created, status, resume and
+-- follow-up date), written by statement triggers in the same transaction as
+-- the change, so logging costs no extra round trips from the API.
+-- application_id has no foreign key: history outlives deleted applications.
+CREATE TABLE IF NOT EXISTS application_events (
+  id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+  user_id UUID REFERENCES auth.users(id) ON DELETE CASCADE NOT NULL,
+  application_id UUID NOT NULL,
+  event_type TEXT NOT NULL CHECK (event_type IN ('created', 'status', 'resume', 'follow_up')),
+  old_value TEXT,
+  new_value TEXT,
+  occurred_at TIMESTAMP DEFAULT NOW() NOT NULL
+);
+
+-- Activity feed (newest first) and per-application timeline
+CREATE INDEX IF NOT EXISTS idx_application_events_user ON application_events(user_id, occurred_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_application_events_application ON application_events(application_id, occurred_at DESC, id DESC);
+
+ALTER TABLE application_events ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Users can view own application events" ON application_events;
+CREATE POLICY "Users can view own application events" ON application_events
+  FOR SELECT USING (auth.uid() = user_id);
+
+-- Events are never edited
+CREATE OR REPLACE FUNCTION reject_event_update()
+RETURNS TRIGGER AS $$
+BEGIN
+    RAISE EXCEPTION 'application_events is append-only';
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS application_events_append_only ON application_events;
+CREATE TRIGGER application_events_append_only
+BEFORE UPDATE ON application_events
+FOR EACH ROW
+EXECUTE FUNCTION reject_event_update();
+
+CREATE OR REPLACE FUNCTION log_application_events()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        INSERT INTO application_events (user_id, application_id, event_type, new_value)
+        SELECT n.user_id, n.id, 'created', n.status FROM new_rows n;
+    ELSE
+        INSERT INTO application_events (user_id, application_id, event_type, old_value, new_value)
+        SELECT n.user_id, n.id, c.event_type, c.old_value, c.new_value
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        CROSS JOIN LATERAL (VALUES
+          ('status', o.status, n.status),
+          ('resume', o.resume_id::text, n.resume_id::text),
+          ('follow_up', o.follow_up_date::text, n.follow_up_date::text)
+        ) AS c(event_type, old_value, new_value)
+        WHERE c.old_value IS DISTINCT FROM c.new_value;
+    END IF;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS log_application_events_insert ON applications;
+CREATE TRIGGER log_application_events_insert
+AFTER INSERT ON applications
+REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION log_application_events();
+
+DROP TRIGGER IF EXISTS log_application_events_update ON applications;
+CREATE TRIGGER log_application_events_update
+AFTER UPDATE ON applications
+REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+FOR EACH STATEMENT
+EXECUTE FUNCTION log_application_events();
+
+-- Step 17: Delta Sync
+-- GET /sync returns rows changed after a watermark: these indexes serve the
+-- per-user range scans, and delete handlers leave tombstones for removed rows.
+CREATE INDEX IF NOT EXISTS idx_resumes_updated ON resumes(user_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_applications_last_updated ON applications(user_id, last_updated);
+
+CREATE TABLE IF NOT EXISTS tombstones (
+  id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+  user_id UUID REFERENCES auth.users(id) ON DELETE CASCADE NOT NULL,
+  entity TEXT NOT NULL CHECK (entity IN ('resume', 'application')),
+  entity_id UUID NOT NULL,
+  deleted_at TIMESTAMP DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_tombstones_user_deleted ON tombstones(user_id, deleted_at);
+
+ALTER TABLE tombstones ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Users can view own tombstones" ON tombstones;
+CREATE POLICY "Users can view own tombstones" ON tombstones
+  FOR SELECT USING (auth.uid() = user_id);
+
+-- Step 18: Storage Deletion Outbox
+-- Files orphaned by resume deletes are queued here in the same transaction and
+-- removed from storage by the API's background worker (batched, with retries).
+CREATE TABLE IF NOT EXISTS storage_deletions (
+  id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+  path TEXT NOT NULL,
+  attempts INTEGER NOT NULL DEFAULT 0,
+  next_attempt_at TIMESTAMP DEFAULT NOW() NOT NULL,
+  last_error TEXT,
+  created_at TIMESTAMP DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_storage_deletions_due ON storage_deletions(next_attempt_at);
+CREATE INDEX IF NOT EXISTS idx_storage_deletions_path ON storage_deletions(path);
+
+-- Only the API (table owner) reads or writes the outbox
+ALTER TABLE storage_deletions ENABLE ROW LEVEL SECURITY;
+
+-- Step 19: Sync Stamps From the Database Clock
+-- GET /sync bounds its watermark by the start of the oldest transaction that is
+-- still writing, so every stamp it compares against must be that transaction's
+-- NOW(): stamp inserts (and tombstones) here instead of trusting the API's clock.
+DROP TRIGGER IF EXISTS stamp_resumes_updated_at ON resumes;
+CREATE TRIGGER stamp_resumes_updated_at
+BEFORE INSERT ON resumes
+FOR EACH ROW
 EXECUTE FUNCTION update_updated_at_column();
 
+DROP TRIGGER IF EXISTS stamp_applications_last_updated ON applications;
+CREATE TRIGGER stamp_applications_last_updated
+BEFORE INSERT ON applications
+FOR EACH ROW
+EXECUTE FUNCTION update_last_updated_column();
+
+CREATE OR REPLACE FUNCTION stamp_deleted_at_column()
+RETURNS TRIGGER AS $$
+BEGIN
+    NEW.deleted_at = NOW();
+    RETURN NEW;
+END;
+$$ language 'plpgsql';
+
+DROP TRIGGER IF EXISTS stamp_tombstones_deleted_at ON tombstones;
+CREATE TRIGGER stamp_tombstones_deleted_at
+BEFORE INSERT ON tombstones
+FOR EACH ROW
+EXECUTE FUNCTION stamp_deleted_at_column();
+
 -- ============================================
 -- Setup Complete!
 -- ============================================
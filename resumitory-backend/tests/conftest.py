@@ -0,0 +1,109 @@
+"""
+Shared fixtures: the app on a throwaway SQLite database.
+
+Settings are read when app.config is imported, so the environment is set
+before the app is imported. Supabase's auth.users is stood in for by an
+attached database, since the tables reference it.
+"""
+import os
+import time
+import uuid
+
+os.environ.setdefault("SUPABASE_URL", "https://test.supabase.co")
+os.environ.setdefault("SUPABASE_KEY", "test-key")
+os.environ.setdefault("SUPABASE_JWT_SECRET", "test-secret")
+os.environ.setdefault("DATABASE_PASSWORD", "test-password")
+os.environ.setdefault("EVENTS_BACKEND", "memory")
+os.environ.setdefault("CACHE_BACKEND", "none")
+
+import jwt
+import pytest
+import sqlalchemy as sa
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import Session, SQLModel, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.config import settings
+from app.database import get_session
+from app.main import app
+from app.resumes import backends, cleanup
+
+if "auth.users" not in SQLModel.metadata.tables:
+    sa.Table("users", SQLModel.metadata, sa.Column("id", sa.Uuid, primary_key=True), schema="auth")
+
+
+def _attach_auth(path):
+    def attach(dbapi_connection, _):
+        dbapi_connection.execute(f"ATTACH DATABASE '{path}.auth' AS auth")
+    return attach
+
+
+@pytest.fixture
+def database(tmp_path):
+    """(sync engine for seeding, async engine used by the app)."""
+    path = tmp_path / "test.db"
+    sync_engine = create_engine(f"sqlite:///{path}")
+    event.listen(sync_engine, "connect", _attach_auth(path))
+    SQLModel.metadata.create_all(sync_engine)
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    event.listen(async_engine.sync_engine, "connect", _attach_auth(path))
+    yield sync_engine, async_engine
+    sync_engine.dispose()
+
+
+@pytest.fixture
+def db_session(database):
+    with Session(database[0], expire_on_commit=False) as session:
+        yield session
+
+
+@pytest.fixture
+def client(database):
+    async def get_test_session():
+        async with AsyncSession(database[1], expire_on_commit=False) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = get_test_session
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def storage(tmp_path, database, monkeypatch):
+    """Local-disk storage backend, with the cleanup worker on the test database."""
+    backend = backends.LocalStorageBackend(str(tmp_path / "storage"), "http://test")
+    monkeypatch.setattr(backends, "_backend", backend)
+    monkeypatch.setattr(cleanup, "engine", database[1])
+    return backend
+
+
+@pytest.fixture
+def statement_counter(database):
+    """Counts SQL statements the app sends; call .reset() before a request."""
+    class Counter:
+        count = 0
+
+        def reset(self):
+            self.count = 0
+
+    counter = Counter()
+
+    def count(*_):
+        counter.count += 1
+
+    event.listen(database[1].sync_engine, "before_cursor_execute", count)
+    yield counter
+    event.remove(database[1].sync_engine, "before_cursor_execute", count)
+
+
+def auth_headers(user_id: uuid.UUID) -> dict:
+    """Bearer header with a Supabase-style JWT for user_id."""
+    token = jwt.encode(
+        {"sub": str(user_id), "exp": int(time.time()) + 3600},
+        settings.SUPABASE_JWT_SECRET,
+        algorithm="HS256"
+    )
+    return {"Authorization": f"Bearer {token}"}
@@ -0,0 +1,87 @@
+"""POST /applications/batch only touches the caller's applications."""
+import uuid
+from datetime import date
+
+from tests.conftest import auth_headers
+
+
+def _create_application(client, user_id, company="Acme"):
+    response = client.post(
+        "/applications/",
+        json={"company": company, "role": "Engineer", "date_applied": str(date(2024, 1, 1))},
+        headers=auth_headers(user_id)
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _statuses(client, user_id):
+    items = client.get("/applications/", headers=auth_headers(user_id)).json()["items"]
+    return {item["id"]: item["status"] for item in items}
+
+
+def test_other_users_and_missing_ids_are_not_found(client):
+    owner, other = uuid.uuid4(), uuid.uuid4()
+    mine = _create_application(client, owner)
+    theirs = _create_application(client, other)
+    missing = str(uuid.uuid4())
+
+    response = client.post(
+        "/applications/batch",
+        json={"ids": [mine, theirs, missing], "operation": "set_status", "status": "interview"},
+        headers=auth_headers(owner)
+    )
+    assert response.status_code == 200, response.text
+    result = response.json()
+    assert result["affected"] == [mine]
+    assert result["not_found"] == [theirs, missing]
+
+    assert _statuses(client, owner) == {mine: "interview"}
+    assert _statuses(client, other)[theirs] != "interview"
+
+
+def test_delete_removes_only_owned_rows_and_records_tombstones(client):
+    owner, other = uuid.uuid4(), uuid.uuid4()
+    mine = [_create_application(client, owner) for _ in range(2)]
+    theirs = _create_application(client, other)
+
+    response = client.post(
+        "/applications/batch",
+        json={"ids": mine + [theirs], "operation": "delete"},
+        headers=auth_headers(owner)
+    )
+    assert response.status_code == 200, response.text
+    assert sorted(response.json()["affected"]) == sorted(mine)
+    assert response.json()["not_found"] == [theirs]
+
+    assert _statuses(client, owner) == {}
+    assert theirs in _statuses(client, other)
+
+    since = "2000-01-01T00:00:00"
+    deleted = client.get("/sync", params={"since": since}, headers=auth_headers(owner)).json()["deleted"]
+    assert sorted(d["entity_id"] for d in deleted) == sorted(mine)
+    assert client.get("/sync", params={"since": since}, headers=auth_headers(other)).json()["deleted"] == []
+
+
+def test_relink_requires_an_owned_resume(client):
+    owner = uuid.uuid4()
+    mine = _create_application(client, owner)
+
+    response = client.post(
+        "/applications/batch",
+        json={"ids": [mine], "operation": "relink_resume", "resume_id": str(uuid.uuid4())},
+        headers=auth_headers(owner)
+    )
+    assert response.status_code == 404
+
+
+def test_missing_operation_value_is_rejected(client):
+    owner = uuid.uuid4()
+    mine = _create_application(client, owner)
+
+    response = client.post(
+        "/applications/batch",
+        json={"ids": [mine], "operation": "set_status"},
+        headers=auth_headers(owner)
+    )
+    assert response.status_code == 400
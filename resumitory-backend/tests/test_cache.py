@@ -0,0 +1,120 @@
+"""Response cache generations, and ETag revalidation across writes."""
+import asyncio
+import uuid
+from datetime import date
+
+import pytest
+
+from app import etag
+from app.applications import router as applications_router
+from app.cache import MemoryCache
+from app.resumes import router as resumes_router
+from app.rounds import router as rounds_router
+from tests.conftest import auth_headers
+
+
+@pytest.fixture
+def memory_cache(monkeypatch):
+    """Use one MemoryCache everywhere the app reads or invalidates the response cache."""
+    cache = MemoryCache(max_entries=100, ttl_seconds=60)
+    for module in (etag, applications_router, resumes_router, rounds_router):
+        monkeypatch.setattr(module, "response_cache", cache)
+    return cache
+
+
+def test_invalidate_drops_cached_values():
+    async def scenario():
+        cache = MemoryCache(max_entries=10, ttl_seconds=60)
+        user_id = uuid.uuid4()
+        _, generation = await cache.get(user_id, "page")
+        await cache.set(user_id, "page", "old", generation)
+        cached, _ = await cache.get(user_id, "page")
+        await cache.invalidate(user_id)
+        after, _ = await cache.get(user_id, "page")
+        return cached, after
+
+    assert asyncio.run(scenario()) == ("old", None)
+
+
+def test_value_read_before_a_write_is_not_stored_after_it():
+    async def scenario():
+        cache = MemoryCache(max_entries=10, ttl_seconds=60)
+        user_id = uuid.uuid4()
+        _, generation = await cache.get(user_id, "page")
+        # A write commits and invalidates while the page is being built
+        await cache.invalidate(user_id)
+        await cache.set(user_id, "page", "stale", generation)
+        value, _ = await cache.get(user_id, "page")
+        return value
+
+    assert asyncio.run(scenario()) is None
+
+
+def test_other_users_are_not_invalidated():
+    async def scenario():
+        cache = MemoryCache(max_entries=10, ttl_seconds=60)
+        owner, other = uuid.uuid4(), uuid.uuid4()
+        _, generation = await cache.get(other, "page")
+        await cache.set(other, "page", "kept", generation)
+        await cache.invalidate(owner)
+        value, _ = await cache.get(other, "page")
+        return value
+
+    assert asyncio.run(scenario()) == "kept"
+
+
+def _create_application(client, user_id, company="Acme"):
+    response = client.post(
+        "/applications/",
+        json={"company": company, "role": "Engineer", "date_applied": str(date(2024, 1, 1))},
+        headers=auth_headers(user_id)
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+@pytest.mark.parametrize("path", ["/applications/", "/resumes/"])
+def test_etag_revalidates_until_a_write(client, memory_cache, path):
+    user_id = uuid.uuid4()
+    _create_application(client, user_id)
+    headers = auth_headers(user_id)
+
+    first = client.get(path, headers=headers)
+    assert first.status_code == 200
+    tag = first.headers["ETag"]
+
+    repeat = client.get(path, headers={**headers, "If-None-Match": tag})
+    assert repeat.status_code == 304
+
+    _create_application(client, user_id, company="Globex")
+    if path == "/resumes/":
+        # Application writes don't change the resume collection
+        assert client.get(path, headers={**headers, "If-None-Match": tag}).status_code == 304
+        return
+    changed = client.get(path, headers={**headers, "If-None-Match": tag})
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != tag
+
+
+def test_cached_list_reflects_writes(client, memory_cache):
+    user_id = uuid.uuid4()
+    headers = auth_headers(user_id)
+    created = _create_application(client, user_id)
+    assert len(client.get("/applications/", headers=headers).json()["items"]) == 1
+
+    client.patch(f"/applications/{created['id']}", json={"company": "Renamed"}, headers=headers)
+    items = client.get("/applications/", headers=headers).json()["items"]
+    assert [item["company"] for item in items] == ["Renamed"]
+
+    client.delete(f"/applications/{created['id']}", headers=headers)
+    assert client.get("/applications/", headers=headers).json()["items"] == []
+
+
+def test_cached_stats_reflect_writes(client, memory_cache):
+    user_id = uuid.uuid4()
+    headers = auth_headers(user_id)
+    _create_application(client, user_id)
+    assert client.get("/applications/stats/summary", headers=headers).json()["total_applications"] == 1
+
+    _create_application(client, user_id, company="Globex")
+    assert client.get("/applications/stats/summary", headers=headers).json()["total_applications"] == 2
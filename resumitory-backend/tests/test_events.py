@@ -0,0 +1,67 @@
+"""Event broker startup and access log redaction."""
+import asyncio
+import json
+import logging
+import uuid
+
+from app.auth.dependencies import AccessTokenLogFilter
+from app.events.broker import EventBroker, MemoryBroker
+
+
+class FlakyTransportBroker(EventBroker):
+    """Transport that connects slowly and drops notices until connected."""
+
+    def __init__(self):
+        super().__init__()
+        self.connected = False
+
+    async def _check_transport(self):
+        await asyncio.sleep(0.01)
+        self.connected = True
+
+    async def _send(self, payload):
+        if not self.connected:
+            raise ConnectionError("not connected, notice dropped")
+        self._receive(payload)
+
+
+def test_start_waits_for_transport_so_first_notice_is_delivered():
+    async def scenario():
+        broker = FlakyTransportBroker()
+        user_id = uuid.uuid4()
+        await broker.start()
+        queue = await broker.subscribe(user_id)
+        await broker.publish(user_id, "application", "created", [user_id])
+        notice = json.loads(await asyncio.wait_for(queue.get(), 1))
+        await broker.stop()
+        return notice
+
+    notice = asyncio.run(scenario())
+    assert notice["action"] == "created"
+
+
+def test_publish_reaches_only_the_users_streams():
+    async def scenario():
+        broker = MemoryBroker()
+        owner, other = uuid.uuid4(), uuid.uuid4()
+        owner_queue = await broker.subscribe(owner)
+        other_queue = await broker.subscribe(other)
+        await broker.publish(owner, "resume", "deleted")
+        notice = json.loads(await asyncio.wait_for(owner_queue.get(), 1))
+        await asyncio.sleep(0)
+        await broker.stop()
+        return notice, other_queue.empty()
+
+    notice, other_empty = asyncio.run(scenario())
+    assert notice == {"entity": "resume", "action": "deleted", "ids": None}
+    assert other_empty
+
+
+def test_access_log_filter_redacts_stream_tokens():
+    record = logging.LogRecord(
+        "uvicorn.access", logging.INFO, __file__, 0, '%s - "%s %s HTTP/%s" %d',
+        ("127.0.0.1:5000", "GET", "/events?access_token=eyJ.secret.sig&x=1", "1.1", 200), None
+    )
+    assert AccessTokenLogFilter().filter(record)
+    assert "eyJ" not in record.getMessage()
+    assert "/events?access_token=[redacted]&x=1" in record.getMessage()
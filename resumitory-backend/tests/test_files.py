@@ -0,0 +1,31 @@
+"""Local storage backend file serving."""
+import pytest
+
+from app.resumes.backends import LocalStorageBackend
+
+
+@pytest.fixture
+def stored_file(tmp_path):
+    path = tmp_path / "resumes" / "user" / "abc.pdf"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"%PDF-1.4")
+    return tmp_path
+
+
+def test_accel_redirect_hands_the_file_to_nginx(stored_file):
+    backend = LocalStorageBackend(str(stored_file), "http://api", accel_redirect="/_storage/")
+
+    response = backend.response("user/abc.pdf")
+
+    assert response.headers["x-accel-redirect"] == "/_storage/resumes/user/abc.pdf"
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.body == b""
+
+
+def test_paths_outside_the_bucket_are_not_served(stored_file):
+    backend = LocalStorageBackend(str(stored_file), "http://api", accel_redirect="/_storage")
+
+    with pytest.raises(FileNotFoundError):
+        backend.response("../resumes/user/../../secret")
+    with pytest.raises(FileNotFoundError):
+        backend.response("user/missing.pdf")
@@ -0,0 +1,87 @@
+"""Bulk import: valid rows are inserted, bad rows are reported by number."""
+import csv
+import uuid
+
+from sqlmodel import func, select
+
+from app.applications.models import Application
+from tests.conftest import auth_headers
+
+HEADER = b"company,role,date_applied,status\n"
+
+
+def _import(client, user_id, content: bytes, filename="applications.csv", content_type="text/csv"):
+    return client.post(
+        "/applications/bulk",
+        files={"file": (filename, content, content_type)},
+        headers=auth_headers(user_id)
+    )
+
+
+def _count(session, user_id) -> int:
+    return session.exec(select(func.count()).select_from(Application).where(Application.user_id == user_id)).one()
+
+
+def test_invalid_rows_are_reported_and_valid_rows_inserted(client, db_session):
+    user_id = uuid.uuid4()
+    content = HEADER + (
+        b"Acme,Engineer,2024-01-01,applied\n"
+        b"Globex,Engineer,not-a-date,applied\n"
+        b"Initech,Engineer,2024-01-03,\n"
+    )
+
+    response = _import(client, user_id, content)
+
+    assert response.status_code == 201, response.text
+    body = response.json()
+    assert body["inserted"] == 2
+    assert [error["row"] for error in body["errors"]] == [2]
+    assert body["errors"][0]["error"].startswith("date_applied")
+    assert _count(db_session, user_id) == 2
+
+
+def test_non_utf8_row_is_a_row_error(client, db_session):
+    user_id = uuid.uuid4()
+    content = HEADER + b"Caf\xe9,Engineer,2024-01-01,applied\nAcme,Engineer,2024-01-02,offer\n"
+
+    body = _import(client, user_id, content).json()
+
+    assert body["inserted"] == 1
+    assert body["errors"] == [{"row": 1, "error": "Not valid UTF-8 text"}]
+
+
+def test_oversized_csv_field_is_a_row_error(client, db_session):
+    user_id = uuid.uuid4()
+    huge = b"x" * (csv.field_size_limit() + 1)
+    content = HEADER + b'"' + huge + b'",Engineer,2024-01-01,applied\nAcme,Engineer,2024-01-02,applied\n'
+
+    body = _import(client, user_id, content).json()
+
+    assert body["inserted"] == 1
+    assert body["errors"][0]["row"] == 1
+    assert body["errors"][0]["error"].startswith("Invalid CSV")
+
+
+def test_non_utf8_ndjson_line_is_a_row_error(client, db_session):
+    user_id = uuid.uuid4()
+    content = (
+        b'{"company": "Caf\xe9", "role": "Engineer", "date_applied": "2024-01-01"}\n'
+        b'{"company": "Acme", "role": "Engineer", "date_applied": "2024-01-02"}\n'
+        b'[1, 2]\n'
+    )
+
+    body = _import(client, user_id, content, filename="applications.ndjson", content_type="application/x-ndjson").json()
+
+    assert body["inserted"] == 1
+    assert body["errors"] == [
+        {"row": 1, "error": "Not valid UTF-8 text"},
+        {"row": 3, "error": "Expected a JSON object"}
+    ]
+
+
+def test_malformed_header_is_a_400(client):
+    huge = b"x" * (csv.field_size_limit() + 1)
+    response = _import(client, uuid.uuid4(), b'"' + huge + b'",role\n')
+
+    assert response.status_code == 400
+    assert response.json()["detail"].startswith("Invalid CSV header")
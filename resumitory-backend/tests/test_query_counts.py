@@ -0,0 +1,73 @@
+"""
+Regression tests: endpoints issue a fixed number of SQL statements.
+
+Each endpoint is called for a user with 1 application and for a user with
+50; the statement counts must match, so per-row lookups (N+1) fail here.
+"""
+import uuid
+from datetime import date, timedelta
+
+import pytest
+from sqlmodel import select
+
+from app.applications.models import Application
+from app.resumes.models import Resume
+from app.rounds.models import InterviewRound
+from tests.conftest import auth_headers
+
+
+def _seed_user(session, applications: int) -> uuid.UUID:
+    """Create a user with one resume and `applications` applications linked to it, each with a round."""
+    user_id = uuid.uuid4()
+    resume = Resume(user_id=user_id, name="SWE Resume", pdf_url="https://example.com/cv.pdf")
+    session.add(resume)
+    for i in range(applications):
+        application = Application(
+            user_id=user_id,
+            company=f"Company {i}",
+            role="Software Engineer",
+            date_applied=date(2024, 1, 1) + timedelta(days=i),
+            resume_id=resume.id
+        )
+        session.add(application)
+        session.add(InterviewRound(application_id=application.id, round_number=1, round_type="phone screen"))
+    session.commit()
+    return user_id
+
+
+def _statements(client, counter, user_id, path) -> int:
+    counter.reset()
+    response = client.get(path, headers=auth_headers(user_id))
+    assert response.status_code == 200, response.text
+    return counter.count
+
+
+def _first_application_id(session, user_id) -> uuid.UUID:
+    return session.exec(select(Application.id).where(Application.user_id == user_id)).first()
+
+
+@pytest.mark.parametrize("path", [
+    "/applications/",
+    "/applications/?include=rounds",
+    "/applications/?limit=100",
+    "/resumes/",
+    "/applications/stats/summary"
+])
+def test_list_statement_count_does_not_grow_with_rows(client, db_session, statement_counter, path):
+    few = _seed_user(db_session, 1)
+    many = _seed_user(db_session, 50)
+
+    assert _statements(client, statement_counter, few, path) == _statements(client, statement_counter, many, path)
+
+
+def test_detail_statement_count_does_not_grow_with_rows(client, db_session, statement_counter):
+    few = _seed_user(db_session, 1)
+    many = _seed_user(db_session, 50)
+
+    counts = [
+        _statements(client, statement_counter, user_id, f"/applications/{_first_application_id(db_session, user_id)}")
+        for user_id in (few, many)
+    ]
+    assert counts[0] == counts[1]
+    # Application with its resume name in one joined SELECT
+    assert counts[0] == 1
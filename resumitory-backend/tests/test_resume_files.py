@@ -0,0 +1,110 @@
+"""Content-addressed resume files: dedupe, clone and delete refcounts."""
+import asyncio
+import uuid
+
+from fastapi.testclient import TestClient
+from sqlmodel import select
+
+from app.resumes.cleanup import storage_cleanup
+from app.resumes.models import StorageDeletion, StorageObject
+from tests.conftest import auth_headers
+
+PDF = b"%PDF-1.4 resume"
+
+
+def _create(client, user_id, content=PDF):
+    response = client.post(
+        "/resumes/",
+        data={"name": "SWE Resume"},
+        files={"pdf_file": ("resume.pdf", content, "application/pdf")},
+        headers=auth_headers(user_id)
+    )
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+def _objects(session):
+    session.expire_all()
+    return {obj.path: obj.ref_count for obj in session.exec(select(StorageObject))}
+
+
+def _queued(session):
+    return session.exec(select(StorageDeletion.path)).all()
+
+
+def test_identical_uploads_share_one_file(client, db_session, storage):
+    user_id = uuid.uuid4()
+    first = _create(client, user_id)
+    second = _create(client, user_id)
+
+    assert first["pdf_url"] == second["pdf_url"]
+    assert list(_objects(db_session).values()) == [2]
+    assert len(list((storage.root / storage.bucket).rglob("*.pdf"))) == 1
+
+
+def test_clone_takes_a_reference(client, db_session, storage):
+    user_id = uuid.uuid4()
+    resume = _create(client, user_id)
+
+    response = client.post(f"/resumes/{resume['id']}/clone", headers=auth_headers(user_id))
+
+    assert response.status_code == 201
+    assert response.json()["pdf_url"] == resume["pdf_url"]
+    assert list(_objects(db_session).values()) == [2]
+
+
+def test_file_is_removed_only_with_its_last_reference(client, db_session, storage):
+    user_id = uuid.uuid4()
+    first = _create(client, user_id)
+    second = _create(client, user_id)
+    [path] = _objects(db_session)
+
+    client.delete(f"/resumes/{first['id']}", headers=auth_headers(user_id))
+    assert _objects(db_session) == {path: 1}
+    assert _queued(db_session) == []
+
+    client.delete(f"/resumes/{second['id']}", headers=auth_headers(user_id))
+    assert _objects(db_session) == {}
+    assert _queued(db_session) == [path]
+    assert storage.path_for(path).exists()
+
+    assert asyncio.run(storage_cleanup.drain()) == 1
+    assert _queued(db_session) == []
+    assert not storage.path_for(path).exists()
+
+
+def test_reupload_cancels_queued_removal(client, db_session, storage):
+    user_id = uuid.uuid4()
+    resume = _create(client, user_id)
+    client.delete(f"/resumes/{resume['id']}", headers=auth_headers(user_id))
+    [path] = _queued(db_session)
+
+    _create(client, user_id)
+
+    assert _queued(db_session) == []
+    assert asyncio.run(storage_cleanup.drain()) == 0
+    assert storage.path_for(path).exists()
+
+
+def test_failed_create_releases_its_references(client, db_session, storage, monkeypatch):
+    user_id = uuid.uuid4()
+
+    async def failing_upload(*args, **kwargs):
+        raise RuntimeError("storage down")
+
+    _create(client, user_id)
+    monkeypatch.setattr(storage, "upload", failing_upload)
+    response = TestClient(client.app, raise_server_exceptions=False).post(
+        "/resumes/",
+        data={"name": "With tex"},
+        files={
+            "pdf_file": ("resume.pdf", PDF, "application/pdf"),
+            "tex_file": ("resume.tex", b"\\documentclass{article}", "application/x-tex")
+        },
+        headers=auth_headers(user_id)
+    )
+
+    assert response.status_code == 500
+    # The PDF reference taken before the .tex upload failed is dropped again
+    assert list(_objects(db_session).values()) == [1]
+
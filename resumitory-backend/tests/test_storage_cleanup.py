@@ -0,0 +1,90 @@
+"""Storage deletion outbox: leases, retries and files that are referenced again."""
+import asyncio
+import uuid
+from datetime import datetime, timedelta
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.resumes.cleanup import CLEANUP_LEASE_SECONDS, backoff_seconds, claim_batch, storage_cleanup
+from app.resumes.models import StorageDeletion, StorageObject
+
+
+def _queue(session, storage, *paths):
+    for path in paths:
+        file_path = storage.path_for(path)
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(b"%PDF-1.4")
+        session.add(StorageDeletion(path=path))
+    session.commit()
+
+
+def _rows(session):
+    session.expire_all()
+    return {row.path: row for row in session.exec(select(StorageDeletion))}
+
+
+def test_claimed_rows_are_leased(database, db_session, storage):
+    _queue(db_session, storage, "u/a.pdf", "u/b.pdf")
+
+    async def claim_twice():
+        async with AsyncSession(database[1], expire_on_commit=False) as session:
+            first = await claim_batch(session, 10)
+            await session.commit()
+            second = await claim_batch(session, 10)
+            await session.commit()
+            return first, second
+
+    started = datetime.utcnow()
+    first, second = asyncio.run(claim_twice())
+
+    assert sorted(row.path for row in first) == ["u/a.pdf", "u/b.pdf"]
+    assert second == []
+    for row in _rows(db_session).values():
+        assert row.attempts == 1
+        assert row.next_attempt_at >= started + timedelta(seconds=CLEANUP_LEASE_SECONDS - 1)
+
+
+def test_failed_batch_is_kept_and_retried_with_backoff(db_session, storage, monkeypatch):
+    _queue(db_session, storage, "u/a.pdf")
+
+    async def failing_delete(paths):
+        raise RuntimeError("storage unavailable")
+
+    monkeypatch.setattr(storage, "delete", failing_delete)
+    started = datetime.utcnow()
+    assert asyncio.run(storage_cleanup.drain()) == 0
+
+    row = _rows(db_session)["u/a.pdf"]
+    assert row.attempts == 1
+    assert row.last_error == "storage unavailable"
+    assert row.next_attempt_at >= started + timedelta(seconds=backoff_seconds(1) - 1)
+    assert storage.path_for("u/a.pdf").exists()
+
+    # Not due until the backoff passes; then the next drain removes it
+    assert asyncio.run(storage_cleanup.drain()) == 0
+    monkeypatch.delattr(storage, "delete")
+    row.next_attempt_at = datetime.utcnow() - timedelta(seconds=1)
+    db_session.add(row)
+    db_session.commit()
+    assert asyncio.run(storage_cleanup.drain()) == 1
+    assert _rows(db_session) == {}
+    assert not storage.path_for("u/a.pdf").exists()
+
+
+def test_referenced_file_is_skipped(db_session, storage):
+    _queue(db_session, storage, "u/a.pdf", "u/b.pdf")
+    # Uploaded again after it was orphaned
+    db_session.add(StorageObject(path="u/a.pdf", user_id=uuid.uuid4(), sha256="a" * 64, size_bytes=8))
+    db_session.commit()
+
+    assert asyncio.run(storage_cleanup.drain()) == 1
+
+    assert _rows(db_session) == {}
+    assert storage.path_for("u/a.pdf").exists()
+    assert not storage.path_for("u/b.pdf").exists()
+
+
+def test_backoff_grows_and_is_capped():
+    assert [backoff_seconds(attempt) for attempt in (1, 2, 3)] == [10, 20, 40]
+    assert backoff_seconds(50) == 3600
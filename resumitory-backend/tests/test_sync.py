@@ -0,0 +1,78 @@
+"""Delta sync: watermarks, tombstones and paging."""
+import uuid
+from datetime import date, datetime, timedelta
+
+from app.applications.models import Application
+from app.resumes.models import Resume
+from tests.conftest import auth_headers
+
+
+def _seed(session, user_id, applications: int) -> None:
+    session.add(Resume(user_id=user_id, name="SWE Resume", pdf_url="https://example.com/cv.pdf"))
+    session.add_all(
+        Application(
+            user_id=user_id,
+            company=f"Company {i}",
+            role="Software Engineer",
+            date_applied=date(2024, 1, 1) + timedelta(days=i)
+        )
+        for i in range(applications)
+    )
+    session.commit()
+
+
+def _sync_all(client, user_id, **params):
+    """Follow next_cursor to the last page; returns (pages, merged body)."""
+    pages = []
+    body = client.get("/sync", params=params, headers=auth_headers(user_id)).json()
+    pages.append(body)
+    while body["next_cursor"]:
+        body = client.get(
+            "/sync", params={"cursor": body["next_cursor"], "limit": params.get("limit", 500)},
+            headers=auth_headers(user_id)
+        ).json()
+        pages.append(body)
+    merged = {key: [item for page in pages for item in page[key]] for key in ("resumes", "applications", "deleted")}
+    return pages, merged
+
+
+def test_full_sync_pages_through_every_record(client, db_session):
+    user_id = uuid.uuid4()
+    _seed(db_session, user_id, 7)
+    _seed(db_session, uuid.uuid4(), 3)
+
+    pages, merged = _sync_all(client, user_id, limit=3)
+
+    assert len(pages) == 3
+    assert len(merged["resumes"]) == 1
+    assert len({item["id"] for item in merged["applications"]}) == 7
+    # Every page carries the watermark of the first one
+    assert len({page["watermark"] for page in pages}) == 1
+    assert pages[-1]["next_cursor"] is None
+
+
+def test_delta_sync_reports_deletes_as_tombstones(client, db_session):
+    user_id = uuid.uuid4()
+    _seed(db_session, user_id, 2)
+    _, first = _sync_all(client, user_id)
+    application_id = first["applications"][0]["id"]
+    since = (datetime.utcnow() - timedelta(minutes=1)).isoformat()
+
+    response = client.delete(f"/applications/{application_id}", headers=auth_headers(user_id))
+    assert response.status_code == 204
+
+    _, delta = _sync_all(client, user_id, since=since)
+    assert [(item["entity"], item["entity_id"]) for item in delta["deleted"]] == [("application", application_id)]
+    assert application_id not in {item["id"] for item in delta["applications"]}
+
+
+def test_watermark_trails_server_clock(client, db_session):
+    user_id = uuid.uuid4()
+    before = datetime.utcnow()
+    body = client.get("/sync", headers=auth_headers(user_id)).json()
+    assert datetime.fromisoformat(body["watermark"]) < before
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get("/sync", params={"cursor": "not-a-cursor"}, headers=auth_headers(uuid.uuid4()))
+    assert response.status_code == 400
@@ -0,0 +1,29 @@
+import { api } from './api';
+
+// Largest page size the list endpoints accept (MAX_PAGE_SIZE in the API)
+const PAGE_SIZE = 100;
+
+interface Page<T> {
+  items: T[];
+  next_cursor: string | null;
+}
+
+/**
+ * Fetch every item of a paginated list endpoint by following next_cursor.
+ */
+export async function fetchAllPages<T>(path: string, params: URLSearchParams = new URLSearchParams()): Promise<T[]> {
+  const items: T[] = [];
+  let cursor: string | null = null;
+
+  do {
+    const query = new URLSearchParams(params);
+    query.set('limit', String(PAGE_SIZE));
+    if (cursor) query.set('cursor', cursor);
+
+    const { data }: { data: Page<T> } = await api.get(`${path}?${query.toString()}`);
+    items.push(...data.items);
+    cursor = data.next_cursor;
+  } while (cursor);
+
+  return items;
+}
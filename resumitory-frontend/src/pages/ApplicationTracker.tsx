@@ -1,6 +1,7 @@
 import { useState, useMemo } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '../lib/api';
+import { fetchAllPages } from '../lib/pagination';
 import { useNavigate } from 'react-router-dom';
 
 interface Resume {
@@ -49,8 +50,7 @@ export default function ApplicationTracker() {
       if (searchQuery) params.append('search', searchQuery);
       if (statusFilter !== 'all') params.append('status', statusFilter);
       
-      const { data } = await api.get(`/applications/?${params.toString()}`);
-      return data;
+      return fetchAllPages<Application>('/applications/', params);
     },
   });
 
@@ -58,8 +58,7 @@ export default function ApplicationTracker() {
   const { data: resumes } = useQuery<Resume[]>({
     queryKey: ['resumes'],
     queryFn: async () => {
-      const { data } = await api.get('/resumes/');
-      return data;
+      return fetchAllPages<Resume>('/resumes/');
     },
   });
 
@@ -3,6 +3,7 @@ import { supabase } from '../lib/supabase';
 import { useNavigate } from 'react-router-dom';
 import { useQuery } from '@tanstack/react-query';
 import { api } from '../lib/api';
+import { fetchAllPages } from '../lib/pagination';
 
 interface Stats {
   total_applications: number;
@@ -28,8 +29,7 @@ export default function Dashboard() {
   const { data: resumes, isLoading: resumesLoading } = useQuery<Array<{ id: string }>>({
     queryKey: ['resumes'],
     queryFn: async () => {
-      const { data } = await api.get('/resumes/');
-      return data;
+      return fetchAllPages<{ id: string }>('/resumes/');
     },
   });
 
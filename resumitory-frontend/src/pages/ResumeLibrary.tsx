@@ -1,6 +1,7 @@
 import { useState } from 'react';
 import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
 import { api } from '../lib/api';
+import { fetchAllPages } from '../lib/pagination';
 import { useNavigate } from 'react-router-dom';
 
 interface Resume {
@@ -23,8 +24,7 @@ export default function ResumeLibrary() {
   const { data: resumes, isLoading } = useQuery<Resume[]>({
     queryKey: ['resumes'],
     queryFn: async () => {
-      const { data } = await api.get('/resumes/');
-      return data;
+      return fetchAllPages<Resume>('/resumes/');
     },
   });
 